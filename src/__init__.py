@@ -3,5 +3,6 @@ from .config import Config
 from .database import init_db, Base, SessionLocal, engine
 from .models import Job, Application
 from .browser import Browser
+from .browser_pool import BrowserPool, get_browser_pool
 from .ai_service import AIService
 from .job_bot import JobBot
\ No newline at end of file
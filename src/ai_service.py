@@ -1,29 +1,161 @@
+from .cache_store import CacheStore
 from .config import Config
-from openai import OpenAI
+from openai import AsyncOpenAI
+import asyncio
+import hashlib
+import httpx
 import logging
-from typing import Optional
+import threading
+import time
+from typing import Any, Awaitable, Callable, Coroutine, List, Optional, Tuple
+
+MODEL = "gpt-4"
+# Bump when a prompt changes so answers produced by the old prompt are no longer reused
+PROMPT_VERSION = 1
+
+
+class AIRuntime:
+    """Event loop thread that owns the shared OpenAI client.
+
+    AsyncOpenAI clients and asyncio semaphores are bound to the loop they
+    first run on, so every request of the process runs on this one loop.
+    That lets all callers share one pooled HTTP connection set and one
+    concurrency limit.
+    """
+
+    def __init__(self) -> None:
+        self.logger = logging.getLogger(__name__)
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(target=self.loop.run_forever, name="ai-service-loop", daemon=True)
+        self.thread.start()
+        self.client, self.semaphore = asyncio.run_coroutine_threadsafe(self._setup(), self.loop).result()
+
+    async def _setup(self) -> Tuple[AsyncOpenAI, asyncio.Semaphore]:
+        http_client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=Config.AI_MAX_CONNECTIONS,
+                max_keepalive_connections=Config.AI_KEEPALIVE_CONNECTIONS
+            ),
+            timeout=httpx.Timeout(Config.AI_REQUEST_TIMEOUT, connect=10.0)
+        )
+        client = AsyncOpenAI(
+            api_key=Config.OPENAI_API_KEY,
+            http_client=http_client,
+            max_retries=Config.AI_MAX_RETRIES
+        )
+        return client, asyncio.Semaphore(max(1, Config.AI_MAX_CONCURRENCY))
+
+    def run(self, coro: Coroutine) -> Any:
+        """Run a coroutine on the runtime loop and block until it finishes."""
+        if threading.current_thread() is self.thread:
+            raise RuntimeError("AIRuntime.run would deadlock on the runtime loop; await the coroutine instead")
+        return asyncio.run_coroutine_threadsafe(coro, self.loop).result()
+
+
+_default_runtime: Optional[AIRuntime] = None
+_default_runtime_lock = threading.Lock()
+
+
+def get_ai_runtime() -> AIRuntime:
+    """Return the process-wide AI runtime, starting it on first use."""
+    global _default_runtime
+    with _default_runtime_lock:
+        if _default_runtime is None:
+            _default_runtime = AIRuntime()
+        return _default_runtime
+
+
+_resume_cache: Optional[CacheStore] = None
+_resume_cache_lock = threading.Lock()
+
+
+def get_resume_cache() -> Optional[CacheStore]:
+    """Return the process-wide customized resume cache, or None when it is disabled."""
+    global _resume_cache
+    if not Config.RESUME_CACHE_ENABLED:
+        return None
+    with _resume_cache_lock:
+        if _resume_cache is None:
+            _resume_cache = CacheStore('customized_resumes', max_bytes=Config.RESUME_CACHE_MAX_BYTES)
+        return _resume_cache
+
+
+def resume_cache_key(resume_text: str, job_description: str) -> str:
+    """Content address of one customize_resume request."""
+    digest = hashlib.sha256()
+    for part in (MODEL, str(PROMPT_VERSION),
+                 hashlib.sha256(resume_text.encode('utf-8')).hexdigest(),
+                 hashlib.sha256(job_description.encode('utf-8')).hexdigest()):
+        digest.update(part.encode('utf-8'))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
 
 class AIService:
-    """Service for AI-powered operations like resume customization and question answering"""
-    
-    def __init__(self):
-        self.client = OpenAI(api_key=Config.OPENAI_API_KEY)
+    """Service for AI-powered operations like resume customization and question answering
+
+    The coroutines can be awaited from any event loop; requests always run on
+    the shared runtime loop, at most AI_MAX_CONCURRENCY at a time. Synchronous
+    code calls run(), e.g. run(answer_questions_many(...)).
+    """
+
+    def __init__(self, runtime: Optional[AIRuntime] = None, resume_cache: Optional[CacheStore] = None):
+        self.runtime = runtime or get_ai_runtime()
+        self.client = self.runtime.client
+        self.resume_cache = resume_cache if resume_cache is not None else get_resume_cache()
         self.logger = logging.getLogger(__name__)
 
+    def run(self, coro: Coroutine) -> Any:
+        """Block until a coroutine of this service has finished; for synchronous callers."""
+        return self.runtime.run(coro)
+
+    async def _on_runtime(self, call: Callable[..., Awaitable], *args) -> Any:
+        """Await call(*args) on the runtime loop, whichever loop the caller is on."""
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is self.runtime.loop:
+            return await call(*args)
+        return await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(call(*args), self.runtime.loop))
+
+    async def _complete(self, messages: List[dict]) -> str:
+        """One chat completion, waiting for a free concurrency slot first."""
+        async with self.runtime.semaphore:
+            response = await self.client.chat.completions.create(model=MODEL, messages=messages)
+        return response.choices[0].message.content
+
     async def customize_resume(self, resume_text: str, job_description: str) -> str:
-        """Customize resume based on job description"""
+        """Customize resume based on job description; identical requests are served from the cache"""
+        key = resume_cache_key(resume_text, job_description) if self.resume_cache else None
+        if key:
+            cached = self.resume_cache.get(key)
+            if cached is not None:
+                return cached
         try:
-            response = await self.client.chat.completions.create(
-                model="gpt-4",
-                messages=[
-                    {"role": "system", "content": "You are a professional resume writer."},
-                    {"role": "user", "content": f"Customize this resume for the job:\n\nResume:\n{resume_text}\n\nJob Description:\n{job_description}"}
-                ]
-            )
-            return response.choices[0].message.content
+            customized = await self._on_runtime(self._complete, [
+                {"role": "system", "content": "You are a professional resume writer."},
+                {"role": "user", "content": f"Customize this resume for the job:\n\nResume:\n{resume_text}\n\nJob Description:\n{job_description}"}
+            ])
         except Exception as e:
             self.logger.error(f"Error customizing resume: {str(e)}")
             return resume_text
+        if key and customized:
+            self.resume_cache.put(key, customized)
+        return customized
+
+    def log_cache_summary(self) -> None:
+        """Log how many customize_resume calls the cache answered."""
+        if not self.resume_cache:
+            return
+        stats = self.resume_cache.stats()
+        if stats['hits'] + stats['misses']:
+            self.logger.info(
+                f"Resume cache: {stats['hits']} hits, {stats['misses']} misses "
+                f"({stats['hit_rate'] * 100:.0f}%), {stats['entries']} entries, "
+                f"{stats['bytes'] / 1024:.0f} KiB stored, {stats['bytes_served'] / 1024:.0f} KiB served, "
+                f"{stats['evictions']} evicted"
+            )
 
     async def answer_question(self, question: str, context: Optional[str] = None) -> str:
         """Generate an answer for a job application question"""
@@ -31,15 +163,30 @@ class AIService:
             prompt = f"Question: {question}\n"
             if context:
                 prompt += f"Context: {context}\n"
-            
-            response = await self.client.chat.completions.create(
-                model="gpt-4",
-                messages=[
-                    {"role": "system", "content": "You are a professional job applicant."},
-                    {"role": "user", "content": prompt}
-                ]
-            )
-            return response.choices[0].message.content
+
+            return await self._on_runtime(self._complete, [
+                {"role": "system", "content": "You are a professional job applicant."},
+                {"role": "user", "content": prompt}
+            ])
         except Exception as e:
             self.logger.error(f"Error answering question: {str(e)}")
             return ""
+
+    async def answer_questions_many(self, questions: List[str], context: Optional[str] = None) -> List[str]:
+        """Answer several questions concurrently; answers come back in question order"""
+        return list(await asyncio.gather(*(self.answer_question(question, context) for question in questions)))
+
+    async def answer_questions_timed(self, questions: List[str], context: Optional[str] = None) -> List[Tuple[str, float]]:
+        """Like answer_questions_many, paired with the seconds each answer took"""
+        async def timed(question: str) -> Tuple[str, float]:
+            start = time.monotonic()
+            answer = await self.answer_question(question, context)
+            return answer, time.monotonic() - start
+
+        return list(await asyncio.gather(*(timed(question) for question in questions)))
+
+    async def customize_many(self, pairs: List[Tuple[str, str]]) -> List[str]:
+        """Customize resumes for several (resume_text, job_description) pairs concurrently, in order"""
+        return list(await asyncio.gather(*(
+            self.customize_resume(resume_text, job_description) for resume_text, job_description in pairs
+        )))
@@ -0,0 +1,318 @@
+import hashlib
+import logging
+import random
+import re
+import threading
+from collections import defaultdict
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Tuple
+
+from .cache_store import CacheStore
+from .config import Config
+
+if TYPE_CHECKING:
+    from .ai_service import AIService
+
+SHINGLE_SIZE = 3
+NUM_PERMUTATIONS = 64
+LSH_BANDS = 16  # rows per band = NUM_PERMUTATIONS // LSH_BANDS
+
+_MERSENNE_PRIME = (1 << 61) - 1
+# Fixed seed: signatures stored in the cache must stay comparable across runs
+_rng = random.Random(0x5EED)
+_PERMUTATIONS = [
+    (_rng.randrange(1, _MERSENNE_PRIME), _rng.randrange(0, _MERSENNE_PRIME))
+    for _ in range(NUM_PERMUTATIONS)
+]
+
+# Words that rarely change what a question asks
+_STOPWORDS = {'a', 'an', 'the', 'please', 'kindly', 'your', 'you', 'do', 'have', 'of', 'in', 'with', 'for', 'to'}
+
+# Negations and qualifiers flip or shift the answer while barely changing the string
+QUALIFIERS = {
+    'not', 'no', 'never', 'non', 'without',
+    'min', 'minimum', 'max', 'maximum', 'least', 'most',
+    'current', 'currently', 'expected', 'desired', 'previous', 'former', 'future',
+}
+# The word after these names the subject of the question ("experience with <python>")
+SUBJECT_MARKERS = {'with', 'in', 'using'}
+_SUBJECT_SKIP = {'a', 'an', 'the', 'your', 'our', 'this', 'any'}
+
+
+def normalize_question(text: str) -> str:
+    """Lower-case the question and strip punctuation and extra whitespace."""
+    text = re.sub(r"[^\w\s+#]", " ", text.lower())
+    return " ".join(word for word in text.split() if word not in _STOPWORDS)
+
+
+def salient_terms(text: str) -> List[str]:
+    """Terms a near-duplicate must share exactly.
+
+    "Years of experience with Python?" and "... with Java?" are almost the
+    same string but need different answers. So are "minimum" and "maximum"
+    salary, or "willing" and "not willing" to relocate. Compared exactly
+    are: capitalised words after the first one, numbers, terms like C++ or
+    C#, negations and qualifiers, and the word each "with"/"in"/"using"
+    points at.
+    """
+    words = re.findall(r"[A-Za-z0-9+#.]*[A-Za-z0-9+#]", text)
+    lowered = [word.lower() for word in words]
+    terms = {
+        word.lower() for word in words[1:]
+        if word[0].isupper() or any(c.isdigit() or c in '+#' for c in word)
+    }
+    terms.update(word for word in lowered if word in QUALIFIERS)
+    for index, word in enumerate(lowered):
+        if word in SUBJECT_MARKERS:
+            subject = next((w for w in lowered[index + 1:] if w not in _SUBJECT_SKIP), None)
+            if subject:
+                terms.add(subject)
+    return sorted(terms)
+
+
+def shingles(normalized: str, size: int = SHINGLE_SIZE) -> Set[str]:
+    """Character shingles of a normalized question."""
+    if len(normalized) <= size:
+        return {normalized}
+    return {normalized[i:i + size] for i in range(len(normalized) - size + 1)}
+
+
+def minhash(items: Set[str]) -> List[int]:
+    """MinHash signature of a shingle set."""
+    hashes = [
+        int.from_bytes(hashlib.blake2b(item.encode('utf-8'), digest_size=8).digest(), 'big') % _MERSENNE_PRIME
+        for item in items
+    ]
+    return [min((a * h + b) % _MERSENNE_PRIME for h in hashes) for a, b in _PERMUTATIONS]
+
+
+def lsh_buckets(signature: List[int]) -> List[str]:
+    """Band keys of a signature; questions sharing any band are compared."""
+    rows = NUM_PERMUTATIONS // LSH_BANDS
+    return [
+        f"{band}:" + hashlib.blake2b(
+            repr(signature[band * rows:(band + 1) * rows]).encode('utf-8'), digest_size=8
+        ).hexdigest()
+        for band in range(LSH_BANDS)
+    ]
+
+
+def jaccard(first: Set[str], second: Set[str]) -> float:
+    if not first and not second:
+        return 1.0
+    return len(first & second) / len(first | second)
+
+
+class AnswerCache:
+    """Stores screening-question answers per applicant and finds them for re-worded questions.
+
+    An exact lookup on the normalized question comes first. Otherwise the
+    MinHash LSH index proposes candidates, and the most similar one whose
+    shingle Jaccard similarity reaches the threshold (and whose salient
+    terms match exactly) is reused. Entries live in a CacheStore, so they
+    persist across runs and are evicted by LRU and TTL.
+    """
+
+    def __init__(
+        self,
+        store: Optional[CacheStore] = None,
+        threshold: float = Config.SCREENING_CACHE_SIMILARITY
+    ) -> None:
+        self.store = store if store is not None else CacheStore(
+            'screening_answers',
+            max_entries=Config.SCREENING_CACHE_MAX_ENTRIES,
+            ttl=Config.SCREENING_CACHE_TTL
+        )
+        self.threshold = threshold
+        self.logger = logging.getLogger(__name__)
+        self._lock = threading.Lock()
+        # scope -> band key -> entry keys; built from the store the first time a scope is used
+        self._index: Dict[str, Dict[str, Set[str]]] = {}
+        self.exact_hits = 0
+        self.near_hits = 0
+        self.misses = 0
+        self.ai_calls = 0
+        self.ai_seconds = 0.0
+
+    @staticmethod
+    def scope(applicant: str, context: Optional[str] = None) -> str:
+        """Cache partition of one applicant; changing their background starts a new one."""
+        return hashlib.sha256(f"{applicant}\n{context or ''}".encode('utf-8')).hexdigest()[:24]
+
+    @staticmethod
+    def _key(scope: str, normalized: str) -> str:
+        return hashlib.sha256(f"{scope}\n{normalized}".encode('utf-8')).hexdigest()
+
+    def lookup(self, scope: str, question: str) -> Optional[str]:
+        """Cached answer to question (or a near-duplicate of it) for this scope."""
+        normalized = normalize_question(question)
+        entry = self.store.get(self._key(scope, normalized))
+        if entry is not None:
+            with self._lock:
+                self.exact_hits += 1
+            return entry['answer']
+
+        match = self._nearest(scope, normalized, salient_terms(question))
+        with self._lock:
+            if match is None:
+                self.misses += 1
+                return None
+            self.near_hits += 1
+        self.logger.debug(f"Reusing answer to {match['question']!r} for {question!r}")
+        return match['answer']
+
+    def store_answer(self, scope: str, question: str, answer: str) -> None:
+        """Remember an answer for later lookups."""
+        if not answer:
+            return
+        normalized = normalize_question(question)
+        key = self._key(scope, normalized)
+        signature = minhash(shingles(normalized))
+        self.store.put(key, {
+            'scope': scope,
+            'question': question,
+            'normalized': normalized,
+            'salient': salient_terms(question),
+            'signature': signature,
+            'answer': answer,
+        })
+        with self._lock:
+            index = self._index.get(scope)
+            if index is not None:
+                for bucket in lsh_buckets(signature):
+                    index[bucket].add(key)
+
+    def record_ai_call(self, seconds: float) -> None:
+        """Count one answer that had to come from the model."""
+        with self._lock:
+            self.ai_calls += 1
+            self.ai_seconds += seconds
+
+    def _scope_index(self, scope: str) -> Dict[str, Set[str]]:
+        with self._lock:
+            index = self._index.get(scope)
+        if index is not None:
+            return index
+        index = defaultdict(set)
+        for key, entry in self.store.items():
+            if entry.get('scope') == scope:
+                for bucket in lsh_buckets(entry['signature']):
+                    index[bucket].add(key)
+        with self._lock:
+            return self._index.setdefault(scope, index)
+
+    def _nearest(self, scope: str, normalized: str, salient: List[str]) -> Optional[Dict[str, Any]]:
+        """Most similar stored question of the scope above the threshold."""
+        wanted = shingles(normalized)
+        buckets = lsh_buckets(minhash(wanted))
+        index = self._scope_index(scope)
+        with self._lock:
+            candidates = set().union(*(index.get(bucket, ()) for bucket in buckets))
+
+        best: Tuple[float, Optional[str]] = (0.0, None)
+        for key in candidates:
+            entry = self.store.peek(key)
+            if entry is None:
+                # Evicted since the index was built
+                with self._lock:
+                    for keys in index.values():
+                        keys.discard(key)
+                continue
+            if entry['salient'] != salient:
+                continue
+            similarity = jaccard(wanted, shingles(entry['normalized']))
+            if similarity >= self.threshold and similarity > best[0]:
+                best = (similarity, key)
+        if best[1] is None:
+            return None
+        return self.store.get(best[1])
+
+    def summary(self) -> Dict[str, Any]:
+        """Hit rate and the model calls and time it saved."""
+        with self._lock:
+            hits = self.exact_hits + self.near_hits
+            lookups = hits + self.misses
+            average = self.ai_seconds / self.ai_calls if self.ai_calls else 0.0
+            return {
+                'lookups': lookups,
+                'exact_hits': self.exact_hits,
+                'near_hits': self.near_hits,
+                'misses': self.misses,
+                'hit_rate': hits / lookups if lookups else 0.0,
+                'ai_calls': self.ai_calls,
+                'ai_calls_saved': hits,
+                'avg_ai_seconds': average,
+                'est_seconds_saved': hits * average,
+            }
+
+    def log_summary(self) -> None:
+        s = self.summary()
+        if not s['lookups']:
+            return
+        self.logger.info(
+            f"Screening answers: {s['lookups']} questions, {s['hit_rate'] * 100:.0f}% from cache "
+            f"({s['exact_hits']} exact, {s['near_hits']} near-duplicate), "
+            f"{s['ai_calls']} AI calls made, {s['ai_calls_saved']} saved "
+            f"(~{s['est_seconds_saved']:.0f}s at {s['avg_ai_seconds']:.1f}s per call)"
+        )
+
+
+def screening_prompt(label: str, options: Optional[List[str]] = None) -> str:
+    """Text a screening question is asked and cached under."""
+    return label + (f" (choose one of: {', '.join(options)})" if options else "")
+
+
+class ScreeningAnswerer:
+    """Answers screening prompts from the answer cache first, the rest with concurrent AI calls.
+
+    Answers are cached under the applicant and their stable background
+    (context), so they carry over between jobs. The model may be given a
+    richer, job-specific ai_context, e.g. the resume tailored to the job.
+    """
+
+    def __init__(
+        self,
+        ai_service: 'AIService',
+        applicant: str,
+        context: Optional[str] = None,
+        ai_context: Optional[str] = None,
+        cache: Optional[AnswerCache] = None
+    ) -> None:
+        self.ai_service = ai_service
+        self.cache = cache if cache is not None else get_answer_cache()
+        self.scope = AnswerCache.scope(applicant, context) if self.cache else None
+        self.ai_context = ai_context or context
+        self.logger = logging.getLogger(__name__)
+
+    def answer(self, prompts: List[str]) -> List[Optional[str]]:
+        """Answers in prompt order; new AI answers are stored for later lookups."""
+        answers = [self.cache.lookup(self.scope, prompt) if self.cache else None for prompt in prompts]
+        missing = [i for i, answer in enumerate(answers) if answer is None]
+        if not missing:
+            return answers
+
+        self.logger.info(f"Answering {len(missing)} of {len(prompts)} screening questions with AI")
+        results = self.ai_service.run(self.ai_service.answer_questions_timed(
+            [prompts[i] for i in missing], self.ai_context
+        ))
+        for i, (result, elapsed) in zip(missing, results):
+            answers[i] = result
+            if self.cache:
+                self.cache.record_ai_call(elapsed)
+                if result:
+                    self.cache.store_answer(self.scope, prompts[i], result)
+        return answers
+
+
+_default_cache: Optional[AnswerCache] = None
+_default_cache_lock = threading.Lock()
+
+
+def get_answer_cache() -> Optional[AnswerCache]:
+    """Return the process-wide screening answer cache, or None when it is disabled."""
+    global _default_cache
+    if not Config.SCREENING_CACHE_ENABLED:
+        return None
+    with _default_cache_lock:
+        if _default_cache is None:
+            _default_cache = AnswerCache()
+        return _default_cache
@@ -5,7 +5,7 @@ from selenium.common.exceptions import ElementClickInterceptedException, NoSuchE
 import logging
 import time
 import random
-from typing import Optional, Generator, List
+from typing import Optional, Generator, List, Dict, Tuple, Callable
 import undetected_chromedriver as uc
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.common.by import By
@@ -20,6 +20,24 @@ from datetime import datetime, timedelta
 from selenium.common.exceptions import NoSuchElementException
 import openai
 
+from .readiness import SCROLL_AND_COUNT_SCRIPT, PageReadiness, script_timeout
+from .resource_policy import PageWeightMeter, ResourcePolicy
+from .process_metrics import tree_memory
+from .memory_watchdog import MemoryWatchdog
+from .instrumentation import DriverStats, instrumented
+from .replay import PageRecorder
+from .config import Config
+from .extraction import (
+    BULK_EXTRACT_SCRIPT, EASY_APPLY_DETAIL_FIELDS, JOB_DETAIL_FIELDS, PAGE_SNAPSHOT_SCRIPT,
+    SEARCH_RESULT_CARD_FIELDS, SEARCH_RESULT_CARD_SELECTOR, HtmlExtractor, compile_fields
+)
+from .detail_fetcher import DetailFetcher
+from .card_filter import CardFilter, parse_posted_age
+from .seen_jobs import KnownJobs
+from .easy_apply import EASY_APPLY_MODAL_SELECTOR, FormFiller, inspect_modal_step
+from .session_manager import SessionManager
+from .job_record import JobRecord
+
 # Configure logging
 logs_dir = Path("logs")
 logs_dir.mkdir(exist_ok=True)  # Ensure the logs directory exists
@@ -42,10 +60,35 @@ class Browser:
     
     _instances: List['Browser'] = []
     
-    def __init__(self) -> None:
-        """Initialize browser with proper logging and error handling."""
+    def __init__(self, driver=None) -> None:
+        """Initialize browser with proper logging and error handling.
+
+        A pre-built driver (e.g. a ReplayDriver) can be passed instead of launching Chrome.
+        """
         self.logger = logging.getLogger(__name__)
         self.driver: Optional[uc.Chrome] = None
+        self._provided_driver = driver
+        self.pages_loaded = 0
+        self.created_at = time.monotonic()
+        self.last_used = self.created_at
+        self.extraction_mode = Config.EXTRACTION_MODE
+        self._html_extractor: Optional[HtmlExtractor] = None
+        self.resource_policy = ResourcePolicy.from_config()
+        self._active_policy: Optional[ResourcePolicy] = None
+        self.page_weight = PageWeightMeter()
+        # Chrome's performance log costs every page a stream of CDP events; only record
+        # it for the Easy Apply network-idle waits or page weight reports
+        self.network_events = Config.AUTO_APPLY or Config.PAGE_WEIGHT_REPORTS
+        self.detail_fetcher = DetailFetcher(self)
+        self.watchdog = MemoryWatchdog(self)
+        self.stats = DriverStats()
+        self.recorder: Optional[PageRecorder] = (
+            PageRecorder(Path(Config.RECORD_FIXTURES_DIR)) if Config.RECORD_FIXTURES_DIR else None
+        )
+        self.url_rewriter: Optional[Callable[[str], str]] = None
+        self.card_filter = CardFilter(known_ids=KnownJobs())
+        self.session_user: Optional[str] = None
+        self.session_validated_at = 0.0
         self._setup_instance()
 
     def _setup_instance(self) -> None:
@@ -53,10 +96,17 @@ class Browser:
         Browser._instances.append(self)
         atexit.register(self._cleanup)
         self._initialize_browser()
+        if Config.MEMORY_WATCHDOG_ENABLED:
+            self.watchdog.start()
 
     def _initialize_browser(self) -> None:
         """Initialize Chrome browser with stealth settings."""
         try:
+            if self._provided_driver is not None:
+                self.driver = self._provided_driver
+                self._attach_driver()
+                return
+            
             options = uc.ChromeOptions()
             options.add_argument('--no-sandbox')
             options.add_argument('--disable-dev-shm-usage')
@@ -64,43 +114,230 @@ class Browser:
             options.add_argument('--disable-notifications')
             options.add_argument('--disable-logging')
             options.add_argument('--log-level=3')
-            
-            self.logger.info("Initializing Chrome browser...")
+            # Background detail tabs must keep rendering while another tab is focused
+            options.add_argument('--disable-renderer-backgrounding')
+            if self.network_events:
+                # CDP network events feed the network-idle readiness signal
+                options.set_capability('goog:loggingPrefs', {'performance': 'ALL'})
+            if Config.LOW_MEMORY_MODE:
+                self._add_low_memory_arguments(options)
+            
+            self.logger.info(
+                f"Initializing Chrome browser ({'headless' if Config.HEADLESS_MODE else 'headed'}"
+                f"{', low-memory' if Config.LOW_MEMORY_MODE else ''})..."
+            )
             self.driver = uc.Chrome(
                 options=options,
                 version_main=None,
                 use_subprocess=True,
-                suppress_welcome=True
+                suppress_welcome=True,
+                headless=Config.HEADLESS_MODE
             )
             
-            self.wait = WebDriverWait(self.driver, 60)
-            self.short_wait = WebDriverWait(self.driver, 10)
+            self._attach_driver()
             
             self.logger.info("Browser initialized successfully")
+            self.log_memory_usage()
             
         except Exception as e:
             self.logger.error(f"Browser initialization failed: {str(e)}")
             self._cleanup()
             raise
 
-    def navigate(self, url: str) -> bool:
-        """Navigate to URL with retry logic."""
+    def _attach_driver(self) -> None:
+        """Wire waits, instrumentation and readiness signals to the current driver."""
+        self.wait = WebDriverWait(self.driver, 60)
+        self.short_wait = WebDriverWait(self.driver, 10)
+        self.stats.instrument(self.driver)
+        self.readiness = PageReadiness(self.driver, stats=self.stats)
+        self.readiness.network_log.available = self.network_events
+        if Config.PAGE_WEIGHT_REPORTS:
+            self.readiness.network_log.add_listener(self.page_weight.on_event)
+
+    def _add_low_memory_arguments(self, options: uc.ChromeOptions) -> None:
+        """Add flags that trade unused Chrome features for a smaller footprint."""
+        for argument in (
+            f'--window-size={Config.WINDOW_SIZE}',
+            f'--renderer-process-limit={Config.RENDERER_PROCESS_LIMIT}',
+            '--disable-extensions',
+            '--disable-background-networking',
+            '--disable-background-timer-throttling',
+            '--disable-component-update',
+            '--disable-default-apps',
+            '--disable-sync',
+            '--disable-translate',
+            '--disable-features=Translate,MediaRouter,OptimizationHints,BackForwardCache',
+            '--metrics-recording-only',
+            '--mute-audio',
+            '--no-first-run',
+            '--js-flags=--max-old-space-size=512',
+        ):
+            options.add_argument(argument)
+
+    def chrome_pids(self) -> List[int]:
+        """Root process ids of this instance's chromedriver and Chrome processes."""
+        if not self.driver:
+            return []
+        pids = [getattr(self.driver, 'browser_pid', None)]
+        with suppress(Exception):
+            pids.append(self.driver.service.process.pid)
+        return [pid for pid in pids if pid]
+
+    def memory_usage(self) -> Dict[str, int]:
+        """RSS and process counts for this instance's Chrome process tree."""
+        return tree_memory(self.chrome_pids())
+
+    def log_memory_usage(self) -> Dict[str, int]:
+        """Log and return this instance's Chrome memory usage."""
+        usage = self.memory_usage()
+        self.logger.info(
+            f"Chrome RSS: {usage['rss_bytes'] / (1024 * 1024):.0f} MB across "
+            f"{usage['processes']} processes ({usage['renderers']} renderers)"
+        )
+        return usage
+
+    @instrumented()
+    def navigate(self, url: str, ready_selector: Optional[str] = None,
+                 operation: str = 'navigate') -> bool:
+        """Navigate to URL and return as soon as the page signals it is ready."""
         try:
+            self.recycle_if_needed()
             self.logger.info(f"Navigating to {url}")
-            self.driver.get(url)
-            time.sleep(random.uniform(3, 5))  # Wait for page load
+            self.readiness.network_log.reset()
+            if Config.PAGE_WEIGHT_REPORTS:
+                self.page_weight.start_page(url)
+            self.driver.get(self.url_rewriter(url) if self.url_rewriter else url)
+            self.pages_loaded += 1
+            self.last_used = time.monotonic()
+            self.readiness.wait_for_ready_state(operation)
+            if ready_selector:
+                self.readiness.wait_for_selector(ready_selector, operation)
+            else:
+                self.readiness.wait_for_dom_settled(operation)
+            self.record_page(url, operation)
             return True
         except Exception as e:
             self.logger.error(f"Navigation failed: {str(e)}")
             return False
 
+    def recycle_if_needed(self) -> bool:
+        """Recycle the driver if the memory watchdog asked for it; call between operations."""
+        if not self.watchdog.recycle_requested.is_set():
+            return False
+        self.recycle()
+        return True
+
+    @instrumented()
+    def recycle(self) -> None:
+        """Replace the Chrome process with a fresh one, keeping the logged-in session."""
+        self.logger.info("Recycling Chrome driver...")
+        cookies = self.session_cookies()
+        
+        self.page_weight.finish_page()
+        self._cleanup()
+        self._initialize_browser()
+        
+        self.restore_cookies(cookies)
+        if self._active_policy is not None:
+            with suppress(WebDriverException):
+                self._active_policy.apply(self.driver)
+        
+        self.pages_loaded = 0
+        self.watchdog.recycled()
+        self.log_memory_usage()
+
+    def session_cookies(self) -> List[dict]:
+        """All cookies of the browser, across domains, via CDP."""
+        with suppress(Exception):
+            return self.driver.execute_cdp_cmd('Network.getAllCookies', {})['cookies']
+        return []
+
+    def clear_session(self) -> None:
+        """Drop every cookie and forget which user's session the browser held."""
+        try:
+            self.driver.execute_cdp_cmd('Network.clearBrowserCookies', {})
+        except WebDriverException as e:
+            self.logger.warning(f"Could not clear session cookies: {str(e)}")
+        self.session_user = None
+        self.session_validated_at = 0.0
+
+    def restore_cookies(self, cookies: List[dict]) -> bool:
+        """Install cookies taken with session_cookies, e.g. to share a login."""
+        if not cookies:
+            return False
+        try:
+            self.driver.execute_cdp_cmd('Network.setCookies', {'cookies': cookies})
+            return True
+        except WebDriverException as e:
+            self.logger.warning(f"Could not restore session cookies: {str(e)}")
+            return False
+
+    @contextmanager
+    def blocking_resources(self, policy: Optional[ResourcePolicy] = None) -> Generator[None, None, None]:
+        """Block the policy's resource categories for the duration of the block."""
+        policy = policy or self.resource_policy
+        previous = self._active_policy
+        applied = False
+        if policy is not None and policy is not previous:
+            try:
+                policy.apply(self.driver)
+                self._active_policy = policy
+                applied = True
+            except WebDriverException as e:
+                self.logger.warning(f"Could not apply resource policy: {str(e)}")
+        try:
+            yield
+        finally:
+            if applied:
+                self._active_policy = previous
+                with suppress(WebDriverException):
+                    if previous is not None:
+                        previous.apply(self.driver)
+                    else:
+                        ResourcePolicy.clear(self.driver)
+
+    def apply_active_policy(self) -> None:
+        """Enforce the active resource policy on the focused tab; CDP blocking is per tab."""
+        if self._active_policy is None:
+            return
+        try:
+            self._active_policy.apply(self.driver)
+        except WebDriverException as e:
+            self.logger.warning(f"Could not apply resource policy to tab: {str(e)}")
+
+    def is_healthy(self) -> bool:
+        """Check that the driver session is still alive and responsive."""
+        if not self.driver:
+            return False
+        try:
+            return bool(self.driver.window_handles)
+        except Exception as e:
+            self.logger.warning(f"Browser health check failed: {str(e)}")
+            return False
+
+    def reset_for_reuse(self) -> None:
+        """Close extra tabs and drop the session so the next lease starts clean."""
+        if not self.driver:
+            return
+        handles = self.driver.window_handles
+        for handle in handles[1:]:
+            with suppress(Exception):
+                self.driver.switch_to.window(handle)
+                self.driver.close()
+        self.driver.switch_to.window(handles[0])
+        # The next lease may be for another user; it restores its own session from the store
+        self.clear_session()
+        self.card_filter = CardFilter(known_ids=KnownJobs())
+        self.last_used = time.monotonic()
+
+    @instrumented()
     def login_linkedin(self) -> bool:
         """Login to LinkedIn with credentials from environment variables."""
         try:
             self.logger.info("Attempting LinkedIn login...")
             
             # Navigate to LinkedIn login page
-            self.navigate("https://www.linkedin.com/login")
+            self.navigate("https://www.linkedin.com/login", ready_selector="#username")
             
             # Wait for login form
             email_field = self.wait.until(
@@ -120,9 +357,9 @@ class Browser:
             
             # Type credentials with human-like behavior
             self._type_like_human(email_field, email)
-            time.sleep(random.uniform(0.5, 1.5))
+            self.stats.sleep(random.uniform(0.5, 1.5))
             self._type_like_human(password_field, password)
-            time.sleep(random.uniform(0.5, 1.5))
+            self.stats.sleep(random.uniform(0.5, 1.5))
             
             # Click sign in
             password_field.send_keys(Keys.RETURN)
@@ -142,41 +379,43 @@ class Browser:
             self.logger.error(f"LinkedIn login failed: {str(e)}")
             return False
 
+    @instrumented()
     def search_jobs(self, title: str, location: str = "Remote") -> bool:
         """Search for jobs and load job cards."""
         try:
             self.logger.info(f"Searching for {title} jobs in {location}")
             
-            # Wait for the search interface to load
-            time.sleep(3)
-            
-            # Find and fill the job title input
-            title_input = self.wait.until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, "input.jobs-search-box__text-input[id*='jobs-search-box-keyword']"))
+            # Find and fill the job title input as soon as the search box renders
+            title_input = self.readiness.wait_for_selector(
+                "input.jobs-search-box__text-input[id*='jobs-search-box-keyword']", 'search_form'
             )
+            if not title_input:
+                self.logger.error("Job title input not found")
+                return False
             self.logger.info("Found job title input field")
             title_input.clear()
             title_input.send_keys(title)
-            time.sleep(1)
             
             # Find and fill the location input
-            location_input = self.wait.until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, "input.jobs-search-box__text-input[id*='jobs-search-box-location']"))
+            location_input = self.readiness.wait_for_selector(
+                "input.jobs-search-box__text-input[id*='jobs-search-box-location']", 'search_form'
             )
+            if not location_input:
+                self.logger.error("Location input not found")
+                return False
             self.logger.info("Found location input field")
             location_input.clear()
             location_input.send_keys(location)
-            time.sleep(1)
             
             # Submit the search
             location_input.send_keys(Keys.RETURN)
             self.logger.info("Search submitted")
-            time.sleep(3)
             
             # Wait for search results to load
-            self.wait.until(
-                EC.presence_of_element_located((By.CLASS_NAME, "jobs-search-results-list"))
-            )
+            if not self.readiness.wait_for_selector(".jobs-search-results-list", 'search_results'):
+                self.logger.error("Search results did not load")
+                return False
+            self.readiness.wait_for_dom_settled('search_results', root_selector=".jobs-search-results-list")
             self.logger.info("Search results loaded")
             
             # Verify job cards are present
@@ -217,7 +456,7 @@ class Browser:
                 for filter_btn in filters:
                     if "Easy Apply" in filter_btn.text:
                         filter_btn.click()
-                        time.sleep(2)
+                        self.readiness.wait_for_dom_settled('search_results', root_selector=".jobs-search-results-list")
                         break
             except:
                 self.logger.warning("Could not find Easy Apply filter")
@@ -229,11 +468,91 @@ class Browser:
             self.logger.error(f"Failed to verify search results: {str(e)}")
             return False
 
+    @instrumented()
+    def scroll_to_load(
+        self,
+        item_selector: str,
+        container_selector: Optional[str] = None,
+        target_count: Optional[int] = None,
+        timeout: float = Config.SCROLL_TIMEOUT,
+        plateau_scrolls: int = Config.SCROLL_PLATEAU_SCROLLS,
+        settle_ms: int = 300,
+        scroll_wait_ms: int = 2500
+    ) -> dict:
+        """Scroll until new items stop arriving, target_count is reached or timeout expires."""
+        start = time.monotonic()
+        yields: List[int] = []
+        count = len(self.driver.find_elements(By.CSS_SELECTOR, item_selector))
+        reason = 'timeout'
+        idle_scrolls = 0
+        with script_timeout(self.driver, scroll_wait_ms / 1000 + 5):
+            while time.monotonic() - start < timeout:
+                if target_count and count >= target_count:
+                    reason = 'target'
+                    break
+                try:
+                    before, count = self.driver.execute_async_script(
+                        SCROLL_AND_COUNT_SCRIPT, item_selector, container_selector, settle_ms, scroll_wait_ms
+                    )
+                except WebDriverException as e:
+                    self.logger.warning(f"Scroll step failed: {str(e)}")
+                    reason = 'error'
+                    break
+                yields.append(count - before)
+                idle_scrolls = idle_scrolls + 1 if count <= before else 0
+                if idle_scrolls >= plateau_scrolls:
+                    reason = 'plateau'
+                    break
+        
+        elapsed = time.monotonic() - start
+        self.readiness.timings['scroll_to_load'].append(elapsed)
+        self.logger.info(
+            f"Loaded {count} items in {len(yields)} scrolls ({reason}, {elapsed:.1f}s); "
+            f"per-scroll yields: {yields}"
+        )
+        return {'count': count, 'yields': yields, 'reason': reason, 'elapsed': elapsed}
+
+    def _scroll_into_view(self, element: WebElement) -> None:
+        """Scroll an element to the viewport centre without a smooth-scroll animation."""
+        self.driver.execute_script(
+            "arguments[0].scrollIntoView({behavior: 'instant', block: 'center'});",
+            element
+        )
+
+    def safe_click(self, element: WebElement) -> None:
+        """Scroll an element into view and click it, falling back to a script click if it is covered."""
+        self._scroll_into_view(element)
+        try:
+            element.click()
+        except WebDriverException as e:
+            self.logger.warning(f"Failed to click element normally: {str(e)}")
+            self.driver.execute_script("arguments[0].click();", element)
+
+    def random_delay(self) -> None:
+        """Pause between consecutive searches for MIN_DELAY..MAX_DELAY seconds."""
+        self.stats.sleep(random.uniform(Config.MIN_DELAY, Config.MAX_DELAY))
+
+    def wait_for_user_input(self, message: str, timeout: float = 120) -> bool:
+        """Wait for the user to finish a manual step in the browser, e.g. a login challenge.
+
+        Done once the page has left LinkedIn's login and checkpoint URLs.
+        """
+        self.logger.info(message)
+        print(message)
+        try:
+            WebDriverWait(self.driver, timeout, poll_frequency=1).until(
+                lambda d: not SessionManager.looks_logged_out(d.current_url)
+            )
+            return True
+        except TimeoutException:
+            self.logger.warning(f"Manual step not completed within {timeout:.0f}s")
+            return False
+
     def _type_like_human(self, element: WebElement, text: str) -> None:
         """Type text with random delays between keystrokes."""
         for char in text:
             element.send_keys(char)
-            time.sleep(random.uniform(0.1, 0.3))
+            self.stats.sleep(random.uniform(0.1, 0.3))
 
     def _cleanup(self) -> None:
         """Clean up browser resources safely."""
@@ -266,6 +585,17 @@ class Browser:
 
     def close(self) -> None:
         """Public method to safely close the browser."""
+        self.page_weight.finish_page()
+        self.watchdog.stop()
+        metrics = self.watchdog.summary()
+        if metrics['samples']:
+            self.logger.info(
+                f"Chrome memory summary: peak {metrics['peak_rss_bytes'] / (1024 * 1024):.0f} MB, "
+                f"{metrics['recycles']} recycles"
+            )
+        if self._html_extractor is not None:
+            self._html_extractor.shutdown()
+            self._html_extractor = None
         self._cleanup()
         if self in Browser._instances:
             Browser._instances.remove(self)
@@ -279,37 +609,72 @@ class Browser:
                 self.logger.error(f"Browser error: {str(exc_info.value)}")
                 raise
 
-    def get_job_listings(self, limit: int = 5) -> List[dict]:
+    def extract_records(self, item_selector: Optional[str], fields: Dict[str, str],
+                        root_selector: Optional[str] = None,
+                        limit: Optional[int] = None) -> List[dict]:
+        """Extract plain records for every matching item in a single script round trip."""
+        try:
+            records = self.driver.execute_script(
+                BULK_EXTRACT_SCRIPT, root_selector, item_selector, compile_fields(fields), limit
+            ) or []
+            if self.recorder:
+                self.recorder.record_extraction(item_selector, fields, root_selector, records)
+            return records
+        except WebDriverException as e:
+            self.logger.error(f"Bulk extraction failed: {str(e)}")
+            return []
+
+    def extract_record(self, fields: Dict[str, str], root_selector: Optional[str] = None) -> dict:
+        """Extract a single record from the page (or root element) in one round trip."""
+        records = self.extract_records(None, fields, root_selector=root_selector)
+        return records[0] if records else {}
+
+    def snapshot(self) -> Tuple[str, str]:
+        """Capture the rendered HTML and final URL of the current page in one round trip."""
+        html, url = self.driver.execute_script(PAGE_SNAPSHOT_SCRIPT)
+        return html, url
+
+    def record_page(self, requested_url: str, label: str = 'navigate') -> None:
+        """Save the current page to the fixture recorder, if recording is enabled."""
+        if not self.recorder:
+            return
+        try:
+            html, final_url = self.snapshot()
+            self.recorder.record_page(requested_url, html, final_url, label)
+        except Exception as e:
+            self.logger.warning(f"Failed to record page: {str(e)}")
+
+    @property
+    def html_extractor(self) -> HtmlExtractor:
+        """Worker pool that parses page snapshots off the browser thread."""
+        if self._html_extractor is None:
+            self._html_extractor = HtmlExtractor()
+        return self._html_extractor
+
+    @instrumented()
+    def get_job_listings(self, limit: int = 5) -> List[JobRecord]:
         """Extract job listings from current search results."""
+        with self.blocking_resources():
+            return self._get_job_listings(limit)
+
+    def _get_job_listings(self, limit: int) -> List[JobRecord]:
+        """Load the detail pages of the first result cards in parallel tabs."""
         try:
-            jobs = []
-            job_cards = self.wait.until(
-                EC.presence_of_all_elements_located(
-                    (By.CSS_SELECTOR, ".jobs-search-results__list-item")
-                )
+            self.wait.until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, SEARCH_RESULT_CARD_SELECTOR))
             )
+            cards = self.extract_records(SEARCH_RESULT_CARD_SELECTOR, SEARCH_RESULT_CARD_FIELDS)
+            # Stale and already-stored postings never get a detail tab
+            cards = self.card_filter.filter(cards)[:limit]
+            urls = [card['url'] for card in cards if card.get('url')]
             
-            for card in job_cards[:limit]:
-                try:
-                    # Click the card to load details
-                    card.click()
-                    time.sleep(random.uniform(1.5, 2.5))
-                    
-                    # Extract job information
-                    job_info = {
-                        'title': self._get_text(".jobs-unified-top-card__job-title"),
-                        'company': self._get_text(".jobs-unified-top-card__company-name"),
-                        'location': self._get_text(".jobs-unified-top-card__workplace-type"),
-                        'description': self._get_text(".jobs-description__content"),
-                        'url': self.driver.current_url
-                    }
-                    
-                    jobs.append(job_info)
-                    self.logger.info(f"Extracted job: {job_info['title']} at {job_info['company']}")
-                    
-                except Exception as e:
-                    self.logger.error(f"Failed to extract job details: {str(e)}")
+            jobs = []
+            for details in self.detail_fetcher.fetch(urls, JOB_DETAIL_FIELDS):
+                job = JobRecord.from_record(details) if details else None
+                if not job:
                     continue
+                jobs.append(job)
+                self.logger.info(f"Extracted job: {job.title} at {job.company}")
                     
             return jobs
             
@@ -317,6 +682,18 @@ class Browser:
             self.logger.error(f"Failed to get job listings: {str(e)}")
             return []
 
+    def resolve_card(self, job_id: str) -> Optional[WebElement]:
+        """Look up the live result card for a job id, or None if it is not on the page."""
+        if not str(job_id).isdigit() or not str(job_id).isascii():
+            # Ends up inside a CSS attribute selector; LinkedIn job ids are numeric
+            self.logger.warning(f"Ignoring malformed job id {job_id!r}")
+            return None
+        cards = self.driver.find_elements(
+            By.CSS_SELECTOR,
+            f"[data-occludable-job-id='{job_id}'], [data-job-id='{job_id}']"
+        )
+        return cards[0] if cards else None
+
     def _get_text(self, selector: str) -> str:
         """Helper method to safely get text content."""
         try:
@@ -327,64 +704,52 @@ class Browser:
         except:
             return ""
 
-    def get_recent_jobs(self, limit: int = 5) -> List[dict]:
+    @instrumented()
+    def get_recent_jobs(self, limit: int = 5) -> List[JobRecord]:
         """Get recent Easy Apply jobs from search results."""
+        with self.blocking_resources():
+            return self._get_recent_jobs(limit)
+
+    def _get_recent_jobs(self, limit: int) -> List[JobRecord]:
+        """Check result cards in parallel tabs and keep those with an Easy Apply button."""
         try:
             self.logger.info("Getting recent Easy Apply jobs...")
             jobs = []
             
             # Wait for job list to load
-            job_list = self.wait.until(
+            self.wait.until(
                 EC.presence_of_element_located((By.CLASS_NAME, "jobs-search-results-list"))
             )
             
-            # Get all job cards
-            job_cards = job_list.find_elements(By.CSS_SELECTOR, ".jobs-search-results__list-item")
-            self.logger.info(f"Found {len(job_cards)} total job cards")
+            cards = self.extract_records(SEARCH_RESULT_CARD_SELECTOR, SEARCH_RESULT_CARD_FIELDS)
+            self.logger.info(f"Found {len(cards)} total job cards")
             
-            processed = 0
-            for card in job_cards:
-                if processed >= limit:
+            candidates = [
+                card for card in self.card_filter.filter(cards, require_easy_apply=True) if card.get('url')
+            ]
+            batch_size = self.detail_fetcher.parallelism
+            for offset in range(0, len(candidates), batch_size):
+                if len(jobs) >= limit:
                     break
+                batch = candidates[offset:offset + batch_size]
+                details = self.detail_fetcher.fetch(
+                    [card['url'] for card in batch], EASY_APPLY_DETAIL_FIELDS
+                )
+                
+                for card, detail in zip(batch, details):
+                    if len(jobs) >= limit:
+                        break
+                    if not detail or 'Easy Apply' not in (detail.get('apply_label') or ''):
+                        self.logger.warning("Easy Apply button not found for this job")
+                        continue
                     
-                try:
-                    # Scroll card into view
-                    self.driver.execute_script(
-                        "arguments[0].scrollIntoView({behavior: 'smooth', block: 'center'});", 
-                        card
+                    job = JobRecord.from_record(
+                        {**card, **{k: v for k, v in detail.items() if v}}, easy_apply=True
                     )
-                    time.sleep(1)
-                    
-                    # Click the card
-                    card.click()
-                    time.sleep(2)
-                    
-                    # Check for Easy Apply button
-                    try:
-                        easy_apply_button = self.wait.until(
-                            EC.presence_of_element_located((By.CSS_SELECTOR, 
-                                "button.jobs-apply-button[aria-label*='Easy Apply']"))
-                        )
-                        
-                        if "Easy Apply" in easy_apply_button.text:
-                            job_info = {
-                                'title': self._get_text(".jobs-unified-top-card__job-title"),
-                                'company': self._get_text(".jobs-unified-top-card__company-name"),
-                                'location': self._get_text(".jobs-unified-top-card__workplace-type"),
-                                'element': card,
-                                'apply_button': easy_apply_button
-                            }
-                            jobs.append(job_info)
-                            processed += 1
-                            self.logger.info(f"Found Easy Apply job: {job_info['title']}")
-                            
-                    except TimeoutException:
-                        self.logger.warning("Easy Apply button not found for this job")
+                    if not job:
                         continue
-                        
-                except Exception as e:
-                    self.logger.error(f"Failed to process job card: {str(e)}")
-                    continue
+                    jobs.append(job)
+                    self.logger.info(f"Found Easy Apply job: {job.title}")
                 
             return jobs
             
@@ -392,40 +757,35 @@ class Browser:
             self.logger.error(f"Failed to get job listings: {str(e)}")
             return []
 
-    def apply_to_job(self, job: dict) -> bool:
+    @instrumented()
+    def apply_to_job(self, job: JobRecord) -> bool:
         """Apply to a job using Easy Apply."""
         try:
-            self.logger.info(f"Applying to: {job['title']} at {job['company']}")
-            
-            # Click the job card to ensure it's active
-            if 'element' in job:
-                self.driver.execute_script(
-                    "arguments[0].scrollIntoView({behavior: 'smooth', block: 'center'});", 
-                    job['element']
-                )
-                time.sleep(1)
-                job['element'].click()
-                time.sleep(2)
+            self.logger.info(f"Applying to: {job.title} at {job.company}")
+            
+            # Re-resolve the card by job id; fall back to the job page if it is gone
+            card = self.resolve_card(job.job_id)
+            if card:
+                self._scroll_into_view(card)
+                card.click()
+                self.readiness.wait_for_dom_settled('job_detail', root_selector=".jobs-search__job-details")
+            else:
+                self.navigate(job.url, ready_selector="button.jobs-apply-button", operation='job_detail')
         
-            # Click the Easy Apply button
-            apply_button = job.get('apply_button')
+            # Resolve the Easy Apply button from the now-active detail pane
+            apply_button = self.readiness.wait_for_selector(
+                "button.jobs-apply-button[aria-label*='Easy Apply']", 'job_detail'
+            )
             if not apply_button:
                 self.logger.error("Easy Apply button not found")
                 return False
             
-            self.driver.execute_script(
-                "arguments[0].scrollIntoView({behavior: 'smooth', block: 'center'});", 
-                apply_button
-            )
-            time.sleep(1)
-            try:
-                apply_button.click()
-            except Exception as e:
-                self.logger.warning(f"Failed to click Easy Apply button normally: {str(e)}")
-                self.driver.execute_script("arguments[0].click();", apply_button)
+            self.safe_click(apply_button)
         
             self.logger.info("Clicked Easy Apply button")
-            time.sleep(2)
+            if not self.readiness.wait_for_selector(EASY_APPLY_MODAL_SELECTOR, 'easy_apply_modal'):
+                self.logger.error("Easy Apply modal did not open")
+                return False
             
             # Complete the application flow
             return self._complete_application_flow()
@@ -434,66 +794,59 @@ class Browser:
             self.logger.error(f"Failed to start application: {str(e)}")
             return False
 
-    def _complete_application_flow(self) -> bool:
-        """Complete the multi-step application process."""
+    @instrumented()
+    def _complete_application_flow(self, filler: Optional[FormFiller] = None, profile: Optional[Dict] = None) -> bool:
+        """Complete the multi-step application process, filling each step with filler if given."""
         try:
             step_count = 0
             max_steps = 10
 
             while step_count < max_steps:
-                try:
-                    # Wait for the application modal
-                    modal = self.wait.until(
-                        EC.presence_of_element_located((By.CSS_SELECTOR, ".jobs-easy-apply-modal"))
-                    )
-                except TimeoutException:
-                    self.logger.error("Application modal not found")
-                    return False
-
-                # Check for success message
-                if self._check_success_message():
-                    self.logger.info("Application submitted successfully")
+                preferred_role = None
+                if filler is not None and profile is not None:
+                    filler.fill(profile)
+                    preferred_role = filler.planned_button
+                step = inspect_modal_step(self.driver, preferred_role)
+                if step.success:
+                    self._log_application_submitted(filler, step_count)
                     return True
 
-                # Find the next/submit button
-                button = None
-                button_selectors = [
-                    "button[aria-label*='Submit application']",
-                    "button[aria-label*='Next']",
-                    "button[aria-label*='Review']",
-                    "footer button"
-                ]
-
-                for selector in button_selectors:
-                    try:
-                        buttons = modal.find_elements(By.CSS_SELECTOR, selector)
-                        for btn in buttons:
-                            if btn.is_displayed() and any(text in btn.text.lower()
-                               for text in ['submit', 'next', 'review', 'apply']):
-                                button = btn
-                                break
-                        if button:
-                            break
-                    except Exception:
-                        continue
+                if not step.present:
+                    # The modal may still be rendering; wait once before giving up
+                    if not self.readiness.wait_for_selector(EASY_APPLY_MODAL_SELECTOR, 'modal_step'):
+                        self.logger.error("Application modal not found")
+                        return False
+                    step = inspect_modal_step(self.driver, preferred_role)
+                    if step.success:
+                        self._log_application_submitted(filler, step_count)
+                        return True
+
+                if step.blocked:
+                    if filler is not None:
+                        # Never replay answers the page rejected
+                        filler.forget_plan()
+                    self.logger.error(
+                        f"Application step {step_count + 1} is blocked: "
+                        f"required fields {step.required_empty}, errors {step.errors}"
+                    )
+                    return False
 
-                if not button:
+                if not step.button:
                     self.logger.error("No next/submit button found")
                     return False
 
-                # Click the button
-                self.driver.execute_script(
-                    "arguments[0].scrollIntoView({behavior: 'smooth', block: 'center'});",
-                    button
-                )
-                time.sleep(1)
-
+                # Click the button and wait for the next step to render
+                self.logger.info(f"Application step {step_count + 1}: clicking {step.role}")
                 try:
-                    button.click()
+                    step.button.click()
                 except Exception:
-                    self.driver.execute_script("arguments[0].click();", button)
+                    self.driver.execute_script("arguments[0].click();", step.button)
 
-                time.sleep(2)
+                if filler is not None:
+                    filler.remember_button(step.role)
+
+                self.readiness.wait_for_dom_settled('modal_step', root_selector=EASY_APPLY_MODAL_SELECTOR)
+                self.record_page(self.driver.current_url, 'modal_step')
                 step_count += 1
 
             return False
@@ -502,24 +855,14 @@ class Browser:
             self.logger.error(f"Application flow failed: {str(e)}")
             return False
 
-    def _check_success_message(self) -> bool:
-        """Check for application success message."""
-        try:
-            success_elements = self.driver.find_elements(
-                By.CSS_SELECTOR, 
-                ".artdeco-toast-item--success, .artdeco-inline-feedback--success"
+    def _log_application_submitted(self, filler: Optional[FormFiller], steps: int) -> None:
+        if filler is not None and steps:
+            self.logger.info(
+                f"Application submitted successfully "
+                f"({filler.replayed_steps} of {steps} steps replayed from cached fill plans)"
             )
-            
-            for element in success_elements:
-                if any(msg in element.text.lower() for msg in 
-                       ['application submitted', 'applied', 'success']):
-                    return True
-            
-            return False
-            
-        except Exception as e:
-            self.logger.error(f"Error checking success message: {str(e)}")
-            return False
+        else:
+            self.logger.info("Application submitted successfully")
 
     def get_posted_date(self, selector: str) -> str:
         """Extract and return the posted date of the job."""
@@ -538,7 +881,10 @@ class Browser:
     def _parse_date(self, date_text: str) -> str:
         """Parse the date text and return a standardized date string."""
         try:
-            # Example parsing logic (to be customized)
+            # List cards show relative ages such as "3 days ago"
+            age = parse_posted_age(date_text)
+            if age is not None:
+                return (datetime.now() - age).strftime("%Y-%m-%d")
             date_format = "%B %d, %Y"  # Example: January 1, 2022
             parsed_date = datetime.strptime(date_text, date_format)
             return parsed_date.strftime("%Y-%m-%d")
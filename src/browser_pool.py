@@ -0,0 +1,176 @@
+import atexit
+import logging
+import threading
+import time
+from contextlib import contextmanager, suppress
+from typing import Callable, Generator, List, Optional, Set
+
+from .browser import Browser
+from .config import Config
+
+
+class BrowserPool:
+    """Pool of warm Browser instances leased out to bot runs instead of relaunching Chrome."""
+
+    def __init__(
+        self,
+        max_size: int = Config.BROWSER_POOL_SIZE,
+        max_pages: int = Config.BROWSER_MAX_PAGES,
+        idle_timeout: float = Config.BROWSER_IDLE_TIMEOUT,
+        browser_factory: Callable[[], Browser] = Browser
+    ) -> None:
+        self.logger = logging.getLogger(__name__)
+        self.max_size = max_size
+        self.max_pages = max_pages
+        self.idle_timeout = idle_timeout
+        self._browser_factory = browser_factory
+        self._idle: List[Browser] = []
+        self._leased: Set[Browser] = set()
+        self._launching = 0
+        self._condition = threading.Condition()
+        atexit.register(self.close_all)
+
+    @property
+    def size(self) -> int:
+        """Total number of live browsers, idle or leased."""
+        with self._condition:
+            return len(self._idle) + len(self._leased) + self._launching
+
+    @property
+    def available(self) -> int:
+        """Browsers that could be leased right now without waiting: idle ones plus free slots."""
+        with self._condition:
+            return self.max_size - len(self._leased) - self._launching
+
+    def acquire(self, timeout: Optional[float] = Config.BROWSER_LEASE_TIMEOUT) -> Browser:
+        """Lease a healthy browser, launching a new one only when none is idle."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            self.evict_idle()
+            with self._condition:
+                if self._idle:
+                    browser = self._idle.pop()
+                    self._leased.add(browser)
+                elif len(self._idle) + len(self._leased) + self._launching < self.max_size:
+                    self._launching += 1
+                    browser = None
+                else:
+                    remaining = None if deadline is None else deadline - time.monotonic()
+                    if remaining is not None and remaining <= 0:
+                        raise TimeoutError("Timed out waiting for a pooled browser")
+                    self._condition.wait(remaining)
+                    continue
+
+            if browser is None:
+                return self._launch()
+
+            if browser.is_healthy():
+                self.logger.info(f"Leased warm browser ({browser.pages_loaded} pages loaded)")
+                return browser
+
+            self.logger.warning("Discarding unhealthy pooled browser")
+            self._discard(browser)
+
+    def release(self, browser: Browser) -> None:
+        """Return a leased browser, recycling it once it has served too many pages."""
+        with self._condition:
+            if browser not in self._leased:
+                # Released twice, or already dropped by close_all()
+                self.logger.warning("Ignoring release of a browser that is not leased from this pool")
+                return
+            self._leased.discard(browser)
+
+        if browser.pages_loaded >= self.max_pages:
+            self.logger.info(f"Recycling browser after {browser.pages_loaded} pages")
+            self._close(browser)
+        elif not browser.is_healthy():
+            self.logger.warning("Dropping unhealthy browser on release")
+            self._close(browser)
+        else:
+            try:
+                browser.log_memory_usage()
+                # Reset first: a recycle carries cookies over, and they are this lease's user's
+                browser.reset_for_reuse()
+                browser.recycle_if_needed()
+                with self._condition:
+                    self._idle.append(browser)
+            except Exception as e:
+                self.logger.warning(f"Could not reset browser for reuse: {str(e)}")
+                self._close(browser)
+
+        with self._condition:
+            self._condition.notify()
+
+    @contextmanager
+    def lease(self, timeout: Optional[float] = Config.BROWSER_LEASE_TIMEOUT) -> Generator[Browser, None, None]:
+        """Context manager that leases a browser and always returns it."""
+        browser = self.acquire(timeout)
+        try:
+            yield browser
+        finally:
+            self.release(browser)
+
+    def evict_idle(self) -> int:
+        """Close browsers that have been idle longer than the idle timeout."""
+        with self._condition:
+            now = time.monotonic()
+            expired = [b for b in self._idle if now - b.last_used > self.idle_timeout]
+            for browser in expired:
+                self._idle.remove(browser)
+        # Quitting Chrome takes a while; don't hold up other leases meanwhile
+        for browser in expired:
+            self.logger.info("Evicting idle browser")
+            self._close(browser)
+        if expired:
+            with self._condition:
+                self._condition.notify_all()
+        return len(expired)
+
+    def close_all(self) -> None:
+        """Close every idle browser and forget leased ones."""
+        with self._condition:
+            browsers = self._idle[:] + list(self._leased)
+            self._idle.clear()
+            self._leased.clear()
+            self._condition.notify_all()
+        for browser in browsers:
+            self._close(browser)
+
+    def _launch(self) -> Browser:
+        """Launch a new browser into a slot reserved by acquire()."""
+        browser = None
+        try:
+            self.logger.info("Launching new pooled browser")
+            browser = self._browser_factory()
+            return browser
+        finally:
+            with self._condition:
+                self._launching -= 1
+                if browser is not None:
+                    self._leased.add(browser)
+                self._condition.notify()
+
+    def _discard(self, browser: Browser) -> None:
+        """Drop a leased browser from the pool and close it."""
+        with self._condition:
+            self._leased.discard(browser)
+            self._condition.notify()
+        self._close(browser)
+
+    def _close(self, browser: Browser) -> None:
+        """Quit a browser without letting cleanup errors escape."""
+        with suppress(Exception):
+            browser.close()
+
+
+_default_pool: Optional[BrowserPool] = None
+_default_pool_lock = threading.Lock()
+
+
+def get_browser_pool() -> BrowserPool:
+    """Return the process-wide browser pool, creating it on first use."""
+    global _default_pool
+    with _default_pool_lock:
+        if _default_pool is None:
+            _default_pool = BrowserPool()
+        return _default_pool
@@ -0,0 +1,156 @@
+import json
+import logging
+import re
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+from .config import Config
+
+
+class CacheStore:
+    """Persistent JSON key/value cache in SQLite with LRU eviction.
+
+    Each namespace gets its own table in a shared database file. Entries are
+    evicted least-recently-used first once max_entries or max_bytes is
+    exceeded, and treated as missing once older than ttl seconds.
+    """
+
+    def __init__(
+        self,
+        namespace: str,
+        path: Path = Path(Config.CACHE_DB_PATH),
+        max_entries: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        ttl: Optional[float] = None
+    ) -> None:
+        if not re.fullmatch(r'[a-z][a-z0-9_]*', namespace):
+            raise ValueError(f"Invalid cache namespace: {namespace!r}")
+        self.namespace = namespace
+        self.table = f"cache_{namespace}"
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.logger = logging.getLogger(__name__)
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.bytes_served = 0
+        self._lock = threading.Lock()
+
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(path), check_same_thread=False, timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            f"CREATE TABLE IF NOT EXISTS {self.table} ("
+            "key TEXT PRIMARY KEY, value TEXT NOT NULL, size INTEGER NOT NULL, "
+            "created_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+        )
+        self._conn.execute(f"CREATE INDEX IF NOT EXISTS {self.table}_lru ON {self.table} (accessed_at)")
+        self._conn.commit()
+
+    def get(self, key: str) -> Optional[Any]:
+        """Cached value for key, or None; a hit refreshes the entry's LRU position."""
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT value, created_at FROM {self.table} WHERE key = ?", (key,)
+            ).fetchone()
+            now = time.time()
+            if row is None or (self.ttl is not None and now - row[1] > self.ttl):
+                if row is not None:
+                    self._conn.execute(f"DELETE FROM {self.table} WHERE key = ?", (key,))
+                    self._conn.commit()
+                self.misses += 1
+                return None
+            self._conn.execute(f"UPDATE {self.table} SET accessed_at = ? WHERE key = ?", (now, key))
+            self._conn.commit()
+            self.hits += 1
+            self.bytes_served += len(row[0].encode('utf-8'))
+        return json.loads(row[0])
+
+    def peek(self, key: str) -> Optional[Any]:
+        """Cached value for key without counting a lookup or touching its LRU position."""
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT value, created_at FROM {self.table} WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None or (self.ttl is not None and time.time() - row[1] > self.ttl):
+            return None
+        return json.loads(row[0])
+
+    def put(self, key: str, value: Any) -> None:
+        """Store value under key and evict old entries past the limits."""
+        payload = json.dumps(value)
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                f"INSERT OR REPLACE INTO {self.table} (key, value, size, created_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (key, payload, len(payload.encode('utf-8')), now, now)
+            )
+            self._evict()
+            self._conn.commit()
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._conn.execute(f"DELETE FROM {self.table} WHERE key = ?", (key,))
+            self._conn.commit()
+
+    def items(self) -> Iterator[Tuple[str, Any]]:
+        """All live entries, most recently used first."""
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT key, value, created_at FROM {self.table} ORDER BY accessed_at DESC"
+            ).fetchall()
+        now = time.time()
+        for key, value, created_at in rows:
+            if self.ttl is None or now - created_at <= self.ttl:
+                yield key, json.loads(value)
+
+    def _evict(self) -> None:
+        """Drop least-recently-used entries past max_entries/max_bytes; callers hold the lock."""
+        if self.ttl is not None:
+            self.evictions += self._conn.execute(
+                f"DELETE FROM {self.table} WHERE created_at < ?", (time.time() - self.ttl,)
+            ).rowcount
+        if self.max_entries is not None:
+            self.evictions += self._conn.execute(
+                f"DELETE FROM {self.table} WHERE key IN (SELECT key FROM {self.table} "
+                "ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)", (self.max_entries,)
+            ).rowcount
+        if self.max_bytes is not None:
+            total = self._conn.execute(f"SELECT COALESCE(SUM(size), 0) FROM {self.table}").fetchone()[0]
+            if total > self.max_bytes:
+                for key, size in self._conn.execute(
+                    f"SELECT key, size FROM {self.table} ORDER BY accessed_at"
+                ).fetchall():
+                    if total <= self.max_bytes:
+                        break
+                    self._conn.execute(f"DELETE FROM {self.table} WHERE key = ?", (key,))
+                    total -= size
+                    self.evictions += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss/eviction counters, bytes served from hits and current size."""
+        with self._lock:
+            entries, size = self._conn.execute(
+                f"SELECT COUNT(*), COALESCE(SUM(size), 0) FROM {self.table}"
+            ).fetchone()
+        lookups = self.hits + self.misses
+        return {
+            'namespace': self.namespace,
+            'entries': entries,
+            'bytes': size,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'evictions': self.evictions,
+            'bytes_served': self.bytes_served,
+        }
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,140 @@
+import logging
+import re
+from collections import Counter
+from datetime import datetime, timedelta
+from typing import Container, Dict, Iterable, List, Optional, Set
+
+from .config import Config
+from .job_record import job_id_from_url
+
+# "3 days ago", "Reposted 1 week ago", "30+ days ago", "an hour ago"
+RELATIVE_AGE_PATTERN = re.compile(
+    r'\b(\d+|an?|one)\+?\s*(second|minute|hour|day|week|month|year)s?\s+ago', re.IGNORECASE
+)
+JUST_POSTED_PATTERN = re.compile(r'\b(just now|moments? ago|today|new)\b', re.IGNORECASE)
+
+AGE_UNITS: Dict[str, timedelta] = {
+    'second': timedelta(seconds=1),
+    'minute': timedelta(minutes=1),
+    'hour': timedelta(hours=1),
+    'day': timedelta(days=1),
+    'week': timedelta(weeks=1),
+    'month': timedelta(days=30),
+    'year': timedelta(days=365),
+}
+
+
+def parse_posted_age(text: Optional[str]) -> Optional[timedelta]:
+    """Age of a posting from LinkedIn's relative text, or None if it cannot be read."""
+    if not text:
+        return None
+    match = RELATIVE_AGE_PATTERN.search(text)
+    if match:
+        amount, unit = match.groups()
+        count = int(amount) if amount.isdigit() else 1
+        return count * AGE_UNITS[unit.lower()]
+    if JUST_POSTED_PATTERN.search(text):
+        return timedelta(0)
+    return None
+
+
+def parse_posted_at(value: Optional[str]) -> Optional[timedelta]:
+    """Age of a posting from an ISO date such as a <time datetime="2024-05-01"> attribute."""
+    if not value:
+        return None
+    try:
+        posted = datetime.fromisoformat(value.strip())
+    except ValueError:
+        return None
+    if posted.tzinfo:
+        posted = posted.replace(tzinfo=None)
+    return max(datetime.now() - posted, timedelta(0))
+
+
+def known_job_ids(urls: Iterable[Optional[str]]) -> Set[str]:
+    """Job ids of already-stored postings, from their URLs."""
+    return {job_id for job_id in map(job_id_from_url, urls) if job_id}
+
+
+class CardFilter:
+    """Drops stale, already-known and non-Easy-Apply cards using list-card data only."""
+
+    def __init__(
+        self,
+        max_age_days: int = Config.MAX_POSTING_AGE_DAYS,
+        known_ids: Optional[Container[str]] = None,
+        require_easy_apply: bool = False
+    ) -> None:
+        self.max_age = timedelta(days=max_age_days) if max_age_days > 0 else None
+        self.known_ids: Container[str] = known_ids if known_ids is not None else set()
+        self.require_easy_apply = require_easy_apply
+        self.logger = logging.getLogger(__name__)
+        self.counts: Counter = Counter()
+
+    def reason_to_skip(self, card: dict, require_easy_apply: Optional[bool] = None) -> Optional[str]:
+        """Why a card should be skipped, or None to keep it."""
+        job_id = job_id_from_url(card.get('url')) or card.get('job_id')
+        if not job_id:
+            return 'no_id'
+        if str(job_id) in self.known_ids:
+            return 'known'
+
+        if self.max_age is not None:
+            age = parse_posted_at(card.get('posted_at'))
+            if age is None:
+                age = parse_posted_age(card.get('posted'))
+            if age is not None and age > self.max_age:
+                return 'stale'
+
+        if self.require_easy_apply if require_easy_apply is None else require_easy_apply:
+            badge = card.get('easy_apply_badge')
+            # No apply-method element at all means the card doesn't say; keep it for the detail check
+            if badge is not None and 'easy apply' not in badge.lower():
+                return 'no_easy_apply'
+        return None
+
+    def filter(self, cards: List[dict], require_easy_apply: Optional[bool] = None) -> List[dict]:
+        """Keep the cards worth loading, counting every skip by reason."""
+        kept = []
+        for card in cards:
+            reason = self.reason_to_skip(card, require_easy_apply)
+            self.counts['seen'] += 1
+            if reason:
+                self.counts[reason] += 1
+            else:
+                self.counts['kept'] += 1
+                kept.append(card)
+        if len(kept) < len(cards):
+            self.logger.info(f"Card filter kept {len(kept)}/{len(cards)} cards")
+        return kept
+
+    def remember(self, job_id: str) -> None:
+        """Treat job_id as known from now on, e.g. after storing it."""
+        add = getattr(self.known_ids, 'add', None)
+        if add:
+            add(job_id)
+
+    @property
+    def avoided_loads(self) -> int:
+        """Detail or apply page loads saved by skipping cards."""
+        return self.counts['seen'] - self.counts['kept']
+
+    def summary(self) -> Dict[str, int]:
+        """Cards seen and kept, skips by reason, and loads avoided."""
+        return {
+            'seen': self.counts['seen'],
+            'kept': self.counts['kept'],
+            'stale': self.counts['stale'],
+            'known': self.counts['known'],
+            'no_easy_apply': self.counts['no_easy_apply'],
+            'no_id': self.counts['no_id'],
+            'avoided_loads': self.avoided_loads,
+        }
+
+    def log_summary(self) -> None:
+        """Log the counters if any card was filtered."""
+        if self.counts['seen']:
+            self.logger.info(f"Card filter summary: {self.summary()}")
+        lookups = getattr(self.known_ids, 'counts', None)
+        if lookups:
+            self.logger.info(f"Known-job lookups: {dict(lookups)}")
@@ -10,6 +10,13 @@ class Config:
     # API Keys
     OPENAI_API_KEY = os.getenv('OPENAI_API_KEY')
     
+    # OpenAI Client (one pooled client per process)
+    AI_MAX_CONCURRENCY = int(os.getenv('AI_MAX_CONCURRENCY', '4'))  # requests in flight at once
+    AI_MAX_CONNECTIONS = int(os.getenv('AI_MAX_CONNECTIONS', '10'))
+    AI_KEEPALIVE_CONNECTIONS = int(os.getenv('AI_KEEPALIVE_CONNECTIONS', '5'))
+    AI_REQUEST_TIMEOUT = float(os.getenv('AI_REQUEST_TIMEOUT', '60'))
+    AI_MAX_RETRIES = int(os.getenv('AI_MAX_RETRIES', '2'))
+    
     # Database
     DATABASE_URL = os.getenv('DATABASE_URL', 'sqlite:///./database/jobs.db')
     DATABASE_LOGGING = os.getenv('DATABASE_LOGGING', 'False').lower() == 'true'
@@ -17,7 +24,88 @@ class Config:
     # Application Settings
     DEBUG_MODE = os.getenv('DEBUG_MODE', 'True').lower() == 'true'
     HEADLESS_MODE = os.getenv('HEADLESS_MODE', 'False').lower() == 'true'
+    LOW_MEMORY_MODE = os.getenv('LOW_MEMORY_MODE', os.getenv('HEADLESS_MODE', 'False')).lower() == 'true'
+    WINDOW_SIZE = os.getenv('WINDOW_SIZE', '1280,800')
+    RENDERER_PROCESS_LIMIT = int(os.getenv('RENDERER_PROCESS_LIMIT', '2'))
     STEALTH_MODE = os.getenv('STEALTH_MODE', 'True').lower() == 'true'
     MIN_DELAY = float(os.getenv('MIN_DELAY', '2'))
     MAX_DELAY = float(os.getenv('MAX_DELAY', '5'))
     MAX_DAILY_APPLICATIONS = int(os.getenv('MAX_DAILY_APPLICATIONS', '50'))
+    
+    # Browser Pool
+    BROWSER_POOL_SIZE = int(os.getenv('BROWSER_POOL_SIZE', '2'))
+    BROWSER_MAX_PAGES = int(os.getenv('BROWSER_MAX_PAGES', '200'))
+    BROWSER_IDLE_TIMEOUT = float(os.getenv('BROWSER_IDLE_TIMEOUT', '900'))
+    BROWSER_LEASE_TIMEOUT = float(os.getenv('BROWSER_LEASE_TIMEOUT', '300'))
+    
+    # Search Grid (browsers searching keyword x location cells at once; 1 = serial)
+    SEARCH_GRID_CONCURRENCY = int(os.getenv('SEARCH_GRID_CONCURRENCY', '2'))
+    SEARCH_GRID_LEASE_TIMEOUT = float(os.getenv('SEARCH_GRID_LEASE_TIMEOUT', '30'))
+    SEARCH_STREAM_BUFFER = int(os.getenv('SEARCH_STREAM_BUFFER', '200'))  # jobs held for a slow consumer
+    
+    # Job Sink (batched inserts of streamed jobs)
+    JOB_SINK_BATCH_SIZE = int(os.getenv('JOB_SINK_BATCH_SIZE', '25'))
+    JOB_SINK_FLUSH_INTERVAL = float(os.getenv('JOB_SINK_FLUSH_INTERVAL', '2'))
+    
+    # Application Pipeline (search -> dedupe -> prepare -> apply)
+    AUTO_APPLY = os.getenv('AUTO_APPLY', 'False').lower() == 'true'
+    PIPELINE_QUEUE_SIZE = int(os.getenv('PIPELINE_QUEUE_SIZE', '20'))
+    PIPELINE_AI_WORKERS = int(os.getenv('PIPELINE_AI_WORKERS', '2'))  # tailor resumes ahead of the apply workers
+    PIPELINE_APPLY_WORKERS = int(os.getenv('PIPELINE_APPLY_WORKERS', '1'))  # each leases its own browser
+    PIPELINE_REPORT_INTERVAL = float(os.getenv('PIPELINE_REPORT_INTERVAL', '60'))
+    
+    # LinkedIn Sessions (cookies stored encrypted per user)
+    SESSION_STORE_DIR = os.getenv('SESSION_STORE_DIR', 'database/sessions')
+    SESSION_ENCRYPTION_KEY = os.getenv('SESSION_ENCRYPTION_KEY', '')  # Fernet key; generated locally if empty
+    SESSION_VALID_TTL = float(os.getenv('SESSION_VALID_TTL', '1800'))
+    
+    # Worker Fleet (separate process running queued bot runs)
+    WORKER_CONCURRENCY = int(os.getenv('WORKER_CONCURRENCY', '2'))
+    WORKER_POLL_INTERVAL = float(os.getenv('WORKER_POLL_INTERVAL', '5'))
+    WORKER_MAX_ATTEMPTS = int(os.getenv('WORKER_MAX_ATTEMPTS', '2'))
+    WORKER_STALE_RUN_TIMEOUT = float(os.getenv('WORKER_STALE_RUN_TIMEOUT', '300'))  # seconds without a heartbeat
+    
+    # Memory Watchdog
+    MEMORY_WATCHDOG_ENABLED = os.getenv('MEMORY_WATCHDOG_ENABLED', 'True').lower() == 'true'
+    MEMORY_WATCHDOG_INTERVAL = float(os.getenv('MEMORY_WATCHDOG_INTERVAL', '30'))
+    MAX_CHROME_RSS_MB = float(os.getenv('MAX_CHROME_RSS_MB', '1500'))
+    MAX_CHROME_RENDERERS = int(os.getenv('MAX_CHROME_RENDERERS', '12'))
+    
+    # Extraction
+    EXTRACTION_MODE = os.getenv('EXTRACTION_MODE', 'script').lower()  # 'script' or 'html'
+    EXTRACTION_WORKERS = int(os.getenv('EXTRACTION_WORKERS', '2'))
+    DETAIL_TAB_PARALLELISM = int(os.getenv('DETAIL_TAB_PARALLELISM', '4'))
+    EXTRACTION_USE_PROCESSES = os.getenv('EXTRACTION_USE_PROCESSES', 'False').lower() == 'true'
+    
+    # Infinite Scroll
+    SCROLL_TARGET_CARDS = int(os.getenv('SCROLL_TARGET_CARDS', '0'))  # 0 = load until plateau
+    SCROLL_TIMEOUT = float(os.getenv('SCROLL_TIMEOUT', '30'))
+    SCROLL_PLATEAU_SCROLLS = int(os.getenv('SCROLL_PLATEAU_SCROLLS', '2'))
+    
+    # Card Pre-filter
+    MAX_POSTING_AGE_DAYS = int(os.getenv('MAX_POSTING_AGE_DAYS', '0'))  # 0 = no age limit
+    
+    # Seen-jobs Bloom filter
+    SEEN_JOBS_PATH = os.getenv('SEEN_JOBS_PATH', 'database/seen_jobs.bloom')
+    SEEN_JOBS_CAPACITY = int(os.getenv('SEEN_JOBS_CAPACITY', '1000000'))
+    SEEN_JOBS_ERROR_RATE = float(os.getenv('SEEN_JOBS_ERROR_RATE', '0.001'))
+    
+    # Persistent Caches (SQLite tables with LRU eviction)
+    CACHE_DB_PATH = os.getenv('CACHE_DB_PATH', 'database/cache.db')
+    FILL_PLAN_CACHE_ENABLED = os.getenv('FILL_PLAN_CACHE_ENABLED', 'True').lower() == 'true'
+    FILL_PLAN_CACHE_MAX_ENTRIES = int(os.getenv('FILL_PLAN_CACHE_MAX_ENTRIES', '5000'))  # form steps remembered
+    FILL_PLAN_CACHE_TTL = float(os.getenv('FILL_PLAN_CACHE_TTL', '2592000'))  # 30 days
+    SCREENING_CACHE_ENABLED = os.getenv('SCREENING_CACHE_ENABLED', 'True').lower() == 'true'
+    SCREENING_CACHE_MAX_ENTRIES = int(os.getenv('SCREENING_CACHE_MAX_ENTRIES', '20000'))
+    SCREENING_CACHE_TTL = float(os.getenv('SCREENING_CACHE_TTL', '7776000'))  # 90 days
+    SCREENING_CACHE_SIMILARITY = float(os.getenv('SCREENING_CACHE_SIMILARITY', '0.75'))  # shingle Jaccard for re-worded questions
+    RESUME_CACHE_ENABLED = os.getenv('RESUME_CACHE_ENABLED', 'True').lower() == 'true'
+    RESUME_CACHE_MAX_BYTES = int(os.getenv('RESUME_CACHE_MAX_BYTES', '67108864'))  # 64 MiB
+    
+    # Fixture Recording (empty = disabled)
+    RECORD_FIXTURES_DIR = os.getenv('RECORD_FIXTURES_DIR', '')
+    
+    # Resource Blocking
+    RESOURCE_BLOCKING = os.getenv('RESOURCE_BLOCKING', 'True').lower() == 'true'
+    BLOCKED_RESOURCE_TYPES = os.getenv('BLOCKED_RESOURCE_TYPES', 'images,media,fonts,analytics')
+    PAGE_WEIGHT_REPORTS = os.getenv('PAGE_WEIGHT_REPORTS', 'False').lower() == 'true'  # needs Chrome's performance log
@@ -0,0 +1,124 @@
+import logging
+import time
+from concurrent.futures import Future
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple, Union
+
+from selenium.common.exceptions import WebDriverException
+
+from .config import Config
+from .extraction import JOB_DETAIL_FIELDS
+from .instrumentation import instrumented
+
+if TYPE_CHECKING:
+    from .browser import Browser
+
+
+class DetailFetcher:
+    """Loads job detail pages concurrently in background tabs of a single driver."""
+
+    def __init__(self, browser: 'Browser', parallelism: int = Config.DETAIL_TAB_PARALLELISM) -> None:
+        self.browser = browser
+        self.parallelism = max(1, parallelism)
+        self.logger = logging.getLogger(__name__)
+
+    @instrumented('fetch_details')
+    def fetch(
+        self,
+        urls: List[str],
+        fields: Dict[str, str] = JOB_DETAIL_FIELDS,
+        ready_selector: Optional[str] = None
+    ) -> List[Optional[dict]]:
+        """Extract one record per URL, in input order; failed pages yield None."""
+        driver = self.browser.driver
+        origin = driver.current_window_handle
+        ready_selector = ready_selector or fields.get('title')
+        results: List[Union[None, dict, Tuple[Future, str]]] = [None] * len(urls)
+        start = time.monotonic()
+
+        for offset in range(0, len(urls), self.parallelism):
+            batch = urls[offset:offset + self.parallelism]
+            # Every tab starts loading before we wait on any of them
+            tabs = [(offset + i, self._open_tab(url)) for i, url in enumerate(batch)]
+            for index, handle in tabs:
+                if handle is None:
+                    continue
+                try:
+                    driver.switch_to.window(handle)
+                    results[index] = self._extract(urls[index], fields, ready_selector)
+                except WebDriverException as e:
+                    self.logger.error(f"Failed to load job details from {urls[index]}: {str(e)}")
+                finally:
+                    self._close_tab(handle)
+            driver.switch_to.window(origin)
+
+        records = [self._resolve(result) for result in results]
+        self.logger.info(
+            f"Fetched {sum(1 for r in records if r)}/{len(urls)} job details in "
+            f"{time.monotonic() - start:.1f}s with {self.parallelism} tabs"
+        )
+        return records
+
+    def _open_tab(self, url: str) -> Optional[str]:
+        """Open url in a new tab and return its window handle.
+
+        The tab opens blank first: resource blocking is set per CDP target, so
+        the policy has to be applied to the new tab before its page loads.
+        """
+        driver = self.browser.driver
+        try:
+            before = set(driver.window_handles)
+            driver.execute_script("window.open(arguments[0], '_blank');", 'about:blank')
+            new_handles = [h for h in driver.window_handles if h not in before]
+            if not new_handles:
+                return None
+            driver.switch_to.window(new_handles[0])
+            self.browser.apply_active_policy()
+            rewriter = self.browser.url_rewriter
+            # Assigning location returns at once, so the next tab starts loading without waiting
+            driver.execute_script("window.location.href = arguments[0];", rewriter(url) if rewriter else url)
+            self.browser.pages_loaded += 1
+            return new_handles[0]
+        except WebDriverException as e:
+            self.logger.error(f"Failed to open tab for {url}: {str(e)}")
+            return None
+
+    def _extract(self, url: str, fields: Dict[str, str],
+                 ready_selector: Optional[str]) -> Union[dict, Tuple[Future, str]]:
+        """Wait for the focused tab to be ready and extract (or queue parsing of) its record."""
+        readiness = self.browser.readiness
+        readiness.wait_for_ready_state('job_detail')
+        if ready_selector:
+            readiness.wait_for_selector(ready_selector, 'job_detail')
+        self.browser.record_page(url, 'job_detail')
+
+        if self.browser.extraction_mode == 'html':
+            html, url = self.browser.snapshot()
+            return self.browser.html_extractor.submit(html, None, fields, base_url=url), url
+
+        record = self.browser.extract_record(fields)
+        record['url'] = self.browser.driver.current_url
+        return record
+
+    def _close_tab(self, handle: str) -> None:
+        """Close a detail tab, ignoring tabs that are already gone."""
+        driver = self.browser.driver
+        try:
+            if driver.current_window_handle != handle:
+                driver.switch_to.window(handle)
+            driver.close()
+        except WebDriverException:
+            pass
+
+    def _resolve(self, result: Union[None, dict, Tuple[Future, str]]) -> Optional[dict]:
+        """Turn a record or a pending parse into a plain record."""
+        if not isinstance(result, tuple):
+            return result
+        future, url = result
+        try:
+            records = future.result()
+        except Exception as e:
+            self.logger.error(f"Failed to parse job details: {str(e)}")
+            return None
+        record = records[0] if records else {}
+        record['url'] = url
+        return record
@@ -0,0 +1,527 @@
+import hashlib
+import json
+import logging
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.webelement import WebElement
+
+from .cache_store import CacheStore
+from .config import Config
+
+EASY_APPLY_MODAL_SELECTOR = ".jobs-easy-apply-modal"
+
+SUCCESS_SELECTOR = ".artdeco-toast-item--success, .artdeco-inline-feedback--success"
+SUCCESS_PHRASES = ['application submitted', 'application was sent', 'applied', 'success']
+
+# Checked in order; the first visible button whose label names a role wins
+STEP_BUTTON_SELECTORS = [
+    "button[aria-label*='Submit application']",
+    "button[aria-label*='Next']",
+    "button[aria-label*='Review']",
+    "footer button",
+]
+STEP_BUTTON_ROLES = ['submit', 'review', 'next', 'apply']
+
+# Reads everything the flow loop needs about the current modal step in one round trip
+MODAL_STEP_SCRIPT = """
+const [modalSelector, successSelector, successPhrases, buttonSelectors, roles, preferredRole] = arguments;
+const visible = el => !!(el.offsetWidth || el.offsetHeight || el.getClientRects().length);
+const text = el => (el.innerText || el.textContent || '').replace(/\\s+/g, ' ').trim();
+
+const success = Array.from(document.querySelectorAll(successSelector))
+    .some(el => successPhrases.some(p => text(el).toLowerCase().includes(p)));
+
+const modal = document.querySelector(modalSelector);
+const step = {present: !!modal, success: success, button: null, role: null,
+              required_empty: [], errors: []};
+if (!modal) return step;
+
+const pick = wanted => {
+    for (const selector of buttonSelectors) {
+        for (const btn of modal.querySelectorAll(selector)) {
+            if (!visible(btn) || btn.disabled) continue;
+            const label = (text(btn) + ' ' + (btn.getAttribute('aria-label') || '')).toLowerCase();
+            const role = wanted.find(r => label.includes(r));
+            if (role) return [btn, role];
+        }
+    }
+    return null;
+};
+// A step that advanced with a known button before is advanced with that button again
+const picked = (preferredRole && pick([preferredRole])) || pick(roles);
+if (picked) [step.button, step.role] = picked;
+
+const labelFor = el => {
+    const byFor = el.id && modal.querySelector(`label[for="${CSS.escape(el.id)}"]`);
+    if (byFor) return text(byFor);
+    if (el.getAttribute('aria-label')) return el.getAttribute('aria-label').trim();
+    const group = el.closest('fieldset');
+    const legend = group && group.querySelector('legend');
+    return legend ? text(legend) : (el.name || el.id || el.tagName.toLowerCase());
+};
+const seenGroups = new Set();
+for (const el of modal.querySelectorAll('input, select, textarea')) {
+    if (!(el.required || el.getAttribute('aria-required') === 'true') || !visible(el)) continue;
+    let empty;
+    if (el.type === 'radio') {
+        if (seenGroups.has(el.name)) continue;
+        seenGroups.add(el.name);
+        empty = !modal.querySelector(`input[type="radio"][name="${CSS.escape(el.name)}"]:checked`);
+    } else if (el.type === 'checkbox') {
+        empty = !el.checked;
+    } else {
+        empty = !String(el.value || '').trim();
+    }
+    if (empty) step.required_empty.push(labelFor(el));
+}
+
+step.errors = Array.from(modal.querySelectorAll('.artdeco-inline-feedback--error, [role="alert"]'))
+    .filter(visible).map(text).filter(Boolean);
+return step;
+"""
+
+
+@dataclass
+class ModalStep:
+    """Actionable state of one Easy Apply modal step."""
+
+    present: bool = False
+    success: bool = False
+    button: Optional[WebElement] = None
+    role: Optional[str] = None
+    required_empty: List[str] = field(default_factory=list)
+    errors: List[str] = field(default_factory=list)
+
+    @property
+    def blocked(self) -> bool:
+        """The step cannot advance until fields are filled or errors resolved."""
+        return bool(self.required_empty or self.errors)
+
+
+def inspect_modal_step(driver, preferred_role: Optional[str] = None) -> ModalStep:
+    """Snapshot the Easy Apply modal with a single script call, preferring a button of preferred_role."""
+    result = driver.execute_script(
+        MODAL_STEP_SCRIPT, EASY_APPLY_MODAL_SELECTOR, SUCCESS_SELECTOR,
+        SUCCESS_PHRASES, STEP_BUTTON_SELECTORS, STEP_BUTTON_ROLES, preferred_role
+    )
+    if not result:
+        return ModalStep()
+    return ModalStep(
+        present=bool(result.get('present')),
+        success=bool(result.get('success')),
+        button=result.get('button'),
+        role=result.get('role'),
+        required_empty=list(result.get('required_empty') or []),
+        errors=list(result.get('errors') or []),
+    )
+
+
+FIELD_KEY_ATTRIBUTE = "data-bot-field"
+
+# Describes every fillable control under the root and tags it with a key for the fill call
+FORM_FIELDS_SCRIPT = """
+const [rootSelector, keyAttr] = arguments;
+const root = rootSelector ? document.querySelector(rootSelector) : document;
+// The modal is gone (e.g. after the final submit): never fall back to the whole page
+if (!root) return [];
+const text = el => (el.innerText || el.textContent || '').replace(/\\s+/g, ' ').trim();
+const visible = el => !!(el.offsetWidth || el.offsetHeight || el.getClientRects().length);
+const labelOf = el => {
+    const byFor = el.id && root.querySelector(`label[for="${CSS.escape(el.id)}"]`);
+    if (byFor && text(byFor)) return text(byFor);
+    if (el.getAttribute('aria-label')) return el.getAttribute('aria-label').trim();
+    const labelledBy = el.getAttribute('aria-labelledby');
+    if (labelledBy) {
+        const parts = labelledBy.split(/\\s+/).map(id => document.getElementById(id)).filter(Boolean);
+        if (parts.length) return parts.map(text).join(' ');
+    }
+    const wrapping = el.closest('label');
+    if (wrapping && text(wrapping)) return text(wrapping);
+    const group = el.closest('fieldset');
+    const legend = group && group.querySelector('legend');
+    return legend ? text(legend) : (el.placeholder || el.name || '');
+};
+
+// "Select an option" placeholders count as empty
+const selectedText = el => {
+    const option = el.options[el.selectedIndex];
+    const label = option ? option.text.trim() : '';
+    return el.selectedIndex <= 0 && /^select\b/i.test(label) ? '' : label;
+};
+
+const fields = [];
+const radioGroups = {};
+let index = 0;
+for (const el of root.querySelectorAll('input, select, textarea')) {
+    const type = el.tagName === 'INPUT' ? (el.type || 'text').toLowerCase() : el.tagName.toLowerCase();
+    if (['hidden', 'submit', 'button', 'image', 'reset'].includes(type) || el.disabled) continue;
+    // Styled radios and checkboxes hide the native input behind their label
+    if (!['radio', 'checkbox'].includes(type) && !visible(el)) continue;
+    const required = el.required || el.getAttribute('aria-required') === 'true';
+
+    if (type === 'radio') {
+        const name = el.name || `radio-${index}`;
+        const optionLabel = text(el.closest('label') || {}) ||
+            text(root.querySelector(`label[for="${CSS.escape(el.id || '')}"]`) || {}) || el.value;
+        let group = radioGroups[name];
+        if (!group) {
+            const fieldset = el.closest('fieldset');
+            const legend = fieldset && fieldset.querySelector('legend');
+            group = radioGroups[name] = {
+                key: String(index++), tag: 'input', type: 'radio', name: name,
+                label: legend ? text(legend) : name, required: required,
+                options: [], value: null, typeahead: false,
+            };
+            fields.push(group);
+        }
+        el.setAttribute(keyAttr, `${group.key}:${group.options.length}`);
+        group.options.push(optionLabel);
+        group.required = group.required || required;
+        if (el.checked) group.value = optionLabel;
+        continue;
+    }
+
+    const key = String(index++);
+    el.setAttribute(keyAttr, key);
+    fields.push({
+        key: key,
+        tag: el.tagName.toLowerCase(),
+        type: type,
+        name: el.name || el.id || '',
+        label: labelOf(el),
+        required: required,
+        options: type === 'select' ? Array.from(el.options).map(o => o.text.trim()) : [],
+        value: type === 'checkbox' ? (el.checked ? 'true' : '') : type === 'select' ? selectedText(el) : el.value,
+        typeahead: el.getAttribute('role') === 'combobox' || !!el.getAttribute('aria-autocomplete'),
+    });
+}
+return fields;
+"""
+
+# Applies every planned value with the native setters plus the events frameworks listen for;
+# returns the keys whose value did not stick
+FILL_FORM_SCRIPT = """
+const [rootSelector, keyAttr, fills] = arguments;
+const root = rootSelector ? document.querySelector(rootSelector) : document;
+if (!root) return [];
+const fire = (el, ...types) => types.forEach(t => el.dispatchEvent(new Event(t, {bubbles: true})));
+const setNative = (el, value) => {
+    const proto = el.tagName === 'TEXTAREA' ? HTMLTextAreaElement.prototype
+        : el.tagName === 'SELECT' ? HTMLSelectElement.prototype : HTMLInputElement.prototype;
+    Object.getOwnPropertyDescriptor(proto, 'value').set.call(el, value);
+};
+const failed = [];
+for (const [key, fill] of Object.entries(fills)) {
+    try {
+        if (fill.type === 'radio') {
+            const el = root.querySelector(`[${keyAttr}="${key}:${fill.option}"]`);
+            el.click();
+            if (!el.checked) failed.push(key);
+            continue;
+        }
+        const el = root.querySelector(`[${keyAttr}="${key}"]`);
+        if (!el) { failed.push(key); continue; }
+        el.focus();
+        if (fill.type === 'checkbox') {
+            if (el.checked !== fill.value) el.click();
+            if (el.checked !== fill.value) failed.push(key);
+        } else if (fill.type === 'select') {
+            const option = Array.from(el.options).find(o => o.text.trim() === fill.value);
+            if (!option) { failed.push(key); continue; }
+            setNative(el, option.value);
+            fire(el, 'input', 'change');
+            if (el.value !== option.value) failed.push(key);
+        } else {
+            setNative(el, fill.value);
+            fire(el, 'input', 'change');
+            if (el.value !== fill.value) failed.push(key);
+        }
+        el.blur();
+        fire(el, 'blur');
+    } catch (e) {
+        failed.push(key);
+    }
+}
+return failed;
+"""
+
+# Label keywords answered straight from the applicant profile, checked in order
+PROFILE_ANSWERS = [
+    ('first_name', ('first name',)),
+    ('last_name', ('last name', 'surname', 'family name')),
+    ('name', ('full name', 'your name', 'name')),
+    ('email', ('email',)),
+    ('phone', ('phone', 'mobile')),
+    ('experience_years', ('years of experience', 'how many years')),
+]
+
+# How each profile answer is read from the profile; fill plans refer to these names
+PROFILE_SOURCES: Dict[str, Callable[[Dict[str, Any]], Any]] = {
+    'first_name': lambda p: (p.get('name') or '').split(' ')[0],
+    'last_name': lambda p: ' '.join((p.get('name') or '').split(' ')[1:]),
+    'name': lambda p: p.get('name'),
+    'email': lambda p: p.get('email'),
+    'phone': lambda p: p.get('phone'),
+    'experience_years': lambda p: p.get('experience_years'),
+}
+
+
+@dataclass
+class FormField:
+    """One fillable control (or radio group) of an application form."""
+
+    key: str
+    tag: str
+    type: str
+    name: str
+    label: str
+    required: bool = False
+    options: List[str] = field(default_factory=list)
+    value: Optional[str] = None
+    typeahead: bool = False
+
+    @property
+    def empty(self) -> bool:
+        return not (self.value or '').strip()
+
+
+def collect_form_fields(driver, root_selector: Optional[str] = EASY_APPLY_MODAL_SELECTOR) -> List[FormField]:
+    """Describe every visible form control under root_selector in one script call."""
+    raw = driver.execute_script(FORM_FIELDS_SCRIPT, root_selector, FIELD_KEY_ATTRIBUTE) or []
+    return [FormField(**{**item, 'label': item.get('label') or ''}) for item in raw]
+
+
+def profile_source(form_field: FormField) -> Optional[str]:
+    """Name of the profile value a field asks for, or None if it is not a profile question."""
+    label = form_field.label.lower()
+    for source, keywords in PROFILE_ANSWERS:
+        if any(keyword in label for keyword in keywords):
+            return source
+    return None
+
+
+def resolve_profile_source(source: str, profile: Dict[str, Any]) -> Optional[str]:
+    """Value of a named profile source, or None if the profile lacks it."""
+    read = PROFILE_SOURCES.get(source)
+    value = read(profile) if read else None
+    return str(value) if value not in (None, '') else None
+
+
+def profile_answer(form_field: FormField, profile: Dict[str, Any]) -> Optional[str]:
+    """Answer a field from the applicant profile alone, or None if it is not a profile question."""
+    source = profile_source(form_field)
+    return resolve_profile_source(source, profile) if source else None
+
+
+def field_signatures(fields: List[FormField]) -> Dict[str, str]:
+    """Stable name of each field across page loads, keyed by its per-page key.
+
+    Built from what the applicant sees (type, label, options); element names
+    and ids are left out because LinkedIn embeds the job id in them.
+    """
+    signatures: Dict[str, str] = {}
+    seen: Dict[str, int] = {}
+    for form_field in fields:
+        base = "|".join([form_field.type, form_field.label.strip().lower(), "/".join(form_field.options)])
+        seen[base] = seen.get(base, 0) + 1
+        signatures[form_field.key] = base if seen[base] == 1 else f"{base}#{seen[base]}"
+    return signatures
+
+
+def form_fingerprint(signatures: Dict[str, str], profile: Dict[str, Any]) -> str:
+    """Cache key of a form step's field set for one applicant."""
+    # Stored answers are the applicant's own, so plans are never shared between applicants
+    applicant = str(profile.get('email') or profile.get('name') or '')
+    payload = json.dumps([applicant, sorted(signatures.values())])
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+_fill_plans: Optional[CacheStore] = None
+_fill_plans_lock = threading.Lock()
+
+
+def get_fill_plans() -> Optional[CacheStore]:
+    """Return the process-wide fill plan cache, or None when it is disabled."""
+    global _fill_plans
+    if not Config.FILL_PLAN_CACHE_ENABLED:
+        return None
+    with _fill_plans_lock:
+        if _fill_plans is None:
+            _fill_plans = CacheStore(
+                'fill_plans',
+                max_entries=Config.FILL_PLAN_CACHE_MAX_ENTRIES,
+                ttl=Config.FILL_PLAN_CACHE_TTL
+            )
+        return _fill_plans
+
+
+def match_option(answer: str, options: List[str]) -> Optional[int]:
+    """Index of the option an answer refers to, preferring exact matches."""
+    wanted = answer.strip().lower()
+    lowered = [option.strip().lower() for option in options]
+    if wanted in lowered:
+        return lowered.index(wanted)
+    for index, option in enumerate(lowered):
+        if option and (option in wanted or wanted in option):
+            return index
+    return None
+
+
+class FormFiller:
+    """Fills an application form with one read and one write round trip.
+
+    Answers come from the profile first; the remaining empty questions are
+    handed to answer_questions together, so callers can answer them in one
+    batch (e.g. concurrent AI calls). Fields a page only accepts through
+    real key events are typed with send_keys afterwards.
+
+    With a plan cache, the resolved answer source of every field (a profile
+    value or a stored answer) is kept per form step, together with the
+    button that advanced it, so a step seen before is filled again without
+    classifying its fields or asking for answers.
+    """
+
+    def __init__(
+        self,
+        driver,
+        answer_questions: Optional[Callable[[List[FormField]], List[Optional[str]]]] = None,
+        plans: Optional[CacheStore] = None
+    ) -> None:
+        self.driver = driver
+        self.answer_questions = answer_questions
+        self.plans = plans
+        self.logger = logging.getLogger(__name__)
+        # Plan of the step filled last: {'fields': {signature: entry}, 'button': role}
+        self.fingerprint: Optional[str] = None
+        self.step_plan: Optional[Dict[str, Any]] = None
+        self.replayed_steps = 0
+
+    def fill(self, profile: Dict[str, Any], root_selector: Optional[str] = EASY_APPLY_MODAL_SELECTOR) -> Dict[str, int]:
+        """Fill every empty field under root_selector; return counts of what happened."""
+        all_fields = [f for f in collect_form_fields(self.driver, root_selector) if f.type != 'file']
+        fields = [f for f in all_fields if f.empty]
+        signatures = field_signatures(all_fields)
+
+        self.fingerprint = form_fingerprint(signatures, profile) if self.plans is not None and all_fields else None
+        cached = self.plans.get(self.fingerprint) if self.fingerprint else None
+        self.step_plan = cached or {'fields': {}, 'button': None}
+        entries = dict(self.step_plan['fields'])
+
+        answers: Dict[str, str] = {}
+        questions = []
+        replayed = 0
+        for form_field in fields:
+            signature = signatures[form_field.key]
+            entry = entries.get(signature)
+            if entry is not None:
+                answer = self._replay(entry, profile)
+                if answer is not None or 'skip' in entry:
+                    replayed += 1
+                    if answer is not None:
+                        answers[form_field.key] = answer
+                    continue
+
+            source = profile_source(form_field)
+            answer = resolve_profile_source(source, profile) if source else None
+            if answer is not None:
+                answers[form_field.key] = answer
+                entries[signature] = {'profile': source}
+            elif form_field.required:
+                # Optional questions are left blank rather than spending an AI call on them
+                questions.append(form_field)
+            elif source is None:
+                entries[signature] = {'skip': True}
+
+        if questions and self.answer_questions:
+            for form_field, answer in zip(questions, self.answer_questions(questions)):
+                if answer:
+                    answers[form_field.key] = answer
+                    entries[signatures[form_field.key]] = {'answer': answer}
+
+        by_key = {f.key: f for f in fields}
+        fills, typed = self.plan(by_key, answers)
+        failed = self.driver.execute_script(
+            FILL_FORM_SCRIPT, root_selector, FIELD_KEY_ATTRIBUTE, fills
+        ) if fills else []
+        fallback = typed + [by_key[key] for key in failed or [] if by_key[key].type not in ('radio', 'checkbox', 'select')]
+        for form_field in fallback:
+            self._type(form_field, answers[form_field.key])
+
+        if self.fingerprint and entries != self.step_plan['fields']:
+            self.step_plan = {'fields': entries, 'button': self.step_plan.get('button')}
+            self.plans.put(self.fingerprint, self.step_plan)
+        if cached and not questions:
+            self.replayed_steps += 1
+
+        result = {
+            'fields': len(fields),
+            'answered': len(answers),
+            'batched': len(fills) - len(failed or []),
+            'typed': len(fallback),
+            'unanswered': len(fields) - len(answers),
+            'replayed': replayed,
+        }
+        self.logger.info(f"Form fill: {result}")
+        return result
+
+    @property
+    def planned_button(self) -> Optional[str]:
+        """Role of the button that advanced the last filled step before, if known."""
+        return self.step_plan.get('button') if self.step_plan else None
+
+    def remember_button(self, role: Optional[str]) -> None:
+        """Store which button advanced the last filled step."""
+        if not self.fingerprint or not role or self.planned_button == role:
+            return
+        self.step_plan = {**self.step_plan, 'button': role}
+        self.plans.put(self.fingerprint, self.step_plan)
+
+    def forget_plan(self) -> None:
+        """Drop the last step's plan, e.g. after the page rejected the replayed answers."""
+        if self.fingerprint:
+            self.plans.delete(self.fingerprint)
+        self.fingerprint = None
+        self.step_plan = None
+
+    @staticmethod
+    def _replay(entry: Dict[str, Any], profile: Dict[str, Any]) -> Optional[str]:
+        """Answer a stored plan entry gives for this profile, or None."""
+        if 'profile' in entry:
+            return resolve_profile_source(entry['profile'], profile)
+        return entry.get('answer')
+
+    def plan(self, by_key: Dict[str, FormField], answers: Dict[str, str]) -> tuple:
+        """Split answers into script fills and fields that need real key events."""
+        fills: Dict[str, dict] = {}
+        typed: List[FormField] = []
+        for key, answer in answers.items():
+            form_field = by_key[key]
+            if form_field.type in ('radio', 'select'):
+                option = match_option(answer, form_field.options)
+                if option is None:
+                    self.logger.warning(f"No option of {form_field.label!r} matches {answer!r}")
+                    continue
+                if form_field.type == 'radio':
+                    fills[key] = {'type': 'radio', 'option': option}
+                else:
+                    fills[key] = {'type': 'select', 'value': form_field.options[option]}
+            elif form_field.type == 'checkbox':
+                fills[key] = {'type': 'checkbox', 'value': answer.strip().lower() in ('yes', 'true', '1', 'y')}
+            elif form_field.typeahead:
+                # Typeaheads only search on real keystrokes
+                typed.append(form_field)
+            else:
+                fills[key] = {'type': form_field.type, 'value': answer}
+        return fills, typed
+
+    def _type(self, form_field: FormField, value: str) -> None:
+        """Per-field fallback through WebDriver key events."""
+        try:
+            element = self.driver.find_element(By.CSS_SELECTOR, f'[{FIELD_KEY_ATTRIBUTE}="{form_field.key}"]')
+            element.clear()
+            element.send_keys(value)
+        except Exception as e:
+            self.logger.warning(f"Could not type into {form_field.label!r}: {str(e)}")
@@ -0,0 +1,163 @@
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Dict, List, Optional
+from urllib.parse import urljoin
+
+from bs4 import BeautifulSoup
+
+from .config import Config
+
+# Field specs map a record key to "css selector", "css selector@attribute" or "@attribute"
+# (read from the item itself). Text fields use the element's rendered, stripped text.
+JOB_CARD_SELECTOR = ".job-card-container"
+
+# Read from the list card so stale or non-Easy-Apply postings can be skipped before any detail load
+CARD_FILTER_FIELDS: Dict[str, str] = {
+    'posted': 'time',
+    'posted_at': 'time@datetime',
+    'easy_apply_badge': '.job-card-container__apply-method',
+}
+
+JOB_CARD_FIELDS: Dict[str, str] = {
+    'title': 'h3.job-card-list__title',
+    'company': 'h4.job-card-container__company-name',
+    'location': '.job-card-container__metadata-item',
+    'url': 'a.job-card-list__title@href',
+    **CARD_FILTER_FIELDS,
+}
+
+# Location is often missing on remote postings; those cards are still worth keeping
+JOB_CARD_REQUIRED_FIELDS = ['title', 'company', 'url']
+
+SEARCH_RESULT_CARD_SELECTOR = ".jobs-search-results__list-item"
+
+SEARCH_RESULT_CARD_FIELDS: Dict[str, str] = {
+    'job_id': '@data-occludable-job-id',
+    'title': '.job-card-list__title',
+    'url': "a[href*='/jobs/view/']@href",
+    **CARD_FILTER_FIELDS,
+}
+
+JOB_DETAIL_FIELDS: Dict[str, str] = {
+    'title': '.jobs-unified-top-card__job-title',
+    'company': '.jobs-unified-top-card__company-name',
+    'location': '.jobs-unified-top-card__workplace-type',
+    'description': '.jobs-description__content',
+}
+
+EASY_APPLY_DETAIL_FIELDS: Dict[str, str] = {
+    **JOB_DETAIL_FIELDS,
+    'apply_label': 'button.jobs-apply-button@aria-label',
+}
+
+# Runs every field selector for every item in the page and returns plain JSON records
+BULK_EXTRACT_SCRIPT = """
+const [rootSelector, itemSelector, fields, limit] = arguments;
+const root = rootSelector ? document.querySelector(rootSelector) : document;
+if (!root) return [];
+let items = itemSelector
+    ? Array.from(root.querySelectorAll(itemSelector))
+    : [root === document ? document.documentElement : root];
+if (limit) items = items.slice(0, limit);
+return items.map(item => {
+    const record = {};
+    for (const [name, spec] of Object.entries(fields)) {
+        const el = spec.selector ? item.querySelector(spec.selector) : item;
+        if (!el) {
+            record[name] = null;
+        } else if (!spec.attr) {
+            record[name] = (el.innerText || el.textContent || '').trim();
+        } else if (spec.attr === 'href' && el.href) {
+            record[name] = el.href;
+        } else {
+            record[name] = el.getAttribute(spec.attr);
+        }
+    }
+    return record;
+});
+"""
+
+
+# Returns the rendered document and its final URL in one round trip
+PAGE_SNAPSHOT_SCRIPT = "return [document.documentElement.outerHTML, location.href];"
+
+
+def parse_field_spec(spec: str) -> Dict[str, Optional[str]]:
+    """Split a "selector@attr" field spec into its selector and attribute parts."""
+    selector, _, attr = spec.rpartition('@') if '@' in spec else (spec, '', '')
+    return {'selector': selector.strip() or None, 'attr': attr.strip() or None}
+
+
+def compile_fields(fields: Dict[str, str]) -> Dict[str, Dict[str, Optional[str]]]:
+    """Compile a declarative field -> selector map into the form the extractors expect."""
+    return {name: parse_field_spec(spec) for name, spec in fields.items()}
+
+
+def complete_records(records: List[dict], required: List[str]) -> List[dict]:
+    """Drop records that are missing any of the required fields."""
+    return [record for record in records if all(record.get(key) for key in required)]
+
+
+def parse_records(
+    html: str,
+    item_selector: Optional[str],
+    fields: Dict[str, str],
+    root_selector: Optional[str] = None,
+    limit: Optional[int] = None,
+    base_url: Optional[str] = None
+) -> List[dict]:
+    """Extract records from an HTML snapshot with the same field specs as the live extractor."""
+    soup = BeautifulSoup(html, 'lxml')
+    root = soup.select_one(root_selector) if root_selector else soup
+    if root is None:
+        return []
+    items = root.select(item_selector) if item_selector else [root]
+    if limit:
+        items = items[:limit]
+
+    compiled = compile_fields(fields)
+    records = []
+    for item in items:
+        record = {}
+        for name, spec in compiled.items():
+            element = item.select_one(spec['selector']) if spec['selector'] else item
+            if element is None:
+                record[name] = None
+            elif not spec['attr']:
+                record[name] = ' '.join(element.get_text(' ').split())
+            elif spec['attr'] == 'href' and element.get('href'):
+                record[name] = urljoin(base_url or '', element['href'])
+            else:
+                value = element.get(spec['attr'])
+                record[name] = ' '.join(value) if isinstance(value, list) else value
+        records.append(record)
+    return records
+
+
+class HtmlExtractor:
+    """Parses page snapshots in a worker pool so parsing overlaps the next navigation."""
+
+    def __init__(
+        self,
+        workers: int = Config.EXTRACTION_WORKERS,
+        use_processes: bool = Config.EXTRACTION_USE_PROCESSES
+    ) -> None:
+        executor_class = ProcessPoolExecutor if use_processes else ThreadPoolExecutor
+        self._executor: Executor = executor_class(max_workers=workers)
+
+    def submit(
+        self,
+        html: str,
+        item_selector: Optional[str],
+        fields: Dict[str, str],
+        root_selector: Optional[str] = None,
+        limit: Optional[int] = None,
+        base_url: Optional[str] = None
+    ) -> Future:
+        """Schedule parse_records on a snapshot and return a future for its records."""
+        return self._executor.submit(
+            parse_records, html, item_selector, fields, root_selector, limit, base_url
+        )
+
+    def shutdown(self) -> None:
+        """Wait for queued parses and stop the workers."""
+        self._executor.shutdown(wait=True)
@@ -0,0 +1,186 @@
+import functools
+import logging
+import math
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, Generator, List, Optional, Tuple
+
+UNATTRIBUTED = '(unattributed)'
+
+
+def percentile(samples: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of a list of samples."""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    return ordered[max(0, math.ceil(fraction * len(ordered)) - 1)]
+
+
+class DriverStats:
+    """Counts and times every WebDriver command, grouped by the operation that issued it."""
+
+    def __init__(self) -> None:
+        self.logger = logging.getLogger(__name__)
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self.reset()
+
+    def reset(self) -> None:
+        """Start a new run."""
+        with self._lock:
+            self.started_at = time.monotonic()
+            self.commands: Dict[Tuple[str, str], List[float]] = defaultdict(list)
+            self.sleeping: Dict[str, float] = defaultdict(float)
+            self.waiting: Dict[str, float] = defaultdict(float)
+
+    @property
+    def current_operation(self) -> str:
+        """Innermost operation active on this thread."""
+        stack = getattr(self._local, 'stack', None)
+        return stack[-1] if stack else UNATTRIBUTED
+
+    @contextmanager
+    def operation(self, name: str) -> Generator[None, None, None]:
+        """Attribute commands, sleeps and waits issued inside the block to name."""
+        stack = getattr(self._local, 'stack', None)
+        if stack is None:
+            stack = self._local.stack = []
+        stack.append(name)
+        try:
+            yield
+        finally:
+            stack.pop()
+
+    def instrument(self, driver) -> None:
+        """Route every command the driver sends to chromedriver through the stats."""
+        if getattr(driver, '_driver_stats', None) is self:
+            return
+        execute = driver.execute
+
+        @functools.wraps(execute)
+        def timed_execute(driver_command, params=None):
+            start = time.perf_counter()
+            try:
+                return execute(driver_command, params)
+            finally:
+                self.record_command(driver_command, time.perf_counter() - start)
+
+        driver.execute = timed_execute
+        driver._driver_stats = self
+
+    def record_command(self, command: str, elapsed: float) -> None:
+        """Record one WebDriver round trip."""
+        with self._lock:
+            self.commands[(self.current_operation, command)].append(elapsed)
+
+    def record_wait(self, elapsed: float) -> None:
+        """Record time spent polling for a readiness condition."""
+        with self._lock:
+            self.waiting[self.current_operation] += elapsed
+
+    def sleep(self, seconds: float) -> None:
+        """Sleep and account the time to the current operation."""
+        time.sleep(seconds)
+        with self._lock:
+            self.sleeping[self.current_operation] += seconds
+
+    def summary(self) -> List[dict]:
+        """One row per operation: calls, total and p95 latency, sleeping and waiting time."""
+        with self._lock:
+            per_operation: Dict[str, List[float]] = defaultdict(list)
+            for (operation, _command), samples in self.commands.items():
+                per_operation[operation].extend(samples)
+            operations = set(per_operation) | set(self.sleeping) | set(self.waiting)
+            rows = [
+                {
+                    'operation': operation,
+                    'calls': len(per_operation[operation]),
+                    'total': sum(per_operation[operation]),
+                    'p95': percentile(per_operation[operation], 0.95),
+                    'sleeping': self.sleeping.get(operation, 0.0),
+                    'waiting': self.waiting.get(operation, 0.0),
+                }
+                for operation in operations
+            ]
+        return sorted(rows, key=lambda row: row['total'] + row['sleeping'], reverse=True)
+
+    def command_breakdown(self, top: int = 15) -> List[dict]:
+        """Most expensive (operation, command) pairs."""
+        with self._lock:
+            rows = [
+                {
+                    'operation': operation,
+                    'command': command,
+                    'calls': len(samples),
+                    'total': sum(samples),
+                    'p95': percentile(samples, 0.95),
+                }
+                for (operation, command), samples in self.commands.items()
+            ]
+        return sorted(rows, key=lambda row: row['total'], reverse=True)[:top]
+
+    def format_summary(self) -> str:
+        """Render the per-run summary as a plain-text table."""
+        wall = time.monotonic() - self.started_at
+        rows = self.summary()
+        working = sum(row['total'] for row in rows)
+        sleeping = sum(row['sleeping'] for row in rows)
+        waiting = sum(row['waiting'] for row in rows)
+
+        lines = [
+            f"Run wall time {wall:.1f}s: {working:.1f}s in WebDriver commands "
+            f"({waiting:.1f}s of it polling readiness), {sleeping:.1f}s sleeping",
+            "",
+            f"{'operation':<30} {'calls':>7} {'total s':>9} {'p95 ms':>8} {'sleep s':>8} {'wait s':>8}",
+        ]
+        for row in rows:
+            lines.append(
+                f"{row['operation']:<30} {row['calls']:>7} {row['total']:>9.2f} "
+                f"{row['p95'] * 1000:>8.0f} {row['sleeping']:>8.2f} {row['waiting']:>8.2f}"
+            )
+        lines += ["", f"{'operation':<30} {'command':<24} {'calls':>7} {'total s':>9} {'p95 ms':>8}"]
+        for row in self.command_breakdown():
+            lines.append(
+                f"{row['operation']:<30} {row['command']:<24} {row['calls']:>7} "
+                f"{row['total']:>9.2f} {row['p95'] * 1000:>8.0f}"
+            )
+        return "\n".join(lines)
+
+    def write_summary(self, logs_dir: Path = Path("logs")) -> Optional[Path]:
+        """Log the summary table and write it to a timestamped file under logs_dir."""
+        if not self.commands and not self.sleeping:
+            return None
+        table = self.format_summary()
+        self.logger.info(f"WebDriver round-trip summary:\n{table}")
+        logs_dir.mkdir(exist_ok=True)
+        path = logs_dir / f"driver_stats_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt"
+        path.write_text(table + "\n")
+        return path
+
+
+def _stats_for(owner) -> Optional[DriverStats]:
+    """Find the DriverStats of a Browser, or of an object holding one as .browser."""
+    stats = getattr(owner, 'stats', None)
+    if stats is None:
+        stats = getattr(getattr(owner, 'browser', None), 'stats', None)
+    return stats if isinstance(stats, DriverStats) else None
+
+
+def instrumented(name: Optional[str] = None) -> Callable:
+    """Method decorator that attributes the method's WebDriver commands to an operation."""
+    def decorator(func: Callable) -> Callable:
+        operation = name or func.__name__
+
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            stats = _stats_for(self)
+            if stats is None:
+                return func(self, *args, **kwargs)
+            with stats.operation(operation):
+                return func(self, *args, **kwargs)
+        return wrapper
+    return decorator
@@ -1,4 +1,4 @@
-from typing import List, Dict, Optional
+from typing import Iterator, List, Dict, Optional
 from bs4 import BeautifulSoup
 from datetime import datetime
 from selenium.webdriver.common.by import By
@@ -8,19 +8,82 @@ import os
 import time
 
 from .browser import Browser
+from .browser_pool import BrowserPool, get_browser_pool
 from .models import Job, SessionLocal
 from .ai_service import AIService
 from .config import Config
+from .extraction import JOB_CARD_FIELDS, JOB_CARD_REQUIRED_FIELDS, JOB_CARD_SELECTOR, complete_records
+from .card_filter import CardFilter
+from .seen_jobs import KnownJobs, job_stored
+from .search_grid import SearchGrid
+from .session_manager import get_session_manager
+from .easy_apply import EASY_APPLY_MODAL_SELECTOR, FormField, FormFiller, get_fill_plans
+from .answer_cache import ScreeningAnswerer, get_answer_cache, screening_prompt
+from .job_record import JobRecord
+from .instrumentation import instrumented
 
 class JobBot:
-    def __init__(self):
-        self.browser = Browser()
+    def __init__(self, pool: Optional[BrowserPool] = None, user_id: Optional[int] = None):
+        # Borrow a warm browser instead of launching Chrome for every run
+        self.pool = pool or get_browser_pool()
+        self.user_id = user_id
+        self.sessions = get_session_manager()
+        self.session_key = str(user_id) if user_id is not None else (os.getenv('LINKEDIN_EMAIL') or 'default')
+        self._session_unverified = False
+        self.browser: Browser = self.pool.acquire()
+        self.browser.stats.reset()
         self.ai_service = AIService()
         self.db = SessionLocal()
-        self._ensure_logged_in()
+        try:
+            # Postings already in the jobs table are dropped straight from the list cards;
+            # the Bloom filter answers misses and only its hits reach the database
+            self.browser.card_filter = CardFilter(known_ids=KnownJobs(confirm=self._job_stored))
+            self._ensure_logged_in()
+        except Exception:
+            self.close()
+            raise
     
+    def _job_stored(self, job_id: str) -> bool:
+        """Confirm a seen-jobs filter hit against the jobs table"""
+        return job_stored(job_id, self.db)
+    
+    @instrumented()
     def _ensure_logged_in(self):
-        """Ensure user is logged into LinkedIn"""
+        """Ensure user is logged into LinkedIn, reusing a recently validated session"""
+        if self.sessions.browser_is_current(self.browser, self.session_key):
+            print("\nLinkedIn session validated recently, skipping login check")
+            return
+        
+        session = self.sessions.restore(self.browser, self.session_key)
+        if self.sessions.is_fresh(session):
+            # No check now: the first real navigation doubles as the login check
+            print("\nRestored saved LinkedIn session")
+            self._session_unverified = True
+            return
+        
+        self._log_in()
+        self.sessions.save(self.browser, self.session_key)
+
+    def _confirm_session(self) -> bool:
+        """Check a restored session against the first page loaded; log in again if it was rejected.
+        
+        Returns True when a fresh login happened and the page has to be loaded again.
+        """
+        if not self._session_unverified:
+            return False
+        self._session_unverified = False
+        if not self.sessions.looks_logged_out(self.browser.driver.current_url):
+            self.sessions.save(self.browser, self.session_key)
+            return False
+        print("Saved LinkedIn session was rejected, logging in again...")
+        self.sessions.invalidate(self.browser, self.session_key)
+        self._log_in()
+        self.sessions.save(self.browser, self.session_key)
+        return True
+
+    @instrumented('ensure_logged_in')
+    def _log_in(self):
+        """Check the jobs page for a live session and walk through the login flow if there is none"""
         try:
             # First try to access jobs page to check if already logged in
             print("\nChecking LinkedIn login status...")
@@ -37,7 +100,7 @@ class JobBot:
                 print("Not logged in, starting login process...")
             
             # If not logged in, proceed with login
-            self.browser.navigate("https://www.linkedin.com/login")
+            self.browser.navigate("https://www.linkedin.com/login", ready_selector="#username")
             self.browser.random_delay()
             
             # Fill in email
@@ -141,7 +204,7 @@ class JobBot:
                     if retry_count < max_retries:
                         print(f"Login check attempt {retry_count} failed: {str(e)}")
                         print(f"Waiting {5 * retry_count} seconds before retry...")
-                        time.sleep(5 * retry_count)  # Increase wait time with each retry
+                        self.browser.stats.sleep(5 * retry_count)  # Increase wait time with each retry
                     else:
                         print("\nCould not verify successful login after multiple attempts.")
                         print("Please check:")
@@ -155,86 +218,155 @@ class JobBot:
             print(f"Error during LinkedIn login process: {str(e)}")
             raise
 
-    def search_jobs(self, keywords: List[str], locations: List[str]) -> List[Dict]:
+    @instrumented()
+    def search_jobs(self, keywords: List[str], locations: List[str]) -> List[JobRecord]:
         """Search for jobs matching keywords and locations"""
+        if Config.SEARCH_GRID_CONCURRENCY > 1 and len(keywords) * len(locations) > 1:
+            # Spread the keyword x location grid over several pooled browsers
+            return SearchGrid(self).run_sync(keywords, locations)
+        # Images, media, fonts and trackers are never needed to read result cards
+        with self.browser.blocking_resources():
+            return self._search_jobs(keywords, locations)
+
+    def iter_jobs(self, keywords: List[str], locations: List[str]) -> Iterator[JobRecord]:
+        """Yield new jobs as each search page is extracted instead of after the whole grid"""
+        if Config.SEARCH_GRID_CONCURRENCY > 1 and len(keywords) * len(locations) > 1:
+            yield from SearchGrid(self).iter_jobs(keywords, locations)
+            return
+        for keyword in keywords:
+            for location in locations:
+                try:
+                    records = self.search_cell(self.browser, keyword, location)
+                except Exception as e:
+                    print(f"Error searching {keyword} in {location}: {str(e)}")
+                    continue
+                yield from self._new_jobs_from_cards(records)
+
+    def _search_jobs(self, keywords: List[str], locations: List[str]) -> List[JobRecord]:
+        """Run every keyword/location search and collect the job cards"""
         jobs = []
         total_jobs = 0
+        pending = []
         
         for keyword in keywords:
             for location in locations:
                 try:
-                    # Format URL for LinkedIn search
-                    search_url = f"https://www.linkedin.com/jobs/search/?keywords={keyword}&location={location}"
-                    print(f"\nSearching: {keyword} in {location}")
-                    self.browser.navigate(search_url)
-                    self.browser.random_delay()
-                    
-                    # Wait for job listings to load
-                    print("Waiting for job listings to load...")
-                    self.browser.wait.until(
-                        EC.presence_of_element_located((By.CLASS_NAME, "jobs-search__results-list"))
-                    )
+                    self._open_search(self.browser, keyword, location)
                     
-                    # Scroll to load more jobs
-                    print("Loading more jobs...")
-                    for _ in range(3):  # Scroll 3 times to load more jobs
-                        self.browser.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                        time.sleep(2)
-                    
-                    # Extract job listings
-                    print("Extracting job listings...")
-                    job_cards = self.browser.driver.find_elements(By.CLASS_NAME, "job-card-container")
-                    
-                    for card in job_cards:
-                        try:
-                            # Updated selectors for latest LinkedIn UI
-                            title = card.find_element(By.CSS_SELECTOR, "h3.job-card-list__title").text.strip()
-                            company = card.find_element(By.CSS_SELECTOR, "h4.job-card-container__company-name").text.strip()
-                            location = card.find_element(By.CSS_SELECTOR, ".job-card-container__metadata-item").text.strip()
-                            url = card.find_element(By.CSS_SELECTOR, "a.job-card-list__title").get_attribute("href")
-                            
-                            job_data = {
-                                "title": title,
-                                "company": company,
-                                "location": location,
-                                "url": url,
-                            }
-                            
-                            print(f"\nFound job: {title}")
-                            print(f"Company: {company}")
-                            print(f"Location: {location}")
-                            jobs.append(job_data)
-                            total_jobs += 1
-                            
-                        except Exception as e:
-                            print(f"Error extracting job card data: {str(e)}")
-                            continue
+                    if self.browser.extraction_mode == 'html':
+                        # Snapshot once and parse in a worker while the next search loads
+                        print("Queueing page snapshot for extraction...")
+                        html, url = self.browser.snapshot()
+                        future = self.browser.html_extractor.submit(
+                            html, JOB_CARD_SELECTOR, JOB_CARD_FIELDS, base_url=url
+                        )
+                        pending.append((keyword, location, future))
+                    else:
+                        # Extract every card in one script round trip
+                        print("Extracting job listings...")
+                        records = self.browser.extract_records(JOB_CARD_SELECTOR, JOB_CARD_FIELDS)
+                        total_jobs += self._collect_search_results(records, jobs)
+                        print(f"\nTotal jobs found in this search: {total_jobs}")
                     
-                    print(f"\nTotal jobs found in this search: {total_jobs}")
                     self.browser.random_delay()
                     
                 except Exception as e:
                     print(f"Error searching {keyword} in {location}: {str(e)}")
                     continue
         
+        for keyword, location, future in pending:
+            try:
+                total_jobs += self._collect_search_results(future.result(), jobs)
+            except Exception as e:
+                print(f"Error extracting {keyword} in {location}: {str(e)}")
+        
+        if pending:
+            print(f"\nTotal jobs found: {total_jobs}")
+        
         return jobs
 
-    def apply_to_job(self, job_data: Dict, user_data: Dict) -> bool:
+    def _open_search(self, browser: Browser, keyword: str, location: str) -> int:
+        """Load one search results page in browser and scroll until every card is rendered"""
+        # Format URL for LinkedIn search
+        search_url = f"https://www.linkedin.com/jobs/search/?keywords={keyword}&location={location}"
+        print(f"\nSearching: {keyword} in {location}")
+        # Navigation returns as soon as the job listings render
+        print("Waiting for job listings to load...")
+        browser.navigate(
+            search_url,
+            ready_selector=".jobs-search__results-list",
+            operation='search_results'
+        )
+        if browser is self.browser and self._confirm_session():
+            browser.navigate(
+                search_url,
+                ready_selector=".jobs-search__results-list",
+                operation='search_results'
+            )
+        
+        # Scroll until the result count stops growing
+        print("Loading more jobs...")
+        loaded = browser.scroll_to_load(
+            JOB_CARD_SELECTOR, target_count=Config.SCROLL_TARGET_CARDS or None
+        )
+        print(f"Loaded {loaded['count']} job cards in {len(loaded['yields'])} scrolls")
+        return loaded['count']
+
+    def search_cell(self, browser: Browser, keyword: str, location: str) -> List[Dict]:
+        """Run a single keyword/location search in browser and return its raw card records"""
+        with browser.blocking_resources():
+            self._open_search(browser, keyword, location)
+            if browser.extraction_mode == 'html':
+                html, url = browser.snapshot()
+                return browser.html_extractor.submit(
+                    html, JOB_CARD_SELECTOR, JOB_CARD_FIELDS, base_url=url
+                ).result()
+            return browser.extract_records(JOB_CARD_SELECTOR, JOB_CARD_FIELDS)
+
+    def _collect_search_results(self, records: List[Dict], jobs: List[JobRecord]) -> int:
+        """Append complete job cards to jobs as JobRecords and return how many were added"""
+        found = self._new_jobs_from_cards(records)
+        jobs.extend(found)
+        return len(found)
+
+    def _new_jobs_from_cards(self, records: List[Dict]) -> List[JobRecord]:
+        """Turn complete, fresh, not-yet-seen job cards into JobRecords"""
+        complete = complete_records(records, JOB_CARD_REQUIRED_FIELDS)
+        if len(complete) < len(records):
+            print(f"Skipped {len(records) - len(complete)} job cards with missing data")
+        
+        fresh = self.browser.card_filter.filter(complete)
+        if len(fresh) < len(complete):
+            print(f"Skipped {len(complete) - len(fresh)} stale or already-known job cards")
+        found = [job for job in map(JobRecord.from_record, fresh) if job]
+        
+        for job in found:
+            self.browser.card_filter.remember(job.job_id)
+            print(f"\nFound job: {job.title}")
+            print(f"Company: {job.company}")
+            print(f"Location: {job.location}")
+        
+        return found
+
+    @instrumented()
+    def apply_to_job(self, job_data: JobRecord, user_data: Dict) -> bool:
         """Apply to a job with customized resume and cover letter"""
         try:
-            print(f"\nApplying to: {job_data['title']} at {job_data['company']}")
-            self.browser.navigate(job_data['url'])
-            self.browser.random_delay()
+            print(f"\nApplying to: {job_data.title} at {job_data.company}")
+            apply_selector = "button[data-control-name='jobdetails_topcard_inapply']"
+            self.browser.navigate(job_data.url, ready_selector=apply_selector, operation='job_detail')
+            if self._confirm_session():
+                self.browser.navigate(job_data.url, ready_selector=apply_selector, operation='job_detail')
             
-            # Wait for the apply button
-            apply_button = self.browser.wait.until(
-                EC.presence_of_element_located((
-                    By.CSS_SELECTOR, 
-                    "button[data-control-name='jobdetails_topcard_inapply']"
-                ))
-            )
-            self.browser.safe_click(apply_button)
-            self.browser.random_delay()
+            # navigate already waited for the button; don't spend a second budget on it
+            apply_buttons = self.browser.driver.find_elements(By.CSS_SELECTOR, apply_selector)
+            if not apply_buttons:
+                print("Easy Apply button not found")
+                return False
+            self.browser.safe_click(apply_buttons[0])
+            if not self.browser.readiness.wait_for_selector(EASY_APPLY_MODAL_SELECTOR, 'easy_apply_modal'):
+                print("Easy Apply modal did not open")
+                return False
             
             # Check if already applied
             try:
@@ -257,72 +389,15 @@ class JobBot:
                 )
                 if resume_upload:
                     resume_upload.send_keys(user_data['resume_path'])
-                    self.browser.random_delay()
+                    self.browser.readiness.wait_for_network_idle('easy_apply_modal')
             except Exception:
                 print("No resume upload field found")
             
-            # Fill in any additional fields
-            input_fields = self.browser.driver.find_elements(
-                By.CSS_SELECTOR, 
-                "input[type='text'], textarea"
-            )
-            
-            for field in input_fields:
-                try:
-                    label = field.get_attribute('aria-label').lower()
-                    if 'years of experience' in label:
-                        field.send_keys(str(user_data['experience_years']))
-                    elif 'name' in label:
-                        field.send_keys(user_data['name'])
-                    elif 'email' in label:
-                        field.send_keys(user_data['email'])
-                    elif 'phone' in label:
-                        field.send_keys(user_data['phone'])
-                except Exception:
-                    continue
-            
-            # Handle any screening questions
-            questions = self.browser.driver.find_elements(
-                By.CSS_SELECTOR, 
-                ".jobs-easy-apply-form-section__custom-fields"
-            )
-            
-            for question in questions:
-                try:
-                    question_text = question.find_element(
-                        By.CSS_SELECTOR, 
-                        "label"
-                    ).text
-                    
-                    # Use AI to generate appropriate response
-                    answer = self.ai_service.answer_application_question(
-                        question_text, 
-                        user_data['experience']
-                    )
-                    
-                    input_field = question.find_element(
-                        By.CSS_SELECTOR, 
-                        "input, textarea, select"
-                    )
-                    input_field.send_keys(answer)
-                except Exception as e:
-                    print(f"Error handling question: {str(e)}")
-                    continue
-            
-            # Submit application
-            submit_button = self.browser.driver.find_element(
-                By.CSS_SELECTOR, 
-                "button[aria-label='Submit application']"
-            )
-            self.browser.safe_click(submit_button)
-            
-            # Wait for confirmation
-            success = self.browser.wait.until(
-                EC.presence_of_element_located((
-                    By.CSS_SELECTOR, 
-                    ".artdeco-inline-feedback--success"
-                ))
-            )
+            # Each step is read in one call and filled in one call; steps seen before replay their cached plan
+            filler = FormFiller(self.browser.driver, self._screening_answerer(user_data), get_fill_plans())
+            if not self.browser._complete_application_flow(filler, user_data):
+                print("Could not complete the application")
+                return False
             
             print("Application submitted successfully!")
             return True
@@ -331,7 +406,24 @@ class JobBot:
             print(f"Error applying to job: {str(e)}")
             return False
 
+    def _screening_answerer(self, user_data: Dict):
+        """Answer all screening questions of a form from the answer cache, then concurrent AI calls"""
+        context = user_data.get('experience')
+        # The pipeline's AI stage tailors the resume to the job; the model sees it, the cache scope does not
+        ai_context = "\n\n".join(filter(None, [context, user_data.get('tailored_resume')]))
+        answerer = ScreeningAnswerer(self.ai_service, user_data.get('email') or str(self.user_id), context, ai_context)
+        
+        def answer(questions: List[FormField]) -> List[Optional[str]]:
+            return answerer.answer([screening_prompt(q.label, q.options) for q in questions])
+        
+        return answer
+
     def close(self):
-        """Clean up resources"""
-        self.browser.close()
+        """Clean up resources and return the browser to the pool"""
+        self.browser.stats.write_summary()
+        self.browser.card_filter.log_summary()
+        answer_cache = get_answer_cache()
+        if answer_cache:
+            answer_cache.log_summary()
+        self.pool.release(self.browser)
         self.db.close()
@@ -0,0 +1,59 @@
+import re
+import sys
+from dataclasses import asdict, dataclass
+from typing import Optional
+
+# Matches /jobs/view/123, /jobs/view/some-title-at-acme-123 and ?currentJobId=123
+JOB_ID_PATTERN = re.compile(r'(?:/jobs/view/(?:[^/?#]*-)?|[?&]currentJobId=)(\d+)')
+
+
+def job_id_from_url(url: Optional[str]) -> Optional[str]:
+    """Parse the stable LinkedIn job id out of a job or search URL."""
+    if not url:
+        return None
+    match = JOB_ID_PATTERN.search(url)
+    return match.group(1) if match else None
+
+
+def canonical_job_url(job_id: str) -> str:
+    """Tracking-parameter-free URL for a job id."""
+    return f"https://www.linkedin.com/jobs/view/{job_id}/"
+
+
+@dataclass(slots=True)
+class JobRecord:
+    """Compact, DOM-independent job posting keyed by its LinkedIn job id."""
+
+    job_id: str
+    title: str
+    company: str
+    location: str
+    url: str
+    description: str = ""
+    easy_apply: bool = False
+
+    def __post_init__(self) -> None:
+        # The same few companies and locations repeat across thousands of postings
+        self.company = sys.intern(self.company or "")
+        self.location = sys.intern(self.location or "")
+
+    @classmethod
+    def from_record(cls, record: dict, **overrides) -> Optional['JobRecord']:
+        """Build a JobRecord from an extracted record, or None if it has no job id."""
+        job_id = job_id_from_url(record.get('url')) or record.get('job_id')
+        if not job_id:
+            return None
+        values = {
+            'job_id': str(job_id),
+            'title': record.get('title') or "",
+            'company': record.get('company') or "",
+            'location': record.get('location') or "",
+            'url': canonical_job_url(job_id),
+            'description': record.get('description') or "",
+        }
+        values.update(overrides)
+        return cls(**values)
+
+    def to_dict(self) -> dict:
+        """Plain dict view, e.g. for JSON output."""
+        return asdict(self)
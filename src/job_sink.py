@@ -0,0 +1,135 @@
+import logging
+import time
+from datetime import datetime
+from typing import Callable, Iterable, List, Optional, Set
+
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from .config import Config
+from .job_record import JobRecord, job_id_from_url
+from .models import Job, SessionLocal
+from .seen_jobs import SeenJobs, get_seen_jobs, job_stored
+
+
+class JobSink:
+    """Stores a stream of JobRecords in the jobs table in small batches.
+
+    Jobs are committed every batch_size records or flush_interval seconds,
+    whichever comes first, so the first results are visible while the search
+    is still running and only one batch is ever held in memory.
+    """
+
+    def __init__(
+        self,
+        user_id: int,
+        db: Optional[Session] = None,
+        batch_size: int = Config.JOB_SINK_BATCH_SIZE,
+        flush_interval: float = Config.JOB_SINK_FLUSH_INTERVAL,
+        seen: Optional[SeenJobs] = None,
+        on_flush: Optional[Callable[[List[Job]], None]] = None
+    ) -> None:
+        self.user_id = user_id
+        self._owns_db = db is None
+        self.db = db if db is not None else SessionLocal()
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval
+        self.seen = seen if seen is not None else get_seen_jobs()
+        self.on_flush = on_flush
+        self.logger = logging.getLogger(__name__)
+        self._batch: List[JobRecord] = []
+        self._batch_ids: Set[str] = set()
+        self._last_flush = time.monotonic()
+        self.inserted = 0
+        self.duplicates = 0
+        self.first_insert_at: Optional[float] = None
+        self.started_at = time.monotonic()
+
+    def __enter__(self) -> 'JobSink':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def add(self, job: JobRecord) -> bool:
+        """Queue a job for insertion; False if it is already stored or queued."""
+        if job.job_id in self._batch_ids or self._stored(job):
+            self.duplicates += 1
+            return False
+        self._batch.append(job)
+        self._batch_ids.add(job.job_id)
+        if len(self._batch) >= self.batch_size or time.monotonic() - self._last_flush >= self.flush_interval:
+            self.flush()
+        return True
+
+    def consume(self, jobs: Iterable[JobRecord]) -> int:
+        """Store every job of a stream and return how many were inserted."""
+        before = self.inserted
+        for job in jobs:
+            self.add(job)
+        self.flush()
+        return self.inserted - before
+
+    def flush(self) -> int:
+        """Insert the pending batch and return how many rows were written."""
+        self._last_flush = time.monotonic()
+        if not self._batch:
+            return 0
+        batch, self._batch, self._batch_ids = self._batch, [], set()
+
+        rows = [self._row(job) for job in batch]
+        try:
+            self.db.add_all(rows)
+            self.db.commit()
+        except IntegrityError:
+            # Another run stored some of these first; fall back to row-by-row
+            self.db.rollback()
+            rows = self._insert_individually(batch)
+
+        self.seen.update(job_id_from_url(row.url) for row in rows)
+        self.seen.flush()
+        if rows and self.first_insert_at is None:
+            self.first_insert_at = time.monotonic()
+            self.logger.info(f"First job stored {self.first_insert_at - self.started_at:.1f}s into the run")
+        self.inserted += len(rows)
+        self.logger.info(f"Stored {len(rows)} new jobs ({self.inserted} so far)")
+        if rows and self.on_flush:
+            self.on_flush(rows)
+        return len(rows)
+
+    def close(self) -> None:
+        """Flush what is left and release the session if the sink opened it."""
+        try:
+            self.flush()
+        finally:
+            if self._owns_db:
+                self.db.close()
+
+    def _stored(self, job: JobRecord) -> bool:
+        """Already in the jobs table; only Bloom filter hits cost a query."""
+        return job.job_id in self.seen and job_stored(job.job_id, self.db)
+
+    def _row(self, job: JobRecord) -> Job:
+        return Job(
+            title=job.title,
+            company=job.company,
+            location=job.location,
+            description=job.description or None,
+            url=job.url,
+            user_id=self.user_id,
+            created_at=datetime.utcnow()
+        )
+
+    def _insert_individually(self, batch: List[JobRecord]) -> List[Job]:
+        """Insert one row per commit, skipping rows that now violate the unique url."""
+        rows = []
+        for job in batch:
+            row = self._row(job)
+            try:
+                self.db.add(row)
+                self.db.commit()
+                rows.append(row)
+            except IntegrityError:
+                self.db.rollback()
+                self.duplicates += 1
+        return rows
@@ -8,6 +8,8 @@ from apscheduler.schedulers.background import BackgroundScheduler
 import asyncio
 
 from job_bot import JobBot
+from seen_jobs import get_seen_jobs
+from worker import enqueue_bot_run
 from config import Config
 from models import SessionLocal, Job, User, Base, engine
 from resume_parser import ResumeParser
@@ -44,50 +46,10 @@ def load_user(user_id):
         db.close()
 
 def run_job_search(user_id: int):
-    """Background job to search and apply to jobs"""
-    db = SessionLocal()
-    try:
-        user = db.query(User).get(user_id)
-        if not user or not user.is_active:
-            return
-        
-        job_bot = JobBot()
-        try:
-            preferences = user.preferences or {}
-            keywords = preferences.get('job_role', ['Software Engineer'])
-            locations = preferences.get('locations', ['Remote'])
-            
-            logger.info(f"Starting job search for {keywords} in {locations}")
-            jobs = job_bot.search_jobs(keywords, locations)
-            
-            new_jobs = 0
-            for job_data in jobs:
-                if db.query(Job).filter(Job.url == job_data["url"]).first():
-                    continue
-                    
-                job = Job(
-                    title=job_data["title"],
-                    company=job_data["company"],
-                    location=job_data["location"],
-                    url=job_data["url"],
-                    status="new",
-                    user_id=user_id,
-                    created_at=datetime.utcnow()
-                )
-                db.add(job)
-                new_jobs += 1
-                logger.info(f"New job found: {job.title} at {job.company}")
-            
-            db.commit()
-            logger.info(f"Added {new_jobs} new jobs to the database")
-            
-        finally:
-            job_bot.close()
-            
-    except Exception as e:
-        logger.error(f"Error in job search: {str(e)}", exc_info=True)
-    finally:
-        db.close()
+    """Queue a search-and-apply run for the user; a worker process picks it up"""
+    run_id = enqueue_bot_run(user_id)
+    if run_id is not None:
+        logger.info(f"Queued bot run {run_id} for user {user_id}")
 
 @app.route('/register', methods=['GET', 'POST'])
 def register():
@@ -183,6 +145,7 @@ async def main():
     """Main entry point for the job application bot"""
     try:
         init_db()
+        get_seen_jobs()
         bot = JobBot()
         await bot.start_application_process()
     except Exception as e:
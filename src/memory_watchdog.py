@@ -0,0 +1,96 @@
+import logging
+import threading
+import time
+from collections import deque
+from typing import TYPE_CHECKING, Deque, Dict, Optional
+
+from .config import Config
+from .process_metrics import tree_memory
+
+if TYPE_CHECKING:
+    from .browser import Browser
+
+
+class MemoryWatchdog:
+    """Samples a Browser's Chrome process tree and flags it for recycling past thresholds."""
+
+    def __init__(
+        self,
+        browser: 'Browser',
+        interval: float = Config.MEMORY_WATCHDOG_INTERVAL,
+        max_rss_mb: float = Config.MAX_CHROME_RSS_MB,
+        max_renderers: int = Config.MAX_CHROME_RENDERERS,
+        history: int = 120
+    ) -> None:
+        self.browser = browser
+        self.interval = interval
+        self.max_rss_bytes = int(max_rss_mb * 1024 * 1024)
+        self.max_renderers = max_renderers
+        self.logger = logging.getLogger(__name__)
+        self.samples: Deque[Dict[str, float]] = deque(maxlen=history)
+        self.peak_rss_bytes = 0
+        self.recycles = 0
+        self.recycle_requested = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Start sampling in a daemon thread."""
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="chrome-memory-watchdog", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the sampling thread."""
+        self._stop.set()
+        if self._thread and self._thread is not threading.current_thread():
+            self._thread.join(timeout=self.interval + 1)
+        self._thread = None
+
+    def sample(self) -> Dict[str, float]:
+        """Take one sample and request a recycle if any threshold is crossed."""
+        # Only reads process info from the OS; never issues WebDriver commands
+        usage = tree_memory(self.browser.chrome_pids())
+        sample = {'time': time.time(), **usage}
+        self.samples.append(sample)
+        self.peak_rss_bytes = max(self.peak_rss_bytes, usage['rss_bytes'])
+        self.logger.debug(
+            f"Chrome memory: {usage['rss_bytes'] / (1024 * 1024):.0f} MB, "
+            f"{usage['processes']} processes, {usage['renderers']} renderers"
+        )
+
+        over_rss = usage['rss_bytes'] > self.max_rss_bytes
+        over_tabs = usage['renderers'] > self.max_renderers
+        if (over_rss or over_tabs) and not self.recycle_requested.is_set():
+            self.logger.warning(
+                f"Chrome over memory limits ({usage['rss_bytes'] / (1024 * 1024):.0f} MB, "
+                f"{usage['renderers']} renderers); recycling at the next safe point"
+            )
+            self.recycle_requested.set()
+        return sample
+
+    def recycled(self) -> None:
+        """Record that the browser was recycled and clear the pending request."""
+        self.recycles += 1
+        self.recycle_requested.clear()
+
+    def summary(self) -> Dict[str, float]:
+        """Latest and peak memory metrics for this instance."""
+        latest = self.samples[-1] if self.samples else {}
+        return {
+            'rss_bytes': latest.get('rss_bytes', 0),
+            'peak_rss_bytes': self.peak_rss_bytes,
+            'renderers': latest.get('renderers', 0),
+            'samples': len(self.samples),
+            'recycles': self.recycles,
+        }
+
+    def _run(self) -> None:
+        """Sampling loop."""
+        while not self._stop.wait(self.interval):
+            try:
+                self.sample()
+            except Exception as e:
+                self.logger.error(f"Memory watchdog sample failed: {str(e)}")
@@ -1,6 +1,6 @@
 from sqlalchemy import (
     create_engine, Column, Integer, String, Boolean, 
-    DateTime, Text, ForeignKey, JSON, Float
+    DateTime, Text, ForeignKey, JSON, Float, inspect, text
 )
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, relationship
@@ -63,7 +63,27 @@ class Application(Base):
     response_received = Column(Boolean, default=False)
     job = relationship("Job", back_populates="applications")
 
+class BotRun(Base):
+    """One queued or executed bot session for a user, claimed by a worker process."""
+    __tablename__ = "bot_runs"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(Integer, ForeignKey('users.id'), index=True, nullable=False)
+    status = Column(String, index=True, default='queued')  # queued, running, succeeded, failed
+    attempts = Column(Integer, default=0)
+    worker = Column(String)  # host:pid of the worker that claimed it
+    jobs_found = Column(Integer)
+    error = Column(Text)
+    enqueued_at = Column(DateTime, default=datetime.utcnow)
+    started_at = Column(DateTime)
+    last_seen_at = Column(DateTime)  # heartbeat of the worker running it
+    finished_at = Column(DateTime)
+
 # Database setup
 engine = create_engine(Config.DATABASE_URL)
 Base.metadata.create_all(engine)
+# create_all does not add columns to existing tables
+if 'last_seen_at' not in {column['name'] for column in inspect(engine).get_columns('bot_runs')}:
+    with engine.begin() as connection:
+        connection.execute(text("ALTER TABLE bot_runs ADD COLUMN last_seen_at DATETIME"))
 SessionLocal = sessionmaker(bind=engine)
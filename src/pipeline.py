@@ -0,0 +1,417 @@
+import logging
+import queue
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from .config import Config
+from .job_record import JobRecord
+
+# Marks the end of a stage's input
+_STOP = object()
+
+# Yes/no questions most Easy Apply forms ask; answering them while the search
+# finds the first jobs keeps the first forms from waiting on the model
+COMMON_SCREENING_QUESTIONS = [
+    "Will you now or in the future require sponsorship for employment visa status?",
+    "Are you willing to relocate?",
+    "Are you comfortable working in a remote setting?",
+    "Are you comfortable commuting to this job's location?",
+]
+
+
+class Stage:
+    """One pipeline step: a bounded input queue served by one or more worker threads.
+
+    handler(context, item) returns the item to pass downstream, or None to
+    drop it. setup() runs once per worker thread and its result is passed to
+    every handler call as context (e.g. a worker's own browser); teardown
+    receives it when the worker exits.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        handler: Callable[[Any, Any], Any],
+        workers: int = 1,
+        maxsize: int = Config.PIPELINE_QUEUE_SIZE,
+        setup: Optional[Callable[[], Any]] = None,
+        teardown: Optional[Callable[[Any], None]] = None
+    ) -> None:
+        self.name = name
+        self.handler = handler
+        self.workers = max(1, workers)
+        self.inbox: queue.Queue = queue.Queue(maxsize=max(1, maxsize))
+        self.setup = setup
+        self.teardown = teardown
+        self.logger = logging.getLogger(__name__)
+        self._lock = threading.Lock()
+        self._running = 0
+        self.processed = 0
+        self.passed = 0
+        self.failed = 0
+        self.busy = 0.0      # seconds spent in handler
+        self.starved = 0.0   # seconds waiting for input
+        self.blocked = 0.0   # seconds waiting for room downstream
+
+    def metrics(self, elapsed: float) -> Dict[str, Any]:
+        """Throughput, utilisation and queue depth of this stage."""
+        with self._lock:
+            return {
+                'stage': self.name,
+                'workers': self.workers,
+                'queue_depth': self.inbox.qsize(),
+                'processed': self.processed,
+                'passed': self.passed,
+                'failed': self.failed,
+                'per_minute': self.processed / elapsed * 60 if elapsed else 0.0,
+                'utilisation': self.busy / (self.workers * elapsed) if elapsed else 0.0,
+                'starved': self.starved,
+                'blocked': self.blocked,
+            }
+
+
+class Pipeline:
+    """Feeds a source iterable through stages connected by bounded queues.
+
+    Every stage runs in its own threads, so a slow stage fills the queue in
+    front of it and holds the upstream stages back instead of buffering
+    without limit.
+    """
+
+    def __init__(
+        self,
+        source: Iterable,
+        stages: List[Stage],
+        source_name: str = 'source',
+        report_interval: float = Config.PIPELINE_REPORT_INTERVAL
+    ) -> None:
+        self.source = source
+        self.source_name = source_name
+        self.stages = stages
+        self.report_interval = report_interval
+        self.logger = logging.getLogger(__name__)
+        self.produced = 0
+        self.source_blocked = 0.0
+        self.source_error: Optional[BaseException] = None
+        self.started_at = 0.0
+        self._done = threading.Event()
+
+    def run(self) -> List[Dict[str, Any]]:
+        """Run until the source is exhausted and every stage has drained; return the metrics."""
+        self.started_at = time.monotonic()
+        self._done.clear()
+        threads = [threading.Thread(target=self._feed, name=f"pipeline-{self.source_name}", daemon=True)]
+        for index, stage in enumerate(self.stages):
+            downstream = self.stages[index + 1] if index + 1 < len(self.stages) else None
+            stage._running = stage.workers
+            for n in range(stage.workers):
+                threads.append(threading.Thread(
+                    target=self._work, args=(stage, downstream),
+                    name=f"pipeline-{stage.name}-{n}", daemon=True
+                ))
+        reporter = threading.Thread(target=self._report_periodically, name="pipeline-report", daemon=True)
+
+        for thread in threads:
+            thread.start()
+        reporter.start()
+        for thread in threads:
+            thread.join()
+        self._done.set()
+        reporter.join()
+
+        metrics = self.metrics()
+        self.logger.info(self.format_metrics(metrics))
+        if self.source_error is not None:
+            self.logger.error(f"Pipeline source failed: {str(self.source_error)}")
+        return metrics
+
+    def metrics(self) -> List[Dict[str, Any]]:
+        """Source and per-stage counters so the bottleneck stage is visible."""
+        elapsed = time.monotonic() - self.started_at
+        source = {
+            'stage': self.source_name,
+            'workers': 1,
+            'queue_depth': 0,
+            'processed': self.produced,
+            'passed': self.produced,
+            'failed': int(self.source_error is not None),
+            'per_minute': self.produced / elapsed * 60 if elapsed else 0.0,
+            'utilisation': None,
+            'starved': 0.0,
+            'blocked': self.source_blocked,
+        }
+        return [source] + [stage.metrics(elapsed) for stage in self.stages]
+
+    def format_metrics(self, metrics: List[Dict[str, Any]]) -> str:
+        """Render the metrics as a plain-text table."""
+        lines = [
+            f"Pipeline after {time.monotonic() - self.started_at:.0f}s:",
+            f"{'stage':<10} {'workers':>7} {'queued':>6} {'done':>6} {'passed':>6} {'failed':>6} "
+            f"{'per min':>8} {'busy %':>6} {'starved s':>9} {'blocked s':>9}",
+        ]
+        for m in metrics:
+            busy = '-' if m['utilisation'] is None else f"{m['utilisation'] * 100:.0f}"
+            lines.append(
+                f"{m['stage']:<10} {m['workers']:>7} {m['queue_depth']:>6} {m['processed']:>6} "
+                f"{m['passed']:>6} {m['failed']:>6} {m['per_minute']:>8.1f} {busy:>6} "
+                f"{m['starved']:>9.1f} {m['blocked']:>9.1f}"
+            )
+        return "\n".join(lines)
+
+    def _feed(self) -> None:
+        """Push source items into the first stage."""
+        first = self.stages[0]
+        try:
+            for item in self.source:
+                start = time.monotonic()
+                first.inbox.put(item)
+                self.source_blocked += time.monotonic() - start
+                self.produced += 1
+        except Exception as e:
+            self.source_error = e
+        finally:
+            for _ in range(first.workers):
+                first.inbox.put(_STOP)
+
+    def _work(self, stage: Stage, downstream: Optional[Stage]) -> None:
+        """Worker loop of one stage thread."""
+        context = None
+        try:
+            if stage.setup:
+                context = stage.setup()
+            while True:
+                start = time.monotonic()
+                item = stage.inbox.get()
+                waited = time.monotonic() - start
+                if item is _STOP:
+                    break
+
+                start = time.monotonic()
+                try:
+                    result = stage.handler(context, item)
+                    failed = False
+                except Exception as e:
+                    result, failed = None, True
+                    stage.logger.error(f"Pipeline stage {stage.name} failed on an item: {str(e)}")
+                busy = time.monotonic() - start
+
+                blocked = 0.0
+                if result is not None and downstream is not None:
+                    start = time.monotonic()
+                    downstream.inbox.put(result)
+                    blocked = time.monotonic() - start
+
+                with stage._lock:
+                    stage.processed += 1
+                    stage.passed += result is not None
+                    stage.failed += failed
+                    stage.busy += busy
+                    stage.starved += waited
+                    stage.blocked += blocked
+        except Exception as e:
+            stage.logger.error(f"Pipeline stage {stage.name} worker stopped: {str(e)}")
+            # Keep consuming so upstream stages are never blocked on a dead stage
+            while stage.inbox.get() is not _STOP:
+                pass
+        finally:
+            if stage.teardown and context is not None:
+                try:
+                    stage.teardown(context)
+                except Exception as e:
+                    stage.logger.warning(f"Pipeline stage {stage.name} teardown failed: {str(e)}")
+            with stage._lock:
+                stage._running -= 1
+                last = stage._running == 0
+            if last and downstream is not None:
+                for _ in range(downstream.workers):
+                    downstream.inbox.put(_STOP)
+
+    def _report_periodically(self) -> None:
+        while not self._done.wait(self.report_interval):
+            self.logger.info(self.format_metrics(self.metrics()))
+
+
+@dataclass
+class PreparedJob:
+    """A new job with its AI work done before it reaches an apply worker."""
+
+    job: JobRecord
+    tailored_resume: str = ""
+
+
+def job_posting_text(job: JobRecord) -> str:
+    """What the AI stage knows about a posting; search cards carry no description."""
+    return "\n".join(filter(None, [f"{job.title} at {job.company}", job.location, job.description]))
+
+
+def user_profile(user) -> Dict[str, Any]:
+    """Applicant details JobBot.apply_to_job fills into forms."""
+    from .resume_parser import ResumeParser
+
+    preferences = user.preferences or {}
+    resume = {}
+    if user.resume_path:
+        try:
+            resume = ResumeParser().parse(user.resume_path)
+        except Exception as e:
+            logging.getLogger(__name__).warning(f"Could not parse resume {user.resume_path}: {str(e)}")
+    return {
+        'name': " ".join(filter(None, [user.first_name, user.last_name])),
+        'email': user.email,
+        'phone': preferences.get('phone') or resume.get('phone') or "",
+        'experience_years': preferences.get('experience_years') or resume.get('experience_years') or "",
+        'experience': preferences.get('experience', ""),
+        'resume_path': user.resume_path,
+        'resume_text': resume.get('text') or "",
+    }
+
+
+def applications_today(db, user_id: int) -> int:
+    """Applications already recorded for the user since midnight (UTC), across all runs."""
+    from .models import Application, Job
+
+    midnight = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
+    return (
+        db.query(Application)
+        .join(Job, Application.job_id == Job.id)
+        .filter(Job.user_id == user_id, Application.applied_at >= midnight)
+        .count()
+    )
+
+
+def run_application_pipeline(user_id: int) -> Dict[str, Any]:
+    """Search, dedupe, prepare and apply for one user as a four-stage pipeline."""
+    from .ai_service import AIService
+    from .answer_cache import ScreeningAnswerer, screening_prompt
+    from .browser_pool import get_browser_pool
+    from .job_bot import JobBot
+    from .job_sink import JobSink
+    from .models import Application, Job, SessionLocal, User
+
+    logger = logging.getLogger(__name__)
+    db = SessionLocal()
+    try:
+        user = db.query(User).get(user_id)
+        if not user or not user.is_active:
+            return {'stored': 0, 'applied': 0, 'metrics': []}
+        preferences = user.preferences or {}
+        keywords = preferences.get('job_role', ['Software Engineer'])
+        if isinstance(keywords, str):
+            keywords = [keywords]
+        locations = preferences.get('locations', ['Remote'])
+        profile = user_profile(user)
+        daily_limit = min(user.daily_limit or Config.MAX_DAILY_APPLICATIONS, Config.MAX_DAILY_APPLICATIONS)
+        # The scheduler starts several runs a day; the limit covers all of them
+        slots_left = max(0, daily_limit - applications_today(db, user_id))
+    finally:
+        db.close()
+
+    # One browser searches and each apply worker needs its own; search-grid extras only get what is left
+    pool = get_browser_pool()
+    apply_workers = min(Config.PIPELINE_APPLY_WORKERS, pool.max_size - 1)
+    if slots_left and apply_workers < 1:
+        raise RuntimeError(
+            f"BROWSER_POOL_SIZE={pool.max_size} leaves no browser for applying; "
+            f"the pipeline needs at least 1 + PIPELINE_APPLY_WORKERS ({Config.PIPELINE_APPLY_WORKERS})"
+        )
+    if apply_workers < Config.PIPELINE_APPLY_WORKERS:
+        logger.warning(
+            f"Only {apply_workers} of {Config.PIPELINE_APPLY_WORKERS} apply workers fit a pool of {pool.max_size} browsers"
+        )
+    apply_workers = apply_workers if slots_left else 0
+
+    # Lease every browser before the search starts so the grid cannot starve the apply stage
+    search_bot = JobBot(user_id=user_id)
+    apply_bots: List['JobBot'] = []
+    try:
+        for _ in range(apply_workers):
+            apply_bots.append(JobBot(user_id=user_id))
+    except Exception:
+        for bot in apply_bots:
+            bot.close()
+        search_bot.close()
+        raise
+
+    # Each new job is committed before it moves on, so the apply stage can link its application
+    sink = JobSink(user_id, batch_size=1)
+    applied = []
+    applied_lock = threading.Lock()
+    reserved = [0]
+    ai = AIService()
+    applicant = profile['email'] or str(user_id)
+    warmed = [False]
+
+    def dedupe(_context, job: JobRecord) -> Optional[JobRecord]:
+        return job if sink.add(job) else None
+
+    def warm_screening_answers() -> None:
+        # The first prepare worker fills the answer cache; the others start on jobs right away
+        with applied_lock:
+            if warmed[0]:
+                return
+            warmed[0] = True
+        try:
+            ScreeningAnswerer(ai, applicant, profile['experience']).answer(
+                [screening_prompt(question, ['Yes', 'No']) for question in COMMON_SCREENING_QUESTIONS]
+            )
+        except Exception as e:
+            logger.warning(f"Could not pre-answer common screening questions: {str(e)}")
+
+    def prepare(_context, job: JobRecord) -> Optional[PreparedJob]:
+        # Tailoring here lets the model work on the next jobs while the browsers submit this one
+        with applied_lock:
+            if len(applied) >= slots_left:
+                return None
+        if not profile['resume_text']:
+            return PreparedJob(job)
+        return PreparedJob(job, ai.run(ai.customize_resume(profile['resume_text'], job_posting_text(job))))
+
+    def apply(bot: 'JobBot', prepared: PreparedJob) -> Optional[JobRecord]:
+        job = prepared.job
+        # Reserve a slot before applying so concurrent workers never overshoot the limit
+        with applied_lock:
+            if reserved[0] >= slots_left:
+                return None
+            reserved[0] += 1
+        if not bot.apply_to_job(job, {**profile, 'tailored_resume': prepared.tailored_resume}):
+            with applied_lock:
+                reserved[0] -= 1
+            return None
+        with applied_lock:
+            applied.append(job.job_id)
+        apply_db = SessionLocal()
+        try:
+            row = apply_db.query(Job).filter(Job.url == job.url).first()
+            if row is not None:
+                row.applied = True
+                apply_db.add(Application(job_id=row.id, status='submitted', applied_at=datetime.utcnow()))
+                apply_db.commit()
+        finally:
+            apply_db.close()
+        return job
+
+    stages = [Stage('dedupe', dedupe)]
+    if apply_bots:
+        stages.append(Stage('prepare', prepare, workers=Config.PIPELINE_AI_WORKERS,
+                            setup=warm_screening_answers))
+        stages.append(Stage('apply', apply, workers=len(apply_bots),
+                            setup=apply_bots.pop, teardown=lambda bot: bot.close()))
+    else:
+        logger.info(f"Daily limit of {daily_limit} applications reached; only storing new jobs")
+
+    pipeline = Pipeline(search_bot.iter_jobs(keywords, locations), stages, source_name='search')
+    try:
+        metrics = pipeline.run()
+    finally:
+        sink.close()
+        search_bot.close()
+        # Bots a failed stage worker never took
+        for bot in apply_bots:
+            bot.close()
+    ai.log_cache_summary()
+
+    logger.info(f"Pipeline stored {sink.inserted} new jobs and applied to {len(applied)}")
+    return {'stored': sink.inserted, 'applied': len(applied), 'metrics': metrics}
@@ -0,0 +1,92 @@
+import os
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, Iterable, List, Set
+
+try:
+    import psutil
+except ImportError:  # psutil is optional; fall back to /proc on Linux
+    psutil = None
+
+PAGE_SIZE = os.sysconf('SC_PAGE_SIZE') if hasattr(os, 'sysconf') else 4096
+
+
+def process_tree(root_pids: Iterable[int]) -> Set[int]:
+    """Return the given pids plus all of their live descendants."""
+    roots = {pid for pid in root_pids if pid}
+    if psutil is not None:
+        pids = set()
+        for pid in roots:
+            try:
+                process = psutil.Process(pid)
+                pids.add(pid)
+                pids.update(child.pid for child in process.children(recursive=True))
+            except psutil.Error:
+                continue
+        return pids
+
+    children: Dict[int, List[int]] = defaultdict(list)
+    for pid, ppid in _proc_parents().items():
+        children[ppid].append(pid)
+    pids = set()
+    stack = [pid for pid in roots if Path(f"/proc/{pid}").exists()]
+    while stack:
+        pid = stack.pop()
+        if pid not in pids:
+            pids.add(pid)
+            stack.extend(children.get(pid, []))
+    return pids
+
+
+def process_rss(pid: int) -> int:
+    """Resident set size of a single process in bytes, or 0 if it is gone."""
+    if psutil is not None:
+        try:
+            return psutil.Process(pid).memory_info().rss
+        except psutil.Error:
+            return 0
+    try:
+        with open(f"/proc/{pid}/statm") as f:
+            return int(f.read().split()[1]) * PAGE_SIZE
+    except (OSError, IndexError, ValueError):
+        return 0
+
+
+def process_cmdline(pid: int) -> List[str]:
+    """Command line of a process, or an empty list if it cannot be read."""
+    if psutil is not None:
+        try:
+            return psutil.Process(pid).cmdline()
+        except psutil.Error:
+            return []
+    try:
+        with open(f"/proc/{pid}/cmdline", 'rb') as f:
+            return [arg.decode(errors='replace') for arg in f.read().split(b'\0') if arg]
+    except OSError:
+        return []
+
+
+def tree_memory(root_pids: Iterable[int]) -> Dict[str, int]:
+    """Total RSS, process count and renderer count for the process trees rooted at root_pids."""
+    pids = process_tree(root_pids)
+    renderers = sum(1 for pid in pids if '--type=renderer' in process_cmdline(pid))
+    return {
+        'rss_bytes': sum(process_rss(pid) for pid in pids),
+        'processes': len(pids),
+        'renderers': renderers,
+    }
+
+
+def _proc_parents() -> Dict[int, int]:
+    """Map every pid under /proc to its parent pid."""
+    parents = {}
+    for entry in Path('/proc').iterdir():
+        if not entry.name.isdigit():
+            continue
+        try:
+            stat = (entry / 'stat').read_text()
+            # The command name may contain spaces, so split after its closing paren
+            parents[int(entry.name)] = int(stat.rsplit(')', 1)[1].split()[1])
+        except (OSError, IndexError, ValueError):
+            continue
+    return parents
@@ -0,0 +1,286 @@
+import json
+import logging
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Callable, Dict, Iterator, List, Optional, Set
+
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.webelement import WebElement
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+
+if TYPE_CHECKING:
+    from .instrumentation import DriverStats
+
+# Latency budgets in seconds for each high-level operation
+DEFAULT_BUDGETS: Dict[str, float] = {
+    'navigate': 15.0,
+    'search_form': 10.0,
+    'search_results': 10.0,
+    'job_detail': 8.0,
+    'easy_apply_modal': 8.0,
+    'modal_step': 5.0,
+    'default': 10.0,
+}
+
+# Resolves once no nodes have been added or removed for quietMs, or false at the budget.
+# Only child lists are watched: attribute and text churn (timers, animations) never settles.
+DOM_SETTLED_SCRIPT = """
+const [quietMs, budgetMs, rootSelector, done] = arguments;
+const root = rootSelector ? document.querySelector(rootSelector) : document.body;
+if (!root) { done(false); return; }
+let quietTimer = null;
+let hardTimer = null;
+const observer = new MutationObserver(() => {
+    clearTimeout(quietTimer);
+    quietTimer = setTimeout(() => finish(true), quietMs);
+});
+function finish(settled) {
+    observer.disconnect();
+    clearTimeout(quietTimer);
+    clearTimeout(hardTimer);
+    done(settled);
+}
+// Without a root only the page's top-level structure is watched
+observer.observe(root, {childList: true, subtree: Boolean(rootSelector)});
+quietTimer = setTimeout(() => finish(true), quietMs);
+hardTimer = setTimeout(() => finish(false), budgetMs);
+"""
+
+# Scrolls once, then resolves with [before, after] item counts when new items stop arriving
+SCROLL_AND_COUNT_SCRIPT = """
+const [itemSelector, containerSelector, settleMs, waitMs, done] = arguments;
+const count = () => document.querySelectorAll(itemSelector).length;
+const before = count();
+const container = containerSelector ? document.querySelector(containerSelector) : null;
+if (container) {
+    container.scrollTop = container.scrollHeight;
+} else {
+    window.scrollTo(0, document.body.scrollHeight);
+}
+let last = before;
+let settleTimer = null;
+const observer = new MutationObserver(() => {
+    const current = count();
+    if (current !== last) {
+        last = current;
+        clearTimeout(settleTimer);
+        settleTimer = setTimeout(finish, settleMs);
+    }
+});
+const hardTimer = setTimeout(finish, waitMs);
+function finish() {
+    observer.disconnect();
+    clearTimeout(settleTimer);
+    clearTimeout(hardTimer);
+    done([before, count()]);
+}
+observer.observe(container || document.body, {childList: true, subtree: true});
+"""
+
+
+@contextmanager
+def script_timeout(driver, seconds: float) -> Iterator[None]:
+    """Raise the driver's async script timeout for a block and restore the previous one after."""
+    try:
+        previous = driver.timeouts.script
+    except (AttributeError, WebDriverException):
+        previous = None
+    driver.set_script_timeout(seconds)
+    try:
+        yield
+    finally:
+        if previous is not None:
+            try:
+                driver.set_script_timeout(previous)
+            except WebDriverException:
+                pass
+
+
+class NetworkLog:
+    """Tracks in-flight requests from Chrome's CDP performance log."""
+
+    def __init__(self, driver) -> None:
+        self.driver = driver
+        self.logger = logging.getLogger(__name__)
+        self.available = True
+        self._inflight: Set[str] = set()
+        self._listeners: List[Callable[[dict], None]] = []
+
+    def add_listener(self, listener: Callable[[dict], None]) -> None:
+        """Receive every network event drained from the log."""
+        self._listeners.append(listener)
+
+    @property
+    def inflight(self) -> int:
+        """Number of requests started but not yet finished or failed."""
+        return len(self._inflight)
+
+    def poll(self) -> List[dict]:
+        """Drain new CDP network events and update the in-flight request set."""
+        if not self.available:
+            return []
+        try:
+            entries = self.driver.get_log('performance')
+        except WebDriverException as e:
+            # The driver was started without goog:loggingPrefs
+            self.logger.debug(f"Performance log unavailable: {str(e)}")
+            self.available = False
+            return []
+
+        events = []
+        for entry in entries:
+            try:
+                message = json.loads(entry['message'])['message']
+            except (KeyError, ValueError):
+                continue
+            method = message.get('method', '')
+            if not method.startswith('Network.'):
+                continue
+            params = message.get('params', {})
+            request_id = params.get('requestId')
+            if method == 'Network.requestWillBeSent':
+                self._inflight.add(request_id)
+            elif method in ('Network.loadingFinished', 'Network.loadingFailed'):
+                self._inflight.discard(request_id)
+            event = {'method': method, 'params': params}
+            for listener in self._listeners:
+                listener(event)
+            events.append(event)
+        return events
+
+    def reset(self) -> None:
+        """Forget in-flight requests, e.g. after a new top-level navigation."""
+        self.poll()
+        self._inflight.clear()
+
+
+class PageReadiness:
+    """Waits on explicit page signals instead of fixed sleeps and records how long each took."""
+
+    def __init__(
+        self,
+        driver,
+        budgets: Optional[Dict[str, float]] = None,
+        network_log: Optional[NetworkLog] = None,
+        stats: Optional['DriverStats'] = None
+    ) -> None:
+        self.driver = driver
+        self.stats = stats
+        self.logger = logging.getLogger(__name__)
+        self.budgets = {**DEFAULT_BUDGETS, **(budgets or {})}
+        self.network_log = network_log or NetworkLog(driver)
+        self.timings: Dict[str, List[float]] = defaultdict(list)
+
+    def budget(self, operation: str) -> float:
+        """Return the latency budget for an operation."""
+        return self.budgets.get(operation, self.budgets['default'])
+
+    def wait_for_ready_state(self, operation: str = 'navigate', state: str = 'complete') -> bool:
+        """Wait until document.readyState reaches the given state."""
+        states = ('interactive', 'complete') if state == 'interactive' else ('complete',)
+        return self._wait(
+            operation,
+            f"readyState={state}",
+            lambda d: d.execute_script("return document.readyState") in states
+        )
+
+    def wait_for_selector(
+        self,
+        selector: str,
+        operation: str = 'default',
+        visible: bool = False
+    ) -> Optional[WebElement]:
+        """Wait for a CSS selector to appear and return the element, or None on timeout."""
+        condition = EC.visibility_of_element_located if visible else EC.presence_of_element_located
+        result = self._wait(operation, f"selector {selector}", condition((By.CSS_SELECTOR, selector)))
+        return result or None
+
+    def wait_for_network_idle(
+        self,
+        operation: str = 'default',
+        idle_time: float = 0.5,
+        max_inflight: int = 0
+    ) -> bool:
+        """Wait until at most max_inflight requests have been pending for idle_time seconds.
+
+        Without Chrome's performance log, waits for the DOM to settle instead.
+        """
+        self.network_log.poll()
+        if not self.network_log.available:
+            return self.wait_for_dom_settled(operation)
+        quiet_since = [None]
+
+        def idle(_driver) -> bool:
+            self.network_log.poll()
+            if not self.network_log.available:
+                return True
+            if self.network_log.inflight > max_inflight:
+                quiet_since[0] = None
+                return False
+            now = time.monotonic()
+            if quiet_since[0] is None:
+                quiet_since[0] = now
+            return now - quiet_since[0] >= idle_time
+
+        return self._wait(operation, "network idle", idle)
+
+    def wait_for_dom_settled(
+        self,
+        operation: str = 'default',
+        quiet_ms: int = 300,
+        root_selector: Optional[str] = None
+    ) -> bool:
+        """Wait until no nodes are added or removed under root_selector for quiet_ms milliseconds.
+
+        Without root_selector only the direct children of <body> are watched;
+        pass a ready selector or a root to wait for actual content.
+        """
+        budget = self.budget(operation)
+        start = time.monotonic()
+        try:
+            with script_timeout(self.driver, budget + 1):
+                settled = bool(self.driver.execute_async_script(
+                    DOM_SETTLED_SCRIPT, quiet_ms, int(budget * 1000), root_selector
+                ))
+        except WebDriverException as e:
+            self.logger.debug(f"DOM settle wait failed: {str(e)}")
+            settled = False
+        self._record(operation, "DOM settled", time.monotonic() - start, settled)
+        return settled
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """Per-operation wait statistics in seconds."""
+        return {
+            operation: {
+                'count': len(samples),
+                'total': sum(samples),
+                'max': max(samples),
+                'avg': sum(samples) / len(samples),
+            }
+            for operation, samples in self.timings.items() if samples
+        }
+
+    def _wait(self, operation: str, description: str, condition: Callable):
+        """Poll a condition within the operation's budget and record the elapsed time."""
+        start = time.monotonic()
+        try:
+            result = WebDriverWait(self.driver, self.budget(operation), poll_frequency=0.1).until(condition)
+        except TimeoutException:
+            result = False
+        self._record(operation, description, time.monotonic() - start, bool(result))
+        return result
+
+    def _record(self, operation: str, description: str, elapsed: float, met: bool) -> None:
+        """Store a wait duration and log budget overruns."""
+        self.timings[operation].append(elapsed)
+        if self.stats is not None:
+            self.stats.record_wait(elapsed)
+        if met:
+            self.logger.debug(f"[{operation}] {description} after {elapsed:.2f}s")
+        else:
+            self.logger.warning(
+                f"[{operation}] {description} not met within {self.budget(operation):.1f}s budget"
+            )
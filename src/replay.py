@@ -0,0 +1,368 @@
+import itertools
+import json
+import logging
+import os
+import threading
+from contextlib import suppress
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, List, Optional
+from urllib.parse import urlsplit
+
+from bs4 import BeautifulSoup
+from selenium.common.exceptions import NoSuchElementException, WebDriverException
+from selenium.webdriver.common.by import By
+
+from .easy_apply import MODAL_STEP_SCRIPT
+from .extraction import BULK_EXTRACT_SCRIPT, PAGE_SNAPSHOT_SCRIPT, parse_records
+
+MANIFEST_NAME = "manifest.json"
+_run_counter = itertools.count(1)
+
+
+def url_key(url: str) -> str:
+    """Host-independent key for matching recorded pages: path plus query string."""
+    parts = urlsplit(url)
+    path = parts.path.rstrip('/') or '/'
+    return f"{path}?{parts.query}" if parts.query else path
+
+
+class PageRecorder:
+    """Saves every page a Browser visits, with the records extracted from it, as a fixture run."""
+
+    def __init__(self, base_dir: Path) -> None:
+        self.logger = logging.getLogger(__name__)
+        run_name = f"{datetime.now().strftime('%Y%m%d_%H%M%S')}_{os.getpid()}_{next(_run_counter)}"
+        self.run_dir = base_dir / run_name
+        (self.run_dir / "pages").mkdir(parents=True, exist_ok=True)
+        self.pages: List[dict] = []
+        self._lock = threading.Lock()
+
+    def record_page(self, requested_url: str, html: str, final_url: str, label: str = 'navigate') -> dict:
+        """Store one page snapshot and make it the target of subsequent extractions."""
+        with self._lock:
+            index = len(self.pages) + 1
+            html_file = f"pages/{index:04d}.html"
+            (self.run_dir / html_file).write_text(html, encoding='utf-8')
+            page = {
+                'index': index,
+                'label': label,
+                'requested_url': requested_url,
+                'final_url': final_url,
+                'html': html_file,
+                'extractions': [],
+            }
+            self.pages.append(page)
+            self._write_manifest()
+            return page
+
+    def record_extraction(
+        self,
+        item_selector: Optional[str],
+        fields: Dict[str, str],
+        root_selector: Optional[str],
+        records: List[dict]
+    ) -> None:
+        """Attach the JSON an extraction returned to the most recently recorded page."""
+        with self._lock:
+            if not self.pages:
+                return
+            self.pages[-1]['extractions'].append({
+                'item_selector': item_selector,
+                'root_selector': root_selector,
+                'fields': fields,
+                'records': records,
+            })
+            self._write_manifest()
+
+    def _write_manifest(self) -> None:
+        """Rewrite the manifest; callers hold the lock."""
+        manifest = {'recorded_at': datetime.now().isoformat(), 'pages': self.pages}
+        (self.run_dir / MANIFEST_NAME).write_text(json.dumps(manifest, indent=2), encoding='utf-8')
+
+
+class FixtureRun:
+    """A recorded run loaded from disk, indexed by URL."""
+
+    def __init__(self, run_dir: Path) -> None:
+        self.run_dir = Path(run_dir)
+        manifest = json.loads((self.run_dir / MANIFEST_NAME).read_text(encoding='utf-8'))
+        self.pages: List[dict] = manifest['pages']
+        self._by_key: Dict[str, dict] = {}
+        self._by_path: Dict[str, dict] = {}
+        for page in self.pages:
+            for url in (page['requested_url'], page['final_url']):
+                # First recording of a URL wins so replays see the same page the run did
+                self._by_key.setdefault(url_key(url), page)
+                self._by_path.setdefault(url_key(url).split('?', 1)[0], page)
+
+    def find(self, url: str) -> Optional[dict]:
+        """Recorded page for a URL, matching on path+query first and then path alone."""
+        key = url_key(url)
+        return self._by_key.get(key) or self._by_path.get(key.split('?', 1)[0])
+
+    def html(self, page: dict) -> str:
+        """HTML snapshot of a recorded page."""
+        return (self.run_dir / page['html']).read_text(encoding='utf-8')
+
+
+class ReplayServer:
+    """Serves a recorded run over local HTTP so a real Chrome can replay it deterministically."""
+
+    def __init__(self, run_dir: Path, host: str = '127.0.0.1', port: int = 0) -> None:
+        self.fixtures = FixtureRun(run_dir)
+        self.logger = logging.getLogger(__name__)
+        fixtures = self.fixtures
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:
+                page = fixtures.find(self.path)
+                if page is None:
+                    self.send_error(404, "No recorded page for this URL")
+                    return
+                body = fixtures.html(page).encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/html; charset=utf-8')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format: str, *args) -> None:
+                pass
+
+        self._server = ThreadingHTTPServer((host, port), Handler)
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        """Root URL the server is listening on."""
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def rewrite(self, url: str) -> str:
+        """Map a live URL onto the replay server; use as Browser.url_rewriter."""
+        return f"{self.base_url}{url_key(url)}"
+
+    def start(self) -> 'ReplayServer':
+        """Serve in a daemon thread."""
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        self.logger.info(f"Replaying {self.fixtures.run_dir} at {self.base_url}")
+        return self
+
+    def stop(self) -> None:
+        """Shut the server down."""
+        self._server.shutdown()
+        self._server.server_close()
+
+
+class ReplayElement:
+    """Minimal WebElement stand-in backed by a parsed HTML node."""
+
+    def __init__(self, node) -> None:
+        self._node = node
+
+    @property
+    def text(self) -> str:
+        return ' '.join(self._node.get_text(' ').split())
+
+    def get_attribute(self, name: str) -> Optional[str]:
+        value = self._node.get(name)
+        return ' '.join(value) if isinstance(value, list) else value
+
+    def find_element(self, by: str = By.ID, value: Optional[str] = None) -> 'ReplayElement':
+        elements = self.find_elements(by, value)
+        if not elements:
+            raise NoSuchElementException(f"{by}={value}")
+        return elements[0]
+
+    def find_elements(self, by: str = By.ID, value: Optional[str] = None) -> List['ReplayElement']:
+        return [ReplayElement(node) for node in self._node.select(_css_for(by, value))]
+
+    def is_displayed(self) -> bool:
+        return True
+
+    def click(self) -> None:
+        pass
+
+    def clear(self) -> None:
+        pass
+
+    def send_keys(self, *keys) -> None:
+        pass
+
+
+class _ReplayWindow:
+    """State of one replayed tab."""
+
+    def __init__(self) -> None:
+        self.page: Optional[dict] = None
+        self.url = "about:blank"
+        self.html = "<html></html>"
+        self.soup = BeautifulSoup(self.html, 'lxml')
+        self.extraction_cursor = 0
+
+
+class ReplayDriver:
+    """Chrome-free driver that serves a recorded run to Browser/JobBot for offline benchmarks."""
+
+    def __init__(self, run_dir: Path) -> None:
+        self.fixtures = FixtureRun(run_dir)
+        self._windows: Dict[str, _ReplayWindow] = {'replay-1': _ReplayWindow()}
+        self._window_ids = itertools.count(2)
+        self.current_window_handle = 'replay-1'
+        self.switch_to = self
+
+    @property
+    def _window(self) -> _ReplayWindow:
+        return self._windows[self.current_window_handle]
+
+    @property
+    def window_handles(self) -> List[str]:
+        return list(self._windows)
+
+    @property
+    def current_url(self) -> str:
+        return self._window.url
+
+    @property
+    def page_source(self) -> str:
+        return self._window.html
+
+    def get(self, url: str) -> None:
+        page = self.fixtures.find(url)
+        if page is None:
+            raise WebDriverException(f"No recorded page for {url}")
+        window = self._window
+        window.page = page
+        window.url = page['final_url']
+        window.html = self.fixtures.html(page)
+        window.soup = BeautifulSoup(window.html, 'lxml')
+        window.extraction_cursor = 0
+
+    def execute(self, driver_command: str, params: Optional[dict] = None) -> dict:
+        # Commands that reach here have no recorded equivalent; treat them as no-ops
+        return {'value': None}
+
+    def execute_script(self, script: str, *args):
+        if script == PAGE_SNAPSHOT_SCRIPT:
+            return [self.page_source, self.current_url]
+        if script == BULK_EXTRACT_SCRIPT:
+            return self._extract(*args)
+        if script == MODAL_STEP_SCRIPT:
+            return self._modal_step(*args)
+        if 'window.open' in script:
+            self._open_window(args[0])
+            return None
+        if 'location.href' in script:
+            with suppress(WebDriverException):
+                self.get(args[0])
+            return None
+        if 'document.readyState' in script:
+            return 'complete'
+        return None
+
+    def execute_async_script(self, script: str, *args):
+        # DOM-settle waits resolve immediately; scroll steps report no new items
+        if 'itemSelector' in script:
+            count = len(self._window.soup.select(args[0]))
+            return [count, count]
+        return True
+
+    def execute_cdp_cmd(self, cmd: str, params: dict) -> dict:
+        return {'cookies': []} if cmd == 'Network.getAllCookies' else {}
+
+    def get_log(self, log_type: str) -> list:
+        raise WebDriverException("Replay driver has no performance log")
+
+    def set_script_timeout(self, seconds: float) -> None:
+        pass
+
+    def find_element(self, by: str = By.ID, value: Optional[str] = None) -> ReplayElement:
+        return ReplayElement(self._window.soup).find_element(by, value)
+
+    def find_elements(self, by: str = By.ID, value: Optional[str] = None) -> List[ReplayElement]:
+        return ReplayElement(self._window.soup).find_elements(by, value)
+
+    def window(self, handle: str) -> None:
+        if handle not in self._windows:
+            raise WebDriverException(f"No such window: {handle}")
+        self.current_window_handle = handle
+
+    def close(self) -> None:
+        self._windows.pop(self.current_window_handle, None)
+
+    def quit(self) -> None:
+        pass
+
+    def _open_window(self, url: str) -> None:
+        """Open a recorded page in a new tab without focusing it."""
+        handle = f"replay-{next(self._window_ids)}"
+        self._windows[handle] = _ReplayWindow()
+        current = self.current_window_handle
+        self.current_window_handle = handle
+        try:
+            self.get(url)
+        except WebDriverException:
+            pass
+        finally:
+            self.current_window_handle = current
+
+    def _modal_step(self, modal_selector, success_selector, success_phrases, button_selectors, roles,
+                    preferred_role=None):
+        """Approximate the modal step inspector from the static snapshot."""
+        soup = self._window.soup
+        success = any(
+            phrase in ReplayElement(node).text.lower()
+            for node in soup.select(success_selector) for phrase in success_phrases
+        )
+        modal = soup.select_one(modal_selector)
+        step = {'present': modal is not None, 'success': success, 'button': None,
+                'role': None, 'required_empty': [], 'errors': []}
+        if modal is None:
+            return step
+        for wanted in ([preferred_role] if preferred_role else []) + [roles]:
+            wanted = [wanted] if isinstance(wanted, str) else wanted
+            for selector in button_selectors:
+                for node in modal.select(selector):
+                    button = ReplayElement(node)
+                    label = f"{button.text} {button.get_attribute('aria-label') or ''}".lower()
+                    role = next((r for r in wanted if r in label), None)
+                    if role:
+                        step['button'], step['role'] = button, role
+                        return step
+        return step
+
+    def _extract(self, root_selector, item_selector, fields, limit):
+        """Serve recorded extraction JSON in order, falling back to parsing the snapshot."""
+        window = self._window
+        extractions = window.page['extractions'] if window.page else []
+        if window.extraction_cursor < len(extractions):
+            recorded = extractions[window.extraction_cursor]
+            if recorded['item_selector'] == item_selector:
+                window.extraction_cursor += 1
+                records = recorded['records']
+                return records[:limit] if limit else records
+        specs = {
+            name: f"{spec['selector'] or ''}@{spec['attr']}" if spec['attr'] else spec['selector']
+            for name, spec in fields.items()
+        }
+        return parse_records(
+            window.html, item_selector, specs, root_selector, limit, base_url=window.url
+        )
+
+
+def _css_for(by: str, value: str) -> str:
+    """Translate a Selenium locator into a CSS selector for the replay DOM."""
+    if by == By.ID:
+        return f"#{value}"
+    if by == By.CLASS_NAME:
+        return f".{value}"
+    if by == By.NAME:
+        return f"[name='{value}']"
+    if by == By.TAG_NAME:
+        return value
+    if by == By.CSS_SELECTOR:
+        return value
+    raise WebDriverException(f"Replay driver does not support {by} locators")
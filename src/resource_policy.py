@@ -0,0 +1,136 @@
+import logging
+from collections import defaultdict, deque
+from typing import Deque, Dict, Iterable, List, Optional
+
+from .config import Config
+
+# URL patterns passed to Network.setBlockedURLs, grouped by category.
+# Extensions end in '*' so URLs with a query string or fragment match too.
+RESOURCE_PATTERNS: Dict[str, List[str]] = {
+    'images': [
+        '*.png*', '*.jpg*', '*.jpeg*', '*.gif*', '*.webp*', '*.svg*', '*.ico*',
+        '*media.licdn.com/dms/image*',
+    ],
+    'media': ['*.mp4*', '*.webm*', '*.m3u8*', '*.mp3*', '*.ogg*', '*dms.licdn.com/playlist*'],
+    'fonts': ['*.woff*', '*.ttf*', '*.otf*', '*.eot*'],
+    'analytics': [
+        '*google-analytics.com*', '*googletagmanager.com*', '*doubleclick.net*',
+        '*px.ads.linkedin.com*', '*li.protechts.net*', '*bat.bing.com*',
+        '*connect.facebook.net*', '*hotjar.com*', '*scorecardresearch.com*',
+    ],
+}
+
+# Typical encoded size per CDP resource type, used until real loads have been observed
+DEFAULT_RESOURCE_BYTES: Dict[str, int] = {
+    'Image': 40_000,
+    'Media': 500_000,
+    'Font': 35_000,
+    'Script': 30_000,
+    'Other': 5_000,
+}
+
+
+class ResourcePolicy:
+    """Set of resource categories to block through CDP during scraping."""
+
+    def __init__(self, categories: Iterable[str]) -> None:
+        self.categories = [c.strip() for c in categories if c.strip()]
+        unknown = [c for c in self.categories if c not in RESOURCE_PATTERNS]
+        if unknown:
+            raise ValueError(f"Unknown resource categories: {', '.join(unknown)}")
+
+    @classmethod
+    def from_config(cls) -> Optional['ResourcePolicy']:
+        """Build the configured scraping policy, or None when blocking is disabled."""
+        if not Config.RESOURCE_BLOCKING:
+            return None
+        return cls(Config.BLOCKED_RESOURCE_TYPES.split(','))
+
+    @property
+    def patterns(self) -> List[str]:
+        """All URL patterns for the enabled categories."""
+        return [p for category in self.categories for p in RESOURCE_PATTERNS[category]]
+
+    def apply(self, driver) -> None:
+        """Enforce the policy on a Chrome driver."""
+        driver.execute_cdp_cmd('Network.enable', {})
+        driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': self.patterns})
+
+    @staticmethod
+    def clear(driver) -> None:
+        """Stop blocking any URLs on a Chrome driver."""
+        driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': []})
+
+
+class PageWeightMeter:
+    """Accumulates transferred and blocked requests per page from CDP network events."""
+
+    def __init__(self, history: int = 50) -> None:
+        self.logger = logging.getLogger(__name__)
+        self.reports: Deque[dict] = deque(maxlen=history)
+        self._request_types: Dict[str, str] = {}
+        self._observed_bytes: Dict[str, List[int]] = defaultdict(lambda: [0, 0])
+        self._url: Optional[str] = None
+        self._reset_page()
+
+    def on_event(self, event: dict) -> None:
+        """NetworkLog listener that classifies finished and blocked requests."""
+        method = event['method']
+        params = event['params']
+        request_id = params.get('requestId')
+        if method == 'Network.requestWillBeSent':
+            self._request_types[request_id] = params.get('type', 'Other')
+        elif method == 'Network.loadingFinished':
+            size = int(params.get('encodedDataLength', 0))
+            resource_type = self._request_types.pop(request_id, 'Other')
+            self._transferred += size
+            self._requests += 1
+            # Running totals per type give a better estimate of what blocking saves
+            observed = self._observed_bytes[resource_type]
+            observed[0] += size
+            observed[1] += 1
+        elif method == 'Network.loadingFailed' and params.get('blockedReason'):
+            resource_type = params.get('type') or self._request_types.get(request_id, 'Other')
+            self._request_types.pop(request_id, None)
+            self._blocked[resource_type] += 1
+
+    def start_page(self, url: str) -> Optional[dict]:
+        """Close out the previous page's report and start counting for a new URL."""
+        report = self.finish_page()
+        self._url = url
+        return report
+
+    def finish_page(self) -> Optional[dict]:
+        """Produce and log the report for the current page, if one was started."""
+        if self._url is None:
+            return None
+        saved = sum(self.estimated_bytes(t) * count for t, count in self._blocked.items())
+        report = {
+            'url': self._url,
+            'requests': self._requests,
+            'bytes_transferred': self._transferred,
+            'blocked_requests': dict(self._blocked),
+            'estimated_bytes_saved': saved,
+        }
+        self.reports.append(report)
+        self.logger.info(
+            f"Page weight for {self._url}: {self._transferred / 1024:.0f} KB over "
+            f"{self._requests} requests, {sum(self._blocked.values())} blocked "
+            f"(~{saved / 1024:.0f} KB saved)"
+        )
+        self._url = None
+        self._reset_page()
+        return report
+
+    def estimated_bytes(self, resource_type: str) -> int:
+        """Average observed size for a resource type, falling back to a typical size."""
+        total, count = self._observed_bytes.get(resource_type, (0, 0))
+        if count:
+            return total // count
+        return DEFAULT_RESOURCE_BYTES.get(resource_type, DEFAULT_RESOURCE_BYTES['Other'])
+
+    def _reset_page(self) -> None:
+        """Zero the per-page counters."""
+        self._transferred = 0
+        self._requests = 0
+        self._blocked: Dict[str, int] = defaultdict(int)
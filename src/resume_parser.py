@@ -50,7 +50,8 @@ class ResumeParser:
             'experience_years': None,
             'skills': self._extract_skills(text),
             'name': None,
-            'location': None
+            'location': None,
+            'text': text
         }
         
         return info
@@ -0,0 +1,226 @@
+import asyncio
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Callable, Iterator, List, Optional, Tuple
+
+from .browser import Browser
+from .config import Config
+from .job_record import JobRecord
+
+if TYPE_CHECKING:
+    from .job_bot import JobBot
+
+
+@dataclass
+class CellResult:
+    """Outcome of one keyword/location search."""
+
+    keyword: str
+    location: str
+    worker: int
+    cards: int = 0
+    new_jobs: int = 0
+    elapsed: float = 0.0
+    error: Optional[str] = None
+
+
+class SearchGrid:
+    """Runs a JobBot's keyword x location searches concurrently over pooled browsers.
+
+    The bot's own browser starts on the first cell straight away; up to
+    concurrency - 1 more, no more than the pool has free, are leased, given
+    the bot's session cookies and join as they come up. Selenium calls run
+    in a thread per browser while merging and deduplication stay on the
+    event loop.
+    """
+
+    def __init__(
+        self,
+        bot: 'JobBot',
+        concurrency: int = Config.SEARCH_GRID_CONCURRENCY,
+        lease_timeout: float = Config.SEARCH_GRID_LEASE_TIMEOUT
+    ) -> None:
+        self.bot = bot
+        self.concurrency = max(1, concurrency)
+        self.lease_timeout = lease_timeout
+        self.logger = logging.getLogger(__name__)
+        self.results: List[CellResult] = []
+        self._emitted = 0
+        self._cancel = threading.Event()
+
+    def run_sync(self, keywords: List[str], locations: List[str]) -> List[JobRecord]:
+        """Blocking entry point for synchronous callers.
+
+        asyncio.run refuses to start inside a running event loop (e.g. a sync
+        helper called from async code), so there the grid gets its own thread.
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(self.run(keywords, locations))
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="search-grid") as executor:
+            return executor.submit(asyncio.run, self.run(keywords, locations)).result()
+
+    def iter_jobs(self, keywords: List[str], locations: List[str]) -> Iterator[JobRecord]:
+        """Yield merged, deduplicated jobs as cells finish, with the grid running in the background."""
+        # Bounded so a slow consumer holds the grid back instead of letting jobs pile up
+        jobs: queue.Queue = queue.Queue(maxsize=Config.SEARCH_STREAM_BUFFER)
+        done = object()
+        failure: List[BaseException] = []
+        self._cancel.clear()
+
+        def put(item) -> None:
+            # Gives up once the consumer has stopped iterating
+            while not self._cancel.is_set():
+                try:
+                    jobs.put(item, timeout=0.5)
+                    return
+                except queue.Full:
+                    continue
+
+        def produce() -> None:
+            try:
+                asyncio.run(self.run(keywords, locations, emit=put))
+            except BaseException as e:
+                failure.append(e)
+            finally:
+                put(done)
+
+        producer = threading.Thread(target=produce, name="search-grid", daemon=True)
+        producer.start()
+        try:
+            while True:
+                job = jobs.get()
+                if job is done:
+                    break
+                yield job
+        finally:
+            # Abandoned early: finish the cells in flight but start no new ones
+            self._cancel.set()
+            producer.join()
+        if failure:
+            raise failure[0]
+
+    async def run(
+        self,
+        keywords: List[str],
+        locations: List[str],
+        emit: Optional[Callable[[JobRecord], None]] = None
+    ) -> List[JobRecord]:
+        """Search every cell and return the merged, deduplicated jobs.
+
+        With emit, each job is handed to it as soon as its cell finishes and
+        nothing is accumulated.
+        """
+        cells: asyncio.Queue = asyncio.Queue()
+        for keyword in keywords:
+            for location in locations:
+                cells.put_nowait((keyword, location))
+
+        # Extra browsers only come from the pool's spare capacity; waiting for one
+        # another stage holds (e.g. the pipeline's apply workers) would only cost the lease timeout
+        spare = self.bot.pool.available
+        workers = min(self.concurrency, cells.qsize(), 1 + spare)
+        if workers < min(self.concurrency, cells.qsize()):
+            self.logger.info(f"Search grid limited to {workers} browsers: {spare} free in the pool")
+        cookies = self.bot.browser.session_cookies()
+        jobs: List[JobRecord] = []
+        start = time.monotonic()
+        self.results = []
+        self._emitted = 0
+        emit = emit or jobs.append
+
+        executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="search-grid")
+        try:
+            await asyncio.gather(*(
+                self._worker(index, cells, emit, executor, cookies) for index in range(workers)
+            ))
+        finally:
+            executor.shutdown(wait=True)
+
+        self._log_report(time.monotonic() - start, self._emitted)
+        return jobs
+
+    async def _worker(
+        self,
+        index: int,
+        cells: asyncio.Queue,
+        emit: Callable[[JobRecord], None],
+        executor: ThreadPoolExecutor,
+        cookies: List[dict]
+    ) -> None:
+        """Take cells off the queue until it is empty or this worker's browser fails."""
+        loop = asyncio.get_running_loop()
+        browser = self.bot.browser
+        leased = index > 0
+        if leased:
+            browser = await loop.run_in_executor(executor, self._lease, cookies)
+            if browser is None:
+                return
+
+        try:
+            while not self._cancel.is_set():
+                try:
+                    keyword, location = cells.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                result = CellResult(keyword, location, index)
+                started = time.monotonic()
+                try:
+                    records = await loop.run_in_executor(
+                        executor, self.bot.search_cell, browser, keyword, location
+                    )
+                    result.cards = len(records)
+                    # Merging runs on the event loop thread, so the card filter needs no locking
+                    found = self.bot._new_jobs_from_cards(records)
+                    result.new_jobs = len(found)
+                    self._emitted += len(found)
+                    for job in found:
+                        emit(job)
+                except Exception as e:
+                    result.error = str(e)
+                    self.logger.error(f"Search {keyword!r} in {location!r} failed: {result.error}")
+                finally:
+                    result.elapsed = time.monotonic() - started
+                    self.results.append(result)
+
+                if result.error and not await loop.run_in_executor(executor, browser.is_healthy):
+                    self.logger.warning(f"Search worker {index} stopping: browser is unhealthy")
+                    return
+        finally:
+            if leased:
+                await loop.run_in_executor(executor, self.bot.pool.release, browser)
+
+    def _lease(self, cookies: List[dict]) -> Optional[Browser]:
+        """Borrow an extra browser and log it into the bot's session."""
+        try:
+            browser = self.bot.pool.acquire(timeout=self.lease_timeout)
+        except Exception as e:
+            self.logger.info(f"Running the search grid with fewer browsers: {str(e)}")
+            return None
+        # Whatever session the pooled browser held, it now runs as the bot's user
+        browser.clear_session()
+        if browser.restore_cookies(cookies):
+            browser.session_user = self.bot.session_key
+            browser.session_validated_at = self.bot.browser.session_validated_at
+        return browser
+
+    def failures(self) -> List[Tuple[str, str, str]]:
+        """(keyword, location, error) of every failed cell."""
+        return [(r.keyword, r.location, r.error) for r in self.results if r.error]
+
+    def _log_report(self, wall: float, total: int) -> None:
+        """Log per-cell timing and the overall speedup over running the cells back to back."""
+        serial = sum(r.elapsed for r in self.results)
+        lines = [
+            f"Search grid: {len(self.results)} cells, {total} unique jobs in {wall:.1f}s "
+            f"({serial:.1f}s of cell time, {serial / wall if wall else 0:.1f}x)"
+        ]
+        for r in sorted(self.results, key=lambda r: r.elapsed, reverse=True):
+            status = f"FAILED: {r.error}" if r.error else f"{r.cards} cards, {r.new_jobs} new"
+            lines.append(f"  [{r.worker}] {r.keyword} / {r.location}: {r.elapsed:.1f}s, {status}")
+        self.logger.info("\n".join(lines))
@@ -0,0 +1,295 @@
+import hashlib
+import logging
+import math
+import mmap
+import os
+import struct
+import threading
+from collections import Counter
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Generator, Iterable, Optional, Set
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+from .config import Config
+from .job_record import canonical_job_url, job_id_from_url
+
+MAGIC = b"SEENJOB1"
+# magic, bit count, hash count, capacity, items added
+HEADER = struct.Struct("<8sQIQQ")
+
+
+def _lock(f) -> None:
+    """Block until this process holds the exclusive lock on an open file."""
+    if fcntl is not None:
+        fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        return
+    f.seek(0)
+    while True:
+        try:
+            # LK_LOCK gives up after ten one-second retries; keep waiting like flock does
+            msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+            return
+        except OSError:
+            continue
+
+
+def _unlock(f) -> None:
+    if fcntl is not None:
+        fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+    else:
+        f.seek(0)
+        msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+def _hash_pair(job_id: str) -> tuple:
+    """Two independent 64-bit hashes of a job id for double hashing."""
+    digest = hashlib.blake2b(str(job_id).encode('utf-8'), digest_size=16).digest()
+    return struct.unpack("<QQ", digest)
+
+
+class SeenJobs:
+    """Memory-mapped Bloom filter of job ids that have been stored in the jobs table.
+
+    Membership never touches the database; a hit may be a false positive at
+    roughly error_rate and must be confirmed, a miss is definitive. The file
+    is shared by worker processes: it only appears once fully built, and
+    writers hold an exclusive lock on a sidecar .lock file (flock, or
+    msvcrt.locking on Windows) so concurrent adds never lose bits.
+    """
+
+    def __init__(
+        self,
+        path: Path = Path(Config.SEEN_JOBS_PATH),
+        capacity: int = Config.SEEN_JOBS_CAPACITY,
+        error_rate: float = Config.SEEN_JOBS_ERROR_RATE,
+        seed: Optional[Callable[['SeenJobs'], int]] = None
+    ) -> None:
+        self.logger = logging.getLogger(__name__)
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self.created = False
+        self.seeded = 0
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock_file = open(self.path.with_name(f"{self.path.name}.lock"), 'a+b')
+
+        try:
+            if not self.path.exists():
+                self._create(capacity, error_rate, seed)
+            self._open(self.path)
+        except Exception:
+            self._lock_file.close()
+            raise
+
+    def _open(self, path: Path) -> None:
+        self._file = open(path, 'r+b')
+        self._map = mmap.mmap(self._file.fileno(), 0)
+        magic, self.bits, self.hashes, self.capacity, _ = HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not a seen-jobs filter")
+
+    def _create(self, capacity: int, error_rate: float, seed: Optional[Callable[['SeenJobs'], int]]) -> None:
+        """Build and seed the filter in a private file, then link it into place unless another process won."""
+        bits = max(64, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        hashes = max(1, round(bits / capacity * math.log(2)))
+        tmp = self.path.with_name(f"{self.path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            with open(tmp, 'wb') as f:
+                f.write(HEADER.pack(MAGIC, bits, hashes, capacity, 0))
+                f.truncate(HEADER.size + (bits + 7) // 8)
+            self._open(tmp)
+            try:
+                if seed is not None:
+                    self.seeded = seed(self)
+                self._map.flush()
+            finally:
+                # Windows cannot unlink a mapped file; the published one is mapped afresh
+                self._map.close()
+                self._file.close()
+            try:
+                # Unlike os.replace, link never clobbers a filter another process already maps
+                os.link(tmp, self.path)
+                self.created = True
+            except FileExistsError:
+                pass
+        finally:
+            tmp.unlink(missing_ok=True)
+
+    @contextmanager
+    def _exclusive(self) -> Generator[None, None, None]:
+        """Hold the thread lock and an exclusive lock on the filter across processes."""
+        with self._lock:
+            _lock(self._lock_file)
+            try:
+                yield
+            finally:
+                _unlock(self._lock_file)
+
+    @property
+    def count(self) -> int:
+        """Number of ids added (including repeats of ids already present)."""
+        return HEADER.unpack_from(self._map, 0)[4]
+
+    def _positions(self, job_id: str):
+        h1, h2 = _hash_pair(job_id)
+        return ((h1 + i * h2) % self.bits for i in range(self.hashes))
+
+    def __contains__(self, job_id: object) -> bool:
+        if not job_id:
+            return False
+        data = self._map
+        return all(data[HEADER.size + pos // 8] & (1 << (pos % 8)) for pos in self._positions(str(job_id)))
+
+    def add(self, job_id: str) -> None:
+        """Mark job_id as seen."""
+        self.update([job_id])
+
+    def update(self, job_ids: Iterable[str]) -> None:
+        """Mark many job ids as seen under one file lock."""
+        job_ids = [str(job_id) for job_id in job_ids if job_id]
+        if not job_ids:
+            return
+        with self._exclusive():
+            data = self._map
+            for job_id in job_ids:
+                for pos in self._positions(job_id):
+                    data[HEADER.size + pos // 8] |= 1 << (pos % 8)
+            before = self.count
+            count = before + len(job_ids)
+            struct.pack_into("<Q", data, HEADER.size - 8, count)
+        if before <= self.capacity < count:
+            self.logger.warning(
+                f"Seen-jobs filter passed its capacity of {self.capacity}; false positives will rise"
+            )
+
+    def flush(self) -> None:
+        """Write dirty pages back to disk."""
+        self._map.flush()
+
+    def close(self) -> None:
+        """Flush and unmap the filter."""
+        with self._lock:
+            if self._map.closed:
+                return
+            self._map.flush()
+            self._map.close()
+            self._file.close()
+            self._lock_file.close()
+
+
+def job_stored(job_id: str, db=None) -> bool:
+    """Confirm a filter hit against the jobs table by its canonical URL."""
+    from .models import Job, SessionLocal
+
+    session = db or SessionLocal()
+    try:
+        return session.query(Job.id).filter(Job.url == canonical_job_url(job_id)).first() is not None
+    finally:
+        if db is None:
+            session.close()
+
+
+def canonicalize_job_urls(db) -> int:
+    """Rewrite job URLs stored with tracking parameters to their canonical form; return how many changed.
+
+    Rows stored before job URLs were canonicalized keep the URL they were
+    scraped with. This runs once, when the seen-jobs filter is built, so
+    that job_stored can always match exactly.
+    """
+    from .models import Job
+
+    rows = db.query(Job.id, Job.url).all()
+    stored = {url for _, url in rows}
+    updates = []
+    for row_id, url in rows:
+        job_id = job_id_from_url(url)
+        canonical = canonical_job_url(job_id) if job_id else url
+        # A posting stored twice keeps its legacy duplicate; the canonical row already matches
+        if canonical not in stored:
+            stored.add(canonical)
+            updates.append({'id': row_id, 'url': canonical})
+    if updates:
+        db.bulk_update_mappings(Job, updates)
+        db.commit()
+    return len(updates)
+
+
+def seed_from_jobs_table(seen: SeenJobs) -> int:
+    """Add the id of every stored job to the filter and return how many were added."""
+    from .card_filter import known_job_ids
+    from .models import Job, SessionLocal
+
+    db = SessionLocal()
+    try:
+        canonicalized = canonicalize_job_urls(db)
+        if canonicalized:
+            seen.logger.info(f"Canonicalized {canonicalized} legacy job URLs")
+        ids = known_job_ids(url for (url,) in db.query(Job.url))
+    finally:
+        db.close()
+    seen.update(ids)
+    return len(ids)
+
+
+class KnownJobs:
+    """Container of already-stored job ids: Bloom filter first, database only on hits.
+
+    Ids added during the current run are known immediately, without being
+    written to the filter until they are actually stored.
+    """
+
+    def __init__(
+        self,
+        seen: Optional[SeenJobs] = None,
+        confirm: Callable[[str], bool] = job_stored
+    ) -> None:
+        self._seen = seen
+        self.confirm = confirm
+        self.run_ids: Set[str] = set()
+        self.counts: Counter = Counter()
+
+    @property
+    def seen(self) -> SeenJobs:
+        """The Bloom filter, opened on first lookup."""
+        if self._seen is None:
+            self._seen = get_seen_jobs()
+        return self._seen
+
+    def __contains__(self, job_id: object) -> bool:
+        job_id = str(job_id)
+        self.counts['lookups'] += 1
+        if job_id in self.run_ids:
+            return True
+        if job_id not in self.seen:
+            return False
+        self.counts['filter_hits'] += 1
+        if self.confirm(job_id):
+            return True
+        self.counts['false_positives'] += 1
+        return False
+
+    def add(self, job_id: str) -> None:
+        """Treat job_id as known for the rest of this run."""
+        self.run_ids.add(job_id)
+
+
+_default_seen: Optional[SeenJobs] = None
+_default_seen_lock = threading.Lock()
+
+
+def get_seen_jobs() -> SeenJobs:
+    """Return the process-wide seen-jobs filter, creating and seeding it on first use."""
+    global _default_seen
+    with _default_seen_lock:
+        if _default_seen is None:
+            # A seed failure leaves no file behind, so an empty filter never claims nothing was stored
+            seen = SeenJobs(seed=seed_from_jobs_table)
+            if seen.created:
+                seen.logger.info(f"Seeded seen-jobs filter with {seen.seeded} stored jobs")
+            _default_seen = seen
+        return _default_seen
@@ -0,0 +1,149 @@
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional
+
+from cryptography.fernet import Fernet, InvalidToken
+
+from .config import Config
+
+if TYPE_CHECKING:
+    from .browser import Browser
+
+# A redirect to any of these means the session cookies were not accepted
+LOGGED_OUT_URL_MARKERS = ('/login', '/authwall', '/checkpoint', '/uas/login')
+
+
+class SessionManager:
+    """Keeps each user's LinkedIn cookies in an encrypted local store.
+
+    A session that passed a login check less than ttl seconds ago is
+    trusted without another check: a browser that already holds it skips
+    login entirely, and a fresh browser just gets the cookies installed.
+    """
+
+    def __init__(
+        self,
+        store_dir: Path = Path(Config.SESSION_STORE_DIR),
+        key: Optional[str] = Config.SESSION_ENCRYPTION_KEY,
+        ttl: float = Config.SESSION_VALID_TTL
+    ) -> None:
+        self.logger = logging.getLogger(__name__)
+        self.store_dir = Path(store_dir)
+        self.store_dir.mkdir(parents=True, exist_ok=True)
+        self.ttl = ttl
+        self._fernet = Fernet(key.encode() if key else self._local_key())
+
+    def _local_key(self) -> bytes:
+        """Key kept next to the store, readable only by this user, when none is configured."""
+        key_file = self.store_dir / ".key"
+        if key_file.exists():
+            return key_file.read_bytes().strip()
+        key = Fernet.generate_key()
+        # mkstemp creates the file 0600; linking publishes it fully written, so a
+        # process racing us never reads an empty key, and the first link wins
+        tmp = Path(self._write_temp(key_file, key))
+        try:
+            os.link(tmp, key_file)
+        except FileExistsError:
+            return key_file.read_bytes().strip()
+        finally:
+            tmp.unlink(missing_ok=True)
+        return key
+
+    @staticmethod
+    def _write_temp(path: Path, data: bytes) -> str:
+        """Write data to a uniquely named temp file next to path and return its name."""
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f"{path.name}.", suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+        return tmp
+
+    def _path(self, user_key: str) -> Path:
+        # Hash so email addresses never appear in file names
+        name = hashlib.sha256(user_key.encode('utf-8')).hexdigest()[:32]
+        return self.store_dir / f"{name}.session"
+
+    def load(self, user_key: str) -> Optional[dict]:
+        """Stored session of a user ({'cookies', 'validated_at'}), or None."""
+        path = self._path(user_key)
+        if not path.exists():
+            return None
+        try:
+            return json.loads(self._fernet.decrypt(path.read_bytes()))
+        except (InvalidToken, ValueError) as e:
+            self.logger.warning(f"Discarding unreadable saved session: {str(e)}")
+            path.unlink(missing_ok=True)
+            return None
+
+    def is_fresh(self, session: Optional[dict]) -> bool:
+        """Whether a stored session passed a login check within the TTL."""
+        return bool(session) and time.time() - session.get('validated_at', 0) < self.ttl
+
+    def browser_is_current(self, browser: 'Browser', user_key: str) -> bool:
+        """The browser already holds this user's session and it was validated within the TTL."""
+        return (
+            browser.session_user == user_key
+            and time.monotonic() - browser.session_validated_at < self.ttl
+        )
+
+    def restore(self, browser: 'Browser', user_key: str) -> Optional[dict]:
+        """Install the user's saved cookies into browser; return the stored session, if any."""
+        if browser.session_user not in (None, user_key):
+            # Never let one user's cookies leak into another user's run
+            browser.clear_session()
+        session = self.load(user_key)
+        if not session or not browser.restore_cookies(session.get('cookies', [])):
+            return None
+        browser.session_user = user_key
+        return session
+
+    def save(self, browser: 'Browser', user_key: str) -> None:
+        """Store the browser's cookies as a known-good session for user_key."""
+        cookies = browser.session_cookies()
+        if not cookies:
+            return
+        payload = json.dumps({'cookies': cookies, 'validated_at': time.time()}).encode('utf-8')
+        path = self._path(user_key)
+        # A unique temp file per save, so workers in other processes never write over ours
+        tmp = self._write_temp(path, self._fernet.encrypt(payload))
+        try:
+            os.replace(tmp, path)
+        except OSError:
+            os.unlink(tmp)
+            raise
+        browser.session_user = user_key
+        browser.session_validated_at = time.monotonic()
+
+    def invalidate(self, browser: 'Browser', user_key: str) -> None:
+        """Forget a session that turned out to be logged out."""
+        self._path(user_key).unlink(missing_ok=True)
+        browser.session_user = None
+        browser.session_validated_at = 0.0
+
+    @staticmethod
+    def looks_logged_out(url: Optional[str]) -> bool:
+        """Whether a final URL is LinkedIn's login wall rather than the requested page."""
+        return bool(url) and any(marker in url for marker in LOGGED_OUT_URL_MARKERS)
+
+
+_default_manager: Optional[SessionManager] = None
+_default_manager_lock = threading.Lock()
+
+
+def get_session_manager() -> SessionManager:
+    """Return the process-wide session manager, creating it on first use."""
+    global _default_manager
+    with _default_manager_lock:
+        if _default_manager is None:
+            _default_manager = SessionManager()
+        return _default_manager
@@ -125,9 +125,9 @@ async def test_browser() -> bool:
             
             if browser.apply_to_job(job):
                 applications_submitted += 1
-                logger.info(f"Successfully applied to {job['title']}")
+                logger.info(f"Successfully applied to {job.title}")
             else:
-                logger.error(f"Failed to apply to {job['title']}")
+                logger.error(f"Failed to apply to {job.title}")
             
             # Wait between applications
             if index < total_jobs_found:
@@ -9,6 +9,7 @@ from apscheduler.schedulers.background import BackgroundScheduler
 from ..job_bot import JobBot
 from ..models import Job, SessionLocal
 from ..config import Config
+from ..worker import enqueue_bot_run
 
 app = Flask(__name__)
 app.config['SECRET_KEY'] = os.urandom(24)
@@ -73,8 +74,9 @@ def start_bot():
     if not user.preferences:
         return jsonify({'error': 'Please set job preferences first'}), 400
     
+    # The scheduler only queues runs; worker processes (python -m src.worker) execute them
     scheduler.add_job(
-        func=run_job_bot,
+        func=enqueue_bot_run,
         trigger='cron',
         hour='9-18',
         id=f'job_bot_{user.id}',
@@ -91,19 +93,8 @@ def stop_bot():
     return jsonify({'message': 'Bot stopped successfully'})
 
 def run_job_bot(user_id):
-    user = User.query.get(user_id)
-    if not user or not user.is_active:
-        return
-    
-    bot = JobBot()
-    try:
-        jobs = bot.search_jobs(
-            keywords=[user.preferences.get('job_role')],
-            locations=user.preferences.get('locations', ['Remote'])
-        )
-        # Process and apply to jobs
-    finally:
-        bot.close()
+    """Queue a bot run for the user instead of running it in the web process"""
+    return enqueue_bot_run(user_id)
 
 def allowed_file(filename):
     return '.' in filename and filename.rsplit('.', 1)[1].lower() in {'pdf', 'docx'}
@@ -0,0 +1,315 @@
+"""Worker fleet that runs queued per-user bot sessions outside the web process.
+
+Web schedulers only call enqueue_bot_run(); start one or more workers with
+
+    python -m src.worker --concurrency 4
+
+Each worker claims runs from the bot_runs table and executes them in a
+process pool, so a crashed or wedged Chrome session only takes down its
+own child process. Any number of workers on any number of machines can
+share one database.
+"""
+import argparse
+import logging
+import multiprocessing
+import os
+import signal
+import socket
+import threading
+from concurrent.futures import CancelledError, Future, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from datetime import datetime, timedelta
+from typing import Dict, Optional
+
+from sqlalchemy import func
+
+from .config import Config
+from .models import BotRun, SessionLocal, User
+
+logger = logging.getLogger(__name__)
+
+ACTIVE_STATUSES = ('queued', 'running')
+
+
+def enqueue_bot_run(user_id: int) -> Optional[int]:
+    """Queue a bot run for user_id unless one is already queued or running; return its id."""
+    db = SessionLocal()
+    try:
+        active = db.query(BotRun.id).filter(
+            BotRun.user_id == user_id, BotRun.status.in_(ACTIVE_STATUSES)
+        ).first()
+        if active:
+            logger.info(f"Bot run for user {user_id} already pending (run {active[0]})")
+            return None
+        run = BotRun(user_id=user_id, status='queued', enqueued_at=datetime.utcnow())
+        db.add(run)
+        db.commit()
+        return run.id
+    finally:
+        db.close()
+
+
+def run_job_search(user_id: int) -> int:
+    """Search for the user's preferred roles and store new jobs; return how many were added."""
+    from .job_bot import JobBot
+    from .job_sink import JobSink
+
+    db = SessionLocal()
+    try:
+        user = db.query(User).get(user_id)
+        if not user or not user.is_active:
+            return 0
+
+        job_bot = JobBot(user_id=user_id)
+        try:
+            preferences = user.preferences or {}
+            keywords = preferences.get('job_role', ['Software Engineer'])
+            if isinstance(keywords, str):
+                keywords = [keywords]
+            locations = preferences.get('locations', ['Remote'])
+
+            logger.info(f"Starting job search for {keywords} in {locations}")
+            # Jobs are committed in small batches while the search is still running
+            with JobSink(user_id, db=db) as sink:
+                added = sink.consume(job_bot.iter_jobs(keywords, locations))
+            logger.info(f"Added {added} new jobs to the database ({sink.duplicates} duplicates skipped)")
+            return added
+        finally:
+            job_bot.close()
+    finally:
+        db.close()
+
+
+def _execute_run(run_id: int, user_id: int) -> int:
+    """Body of one bot run inside a pool process."""
+    logger.info(f"Worker process {os.getpid()} starting run {run_id} for user {user_id}")
+    if Config.AUTO_APPLY:
+        from .pipeline import run_application_pipeline
+        return run_application_pipeline(user_id)['stored']
+    return run_job_search(user_id)
+
+
+_eviction_scheduler = None
+
+
+def _start_browser_eviction() -> None:
+    """Pool process initializer: close warm browsers that no run has borrowed recently.
+
+    The browsers live in the pool processes that execute the runs, so this is
+    where their idle eviction has to be scheduled.
+    """
+    global _eviction_scheduler
+    from apscheduler.schedulers.background import BackgroundScheduler
+    from .browser_pool import get_browser_pool
+
+    _eviction_scheduler = BackgroundScheduler(daemon=True)
+    _eviction_scheduler.add_job(
+        func=lambda: get_browser_pool().evict_idle(),
+        trigger='interval',
+        minutes=5,
+        id='browser_pool_eviction',
+        replace_existing=True
+    )
+    _eviction_scheduler.start()
+
+
+class WorkerFleet:
+    """Claims queued bot runs and executes them in a pool of worker processes."""
+
+    def __init__(
+        self,
+        concurrency: int = Config.WORKER_CONCURRENCY,
+        poll_interval: float = Config.WORKER_POLL_INTERVAL,
+        max_attempts: int = Config.WORKER_MAX_ATTEMPTS
+    ) -> None:
+        self.concurrency = max(1, concurrency)
+        self.poll_interval = poll_interval
+        self.max_attempts = max(1, max_attempts)
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}"
+        self.logger = logging.getLogger(__name__)
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._inflight: Dict[int, Future] = {}
+        self._run_pools: Dict[int, ProcessPoolExecutor] = {}  # pool each in-flight run was submitted to
+        self._stop = threading.Event()
+
+    def run_forever(self) -> None:
+        """Claim and run bot runs until stop() is called, then wait for in-flight runs."""
+        self.logger.info(f"Worker {self.worker_id} running up to {self.concurrency} bot runs")
+        try:
+            while not self._stop.is_set():
+                self.heartbeat()
+                # Other workers may die at any time, not only before this one started
+                self.fail_stale_runs()
+                self._reap()
+                while len(self._inflight) < self.concurrency and not self._stop.is_set():
+                    claimed = self.claim_next()
+                    if claimed is None:
+                        break
+                    self._submit(*claimed)
+                self._stop.wait(self.poll_interval)
+        finally:
+            self.logger.info(f"Worker {self.worker_id} draining {len(self._inflight)} runs")
+            # Keep heartbeating, or other workers would fail the runs still draining
+            while self._inflight:
+                self.heartbeat()
+                wait(list(self._inflight.values()), timeout=self.poll_interval)
+                self._reap()
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+
+    def stop(self, *_args) -> None:
+        """Stop claiming new runs."""
+        self._stop.set()
+
+    def claim_next(self) -> Optional[tuple]:
+        """Atomically claim the oldest queued run whose user has nothing running."""
+        db = SessionLocal()
+        try:
+            running_users = db.query(BotRun.user_id).filter(BotRun.status == 'running')
+            candidates = db.query(BotRun.id, BotRun.user_id).filter(
+                BotRun.status == 'queued', ~BotRun.user_id.in_(running_users)
+            ).order_by(BotRun.enqueued_at).limit(self.concurrency).all()
+
+            for run_id, user_id in candidates:
+                # The status check makes the claim safe against other workers
+                claimed = db.query(BotRun).filter(
+                    BotRun.id == run_id, BotRun.status == 'queued'
+                ).update({
+                    'status': 'running',
+                    'worker': self.worker_id,
+                    'started_at': datetime.utcnow(),
+                    'last_seen_at': datetime.utcnow(),
+                    'attempts': BotRun.attempts + 1,
+                }, synchronize_session=False)
+                db.commit()
+                if claimed == 1:
+                    return run_id, user_id
+            return None
+        finally:
+            db.close()
+
+    def heartbeat(self) -> None:
+        """Mark this worker's in-flight runs as alive."""
+        if not self._inflight:
+            return
+        db = SessionLocal()
+        try:
+            db.query(BotRun).filter(
+                BotRun.id.in_(list(self._inflight)), BotRun.status == 'running'
+            ).update({'last_seen_at': datetime.utcnow()}, synchronize_session=False)
+            db.commit()
+        finally:
+            db.close()
+
+    def fail_stale_runs(self) -> int:
+        """Fail runs whose worker has stopped heartbeating, however long they have been running."""
+        cutoff = datetime.utcnow() - timedelta(seconds=Config.WORKER_STALE_RUN_TIMEOUT)
+        db = SessionLocal()
+        try:
+            # Runs claimed before heartbeats existed only have started_at
+            last_seen = func.coalesce(BotRun.last_seen_at, BotRun.started_at)
+            # Our own runs are still tracked in _inflight and finish through _reap()
+            count = db.query(BotRun).filter(
+                BotRun.status == 'running', last_seen < cutoff,
+                ~BotRun.id.in_(list(self._inflight))
+            ).update({
+                'status': 'failed',
+                'error': 'abandoned by worker',
+                'finished_at': datetime.utcnow(),
+            }, synchronize_session=False)
+            db.commit()
+            if count:
+                self.logger.warning(f"Marked {count} abandoned bot runs as failed")
+            return count
+        finally:
+            db.close()
+
+    def _pool(self) -> ProcessPoolExecutor:
+        """The process pool, rebuilt after a child crash breaks it."""
+        if self._executor is None:
+            # Chrome and SQLAlchemy connections must not be inherited through fork
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.concurrency, mp_context=multiprocessing.get_context('spawn'),
+                initializer=_start_browser_eviction
+            )
+        return self._executor
+
+    def _drop_pool(self, executor: Optional[ProcessPoolExecutor]) -> None:
+        """Discard a broken pool so the next submit builds a fresh one."""
+        if executor is None:
+            return
+        # Reaps the dead pool's management thread and surviving children without blocking
+        executor.shutdown(wait=False, cancel_futures=True)
+        if executor is self._executor:
+            self._executor = None
+
+    def _submit(self, run_id: int, user_id: int) -> None:
+        """Start a claimed run in the pool."""
+        try:
+            self._inflight[run_id] = self._pool().submit(_execute_run, run_id, user_id)
+        except BrokenProcessPool:
+            self._drop_pool(self._executor)
+            self._inflight[run_id] = self._pool().submit(_execute_run, run_id, user_id)
+        self._run_pools[run_id] = self._executor
+        self.logger.info(f"Started bot run {run_id} for user {user_id}")
+
+    def _reap(self) -> None:
+        """Record the outcome of every finished run."""
+        for run_id, future in list(self._inflight.items()):
+            if not future.done():
+                continue
+            del self._inflight[run_id]
+            pool = self._run_pools.pop(run_id, None)
+            try:
+                self._finish(run_id, 'succeeded', jobs_found=future.result())
+            except BrokenProcessPool as e:
+                # A child died hard (e.g. segfault, OOM kill); every run it shared the pool with is lost
+                self._drop_pool(pool)
+                self._finish(run_id, 'failed', error=f"worker process crashed: {str(e)}", retry=True)
+            except CancelledError:
+                # Still queued in a pool that was dropped after a crash
+                self._finish(run_id, 'failed', error="cancelled with a crashed worker pool", retry=True)
+            except Exception as e:
+                self._finish(run_id, 'failed', error=str(e))
+
+    def _finish(self, run_id: int, status: str, jobs_found: Optional[int] = None,
+                error: Optional[str] = None, retry: bool = False) -> None:
+        """Store a run's outcome, requeueing crashed runs that have attempts left."""
+        db = SessionLocal()
+        try:
+            run = db.query(BotRun).get(run_id)
+            if run is None:
+                return
+            if retry and (run.attempts or 0) < self.max_attempts:
+                run.status = 'queued'
+                run.error = error
+                self.logger.warning(f"Requeued bot run {run_id}: {error}")
+            else:
+                run.status = status
+                run.jobs_found = jobs_found
+                run.error = error
+                run.finished_at = datetime.utcnow()
+                log = self.logger.info if status == 'succeeded' else self.logger.error
+                log(f"Bot run {run_id} {status}" + (f": {error}" if error else f", {jobs_found} new jobs"))
+            db.commit()
+        finally:
+            db.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Run queued job bot sessions")
+    parser.add_argument('--concurrency', type=int, default=Config.WORKER_CONCURRENCY,
+                        help="bot runs to execute in parallel (default: WORKER_CONCURRENCY)")
+    parser.add_argument('--poll-interval', type=float, default=Config.WORKER_POLL_INTERVAL,
+                        help="seconds between queue polls")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    fleet = WorkerFleet(concurrency=args.concurrency, poll_interval=args.poll_interval)
+    signal.signal(signal.SIGTERM, fleet.stop)
+    signal.signal(signal.SIGINT, fleet.stop)
+    fleet.run_forever()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+os.environ.setdefault('MEMORY_WATCHDOG_ENABLED', 'False')
+os.environ.setdefault('RECORD_FIXTURES_DIR', '')
+
+
+def pytest_sessionstart(session):
+    # Importing src creates logs/ and database/ under the working directory;
+    # keep them out of the checkout. Test modules are only imported after this.
+    os.chdir(tempfile.mkdtemp(prefix='jobbot-tests-'))
+
+
+@pytest.fixture
+def cache_db(tmp_path):
+    """Path of a throwaway CacheStore database."""
+    return tmp_path / 'cache.db'
+
+
+@pytest.fixture
+def db():
+    """Session on an empty in-memory jobs database."""
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import sessionmaker
+
+    from src.models import Base
+
+    engine = create_engine('sqlite://')
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+    engine.dispose()
+
+
+@pytest.fixture
+def seen(tmp_path):
+    """Small, empty seen-jobs filter."""
+    from src.seen_jobs import SeenJobs
+
+    filter_ = SeenJobs(tmp_path / 'seen.bloom', capacity=1000, error_rate=0.01)
+    yield filter_
+    filter_.close()
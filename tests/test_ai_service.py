@@ -0,0 +1,101 @@
+import asyncio
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from src import ai_service
+from src.ai_service import AIRuntime, AIService, resume_cache_key
+from src.cache_store import CacheStore
+
+
+class Completions:
+    """Stands in for client.chat.completions and tracks requests in flight."""
+
+    def __init__(self, fail=False, delays=None):
+        self.fail = fail
+        self.delays = delays or {}
+        self.in_flight = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    async def create(self, model, messages):
+        with self._lock:
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+        try:
+            reply = messages[-1]['content'].splitlines()[0]
+            await asyncio.sleep(self.delays.get(reply, 0.01))
+            if self.fail:
+                raise RuntimeError("API unavailable")
+            return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=f"re: {reply}"))])
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+
+@pytest.fixture(scope='module')
+def runtime():
+    with pytest.MonkeyPatch.context() as patch:
+        patch.setattr(ai_service.Config, 'OPENAI_API_KEY', 'test-key')
+        patch.setattr(ai_service.Config, 'AI_MAX_CONCURRENCY', 3)
+        return AIRuntime()
+
+
+def service_with(runtime, completions):
+    service = AIService(runtime)
+    service.client = SimpleNamespace(chat=SimpleNamespace(completions=completions))
+    return service
+
+
+def test_concurrent_answers_keep_their_order_and_the_limit(runtime):
+    completions = Completions()
+    service = service_with(runtime, completions)
+    questions = [f"Question {i}" for i in range(10)]
+    answers = service.run(service.answer_questions_many(questions))
+    assert answers == [f"re: Question: {question}" for question in questions]
+    assert completions.peak == 3
+
+
+def test_timed_answers_report_their_own_duration(runtime):
+    service = service_with(runtime, Completions(delays={'Question: slow': 0.2}))
+    timed = service.run(service.answer_questions_timed(['fast', 'slow']))
+    assert [answer for answer, _ in timed] == ['re: Question: fast', 're: Question: slow']
+    assert timed[0][1] < 0.1 <= timed[1][1]
+
+
+def test_coroutines_can_be_awaited_from_another_loop(runtime):
+    service = service_with(runtime, Completions())
+    assert asyncio.run(service.answer_question("Why us?")) == "re: Question: Why us?"
+
+
+def test_failed_requests_fall_back(runtime):
+    service = service_with(runtime, Completions(fail=True))
+    assert service.run(service.answer_question("Why us?")) == ""
+    assert service.run(service.customize_resume("my resume", "the job")) == "my resume"
+
+
+def test_repeated_resume_requests_are_served_from_the_cache(runtime, cache_db):
+    completions = Completions()
+    service = service_with(runtime, completions)
+    service.resume_cache = CacheStore('customized_resumes', path=cache_db)
+    first = service.run(service.customize_resume("my resume", "Backend Engineer at Acme"))
+    assert service.run(service.customize_resume("my resume", "Backend Engineer at Acme")) == first
+    assert service.resume_cache.stats()['hits'] == 1
+    service.resume_cache.close()
+
+
+def test_resume_cache_key_is_content_addressed():
+    key = resume_cache_key("resume", "job description")
+    assert key == resume_cache_key("resume", "job description")
+    assert len(key) == 64
+    assert key != resume_cache_key("resume", "other job")
+    assert key != resume_cache_key("other resume", "job description")
+    # Parts are delimited, so moving text between them changes the key
+    assert resume_cache_key("ab", "c") != resume_cache_key("a", "bc")
+
+
+def test_resume_cache_key_changes_with_the_prompt_version(monkeypatch):
+    key = resume_cache_key("resume", "job description")
+    monkeypatch.setattr(ai_service, 'PROMPT_VERSION', ai_service.PROMPT_VERSION + 1)
+    assert resume_cache_key("resume", "job description") != key
@@ -0,0 +1,80 @@
+import asyncio
+
+import pytest
+
+from src.answer_cache import AnswerCache, ScreeningAnswerer, salient_terms, screening_prompt
+from src.cache_store import CacheStore
+
+
+@pytest.fixture
+def cache(cache_db):
+    store = CacheStore('screening_answers', path=cache_db)
+    yield AnswerCache(store, threshold=0.75)
+    store.close()
+
+
+SCOPE = AnswerCache.scope('applicant@example.com', 'Backend engineer')
+
+
+@pytest.mark.parametrize('stored, asked', [
+    ("What is your minimum expected salary?", "What is your maximum expected salary?"),
+    ("how many years of experience do you have with python?",
+     "how many years of experience do you have with java?"),
+    ("Are you willing to relocate?", "Are you not willing to relocate?"),
+    ("What is your current salary?", "What is your expected salary?"),
+])
+def test_near_duplicates_that_need_different_answers_do_not_match(cache, stored, asked):
+    cache.store_answer(SCOPE, stored, "first answer")
+    assert cache.lookup(SCOPE, asked) is None
+
+
+@pytest.mark.parametrize('stored, asked', [
+    ("How many years of experience do you have with Python?",
+     "How many years of experience with Python do you have?"),
+    ("Are you willing to relocate?", "Are you willing to relocate ?"),
+    ("Do you have experience with Python?", "Do you have any experience with Python?"),
+])
+def test_reworded_questions_reuse_the_answer(cache, stored, asked):
+    cache.store_answer(SCOPE, stored, "5")
+    assert cache.lookup(SCOPE, asked) == "5"
+    assert cache.summary()['near_hits'] + cache.summary()['exact_hits'] == 1
+
+
+def test_answers_are_scoped_per_applicant(cache):
+    cache.store_answer(SCOPE, "Are you willing to relocate?", "Yes")
+    other = AnswerCache.scope('someone@example.com', 'Backend engineer')
+    assert cache.lookup(other, "Are you willing to relocate?") is None
+
+
+def test_salient_terms_include_qualifiers_and_subjects():
+    assert salient_terms("minimum expected salary") == ['expected', 'minimum']
+    assert salient_terms("experience with python") == ['python']
+    assert salient_terms("Are you not willing to relocate?") == ['not']
+
+
+class FakeAIService:
+    def __init__(self):
+        self.asked = []
+
+    def run(self, coro):
+        return asyncio.run(coro)
+
+    async def answer_questions_timed(self, questions, context=None):
+        self.asked.append((questions, context))
+        return [(f"answer {len(self.asked)}", 0.5) for _ in questions]
+
+
+def test_screening_answerer_asks_only_uncached_prompts_and_stores_them(cache):
+    ai = FakeAIService()
+    prompts = [screening_prompt("Are you willing to relocate?", ['Yes', 'No']), "Expected salary?"]
+    cache.store_answer(AnswerCache.scope('me@example.com', 'Backend engineer'), prompts[0], "Yes")
+
+    first = ScreeningAnswerer(ai, 'me@example.com', 'Backend engineer', 'Tailored resume', cache=cache)
+    assert first.answer(prompts) == ["Yes", "answer 1"]
+    assert ai.asked == [(["Expected salary?"], 'Tailored resume')]
+
+    # A different job-specific AI context still shares the cache scope
+    second = ScreeningAnswerer(ai, 'me@example.com', 'Backend engineer', 'Another resume', cache=cache)
+    assert second.answer(prompts) == ["Yes", "answer 1"]
+    assert len(ai.asked) == 1
+    assert cache.summary()['ai_calls'] == 1
@@ -0,0 +1,79 @@
+import time
+
+import pytest
+
+from src.cache_store import CacheStore
+
+
+@pytest.fixture
+def open_store(cache_db):
+    stores = []
+
+    def open_(namespace='test', **limits):
+        stores.append(CacheStore(namespace, path=cache_db, **limits))
+        return stores[-1]
+
+    yield open_
+    for store in stores:
+        store.close()
+
+
+def test_round_trip_and_stats(open_store):
+    store = open_store()
+    store.put('a', {'answer': 'yes'})
+    assert store.get('a') == {'answer': 'yes'}
+    assert store.get('missing') is None
+    stats = store.stats()
+    assert (stats['hits'], stats['misses'], stats['entries']) == (1, 1, 1)
+    assert stats['bytes_served'] == len('{"answer": "yes"}')
+
+
+def test_evicts_least_recently_used_past_max_entries(open_store):
+    store = open_store(max_entries=2)
+    store.put('a', 1)
+    time.sleep(0.01)
+    store.put('b', 2)
+    time.sleep(0.01)
+    store.get('a')  # 'b' is now the least recently used
+    time.sleep(0.01)
+    store.put('c', 3)
+    assert store.peek('b') is None
+    assert store.peek('a') == 1 and store.peek('c') == 3
+    assert store.evictions == 1
+
+
+def test_evicts_past_max_bytes(open_store):
+    store = open_store(max_bytes=20)  # each value is 12 bytes of JSON
+    store.put('a', 'x' * 10)
+    time.sleep(0.01)
+    store.put('b', 'y' * 10)
+    assert store.peek('a') is None
+    assert store.peek('b') == 'y' * 10
+
+
+def test_expired_entries_are_misses(open_store):
+    store = open_store(ttl=0.05)
+    store.put('a', 1)
+    time.sleep(0.1)
+    assert store.peek('a') is None
+    assert store.get('a') is None
+    assert store.stats()['entries'] == 0
+
+
+def test_peek_does_not_count_or_refresh(open_store):
+    store = open_store()
+    store.put('a', 1)
+    assert store.peek('a') == 1
+    assert store.stats()['hits'] == 0
+
+
+def test_namespaces_are_separate_and_persist(open_store):
+    open_store('first').put('a', 1)
+    assert open_store('second').get('a') is None
+    assert open_store('first').get('a') == 1
+    assert [key for key, _ in open_store('first').items()] == ['a']
+
+
+def test_rejects_unsafe_namespace(cache_db):
+    with pytest.raises(ValueError):
+        CacheStore('bad; DROP TABLE x', path=cache_db)
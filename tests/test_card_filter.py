@@ -0,0 +1,57 @@
+from datetime import timedelta
+
+import pytest
+
+from src.card_filter import CardFilter, parse_posted_age
+
+
+@pytest.mark.parametrize('text, age', [
+    ("3 days ago", timedelta(days=3)),
+    ("Reposted 1 week ago", timedelta(weeks=1)),
+    ("30+ days ago", timedelta(days=30)),
+    ("an hour ago", timedelta(hours=1)),
+    ("2 months ago", timedelta(days=60)),
+    ("Just now", timedelta(0)),
+    ("Promoted", None),
+    ("", None),
+    (None, None),
+])
+def test_parse_posted_age(text, age):
+    assert parse_posted_age(text) == age
+
+
+def card(job_id, **fields):
+    return {'url': f"https://www.linkedin.com/jobs/view/{job_id}/", **fields}
+
+
+def test_filter_skips_known_stale_and_non_easy_apply_cards():
+    cards = [
+        card(1, posted="1 day ago", easy_apply_badge="Easy Apply"),
+        card(2, posted="1 day ago"),
+        card(3, posted="3 weeks ago", easy_apply_badge="Easy Apply"),
+        card(4, posted="1 day ago", easy_apply_badge="Apply on company website"),
+        {'title': 'no url'},
+    ]
+    card_filter = CardFilter(max_age_days=14, known_ids={'2'}, require_easy_apply=True)
+    assert card_filter.filter(cards) == cards[:1]
+    summary = card_filter.summary()
+    assert summary['known'] == 1
+    assert summary['stale'] == 1
+    assert summary['no_easy_apply'] == 1
+    assert summary['no_id'] == 1
+    assert summary['avoided_loads'] == 4
+
+
+def test_no_age_limit_by_default_and_missing_badge_is_kept():
+    cards = [card(1, posted="6 months ago"), card(2, posted_at="2001-01-01")]
+    assert CardFilter(require_easy_apply=True).filter(cards) == cards
+
+
+def test_posted_at_wins_over_relative_text():
+    assert CardFilter(max_age_days=7).reason_to_skip(card(1, posted="1 day ago", posted_at="2001-01-01")) == 'stale'
+
+
+def test_remember_marks_ids_known():
+    card_filter = CardFilter(known_ids=set())
+    card_filter.remember('5')
+    assert card_filter.reason_to_skip(card(5)) == 'known'
@@ -0,0 +1,123 @@
+import pytest
+
+from src.cache_store import CacheStore
+from src.easy_apply import (
+    FILL_FORM_SCRIPT, FORM_FIELDS_SCRIPT, FormField, FormFiller, field_signatures, form_fingerprint, match_option
+)
+
+PROFILE = {'name': 'Ada Lovelace', 'email': 'ada@example.com', 'phone': '555-0100', 'experience_years': 7}
+
+
+def form_field(key, label, type='text', **extra):
+    return {'key': key, 'tag': 'input', 'type': type, 'name': key, 'label': label, **extra}
+
+
+class FormDriver:
+    """Serves a fixed form to FormFiller and records what it fills."""
+
+    def __init__(self, fields):
+        self.fields = fields
+        self.fills = []
+
+    def execute_script(self, script, *args):
+        if script == FORM_FIELDS_SCRIPT:
+            return self.fields
+        if script == FILL_FORM_SCRIPT:
+            self.fills.append(args[2])
+            return []
+        raise AssertionError("unexpected script")
+
+
+def test_plan_splits_script_fills_and_typed_fields():
+    fields = {
+        'size': FormField('size', 'select', 'select', 'size', 'Team size', options=['1-10', '11-50']),
+        'remote': FormField('remote', 'input', 'radio', 'remote', 'Remote?', options=['Yes', 'No']),
+        'terms': FormField('terms', 'input', 'checkbox', 'terms', 'I agree'),
+        'city': FormField('city', 'input', 'text', 'city', 'City', typeahead=True),
+        'years': FormField('years', 'input', 'text', 'years', 'Years of experience'),
+        'color': FormField('color', 'input', 'radio', 'color', 'Favourite colour', options=['Red']),
+    }
+    answers = {'size': '11-50', 'remote': 'no', 'terms': 'Yes', 'city': 'London', 'years': '7', 'color': 'Blue'}
+    fills, typed = FormFiller(driver=None).plan(fields, answers)
+    assert fills == {
+        'size': {'type': 'select', 'value': '11-50'},
+        'remote': {'type': 'radio', 'option': 1},
+        'terms': {'type': 'checkbox', 'value': True},
+        'years': {'type': 'text', 'value': '7'},
+    }
+    assert typed == [fields['city']]
+
+
+@pytest.mark.parametrize('answer, index', [("Yes", 0), ("no", 1), ("Yes, I am", 0), ("Maybe", None)])
+def test_match_option(answer, index):
+    assert match_option(answer, ["Yes", "No"]) == index
+
+
+def test_fill_answers_the_profile_first_and_asks_only_required_questions():
+    driver = FormDriver([
+        form_field('a', 'Mobile phone number', required=True),
+        form_field('b', 'Why do you want to work here?', required=True),
+        form_field('c', 'Anything else?'),
+        form_field('d', 'Email address', value='ada@example.com'),
+    ])
+    asked = []
+
+    def answer(questions):
+        asked.extend(q.label for q in questions)
+        return ['I like it'] * len(questions)
+
+    result = FormFiller(driver, answer).fill(PROFILE)
+    assert asked == ['Why do you want to work here?']
+    assert (result['fields'], result['answered'], result['unanswered']) == (3, 2, 1)
+    assert driver.fills == [{
+        'a': {'type': 'text', 'value': '555-0100'},
+        'b': {'type': 'text', 'value': 'I like it'},
+    }]
+
+
+def test_signatures_ignore_element_names_and_number_duplicates():
+    first = [FormField(f'k{i}', 'input', 'text', f'urn:job:123:{i}', label) for i, label in
+             enumerate(['Phone', 'Reference', 'Reference'])]
+    second = [FormField(f'k{i}', 'input', 'text', f'urn:job:456:{i}', label) for i, label in
+              enumerate(['Phone', 'Reference', 'Reference'])]
+    assert list(field_signatures(first).values()) == ['text|phone|', 'text|reference|', 'text|reference|#2']
+    assert form_fingerprint(field_signatures(first), PROFILE) == form_fingerprint(field_signatures(second), PROFILE)
+    assert form_fingerprint(field_signatures(first), PROFILE) != form_fingerprint(
+        field_signatures(first), {**PROFILE, 'email': 'someone@example.com'})
+
+
+def test_second_fill_of_a_step_replays_the_plan(cache_db):
+    plans = CacheStore('fill_plans', path=cache_db)
+    fields = [
+        form_field('a', 'Mobile phone number', required=True),
+        form_field('b', 'Why do you want to work here?', required=True),
+        form_field('c', 'Anything else?'),
+    ]
+    asked = []
+
+    def answer(questions):
+        asked.extend(q.label for q in questions)
+        return ['I like it'] * len(questions)
+
+    first = FormFiller(FormDriver(fields), answer, plans)
+    result = first.fill(PROFILE)
+    assert result['answered'] == 2 and result['unanswered'] == 1
+    assert asked == ['Why do you want to work here?']
+    first.remember_button('next')
+
+    # Same step on another job: element keys differ, nothing is asked again
+    replay_driver = FormDriver([{**f, 'key': f['key'] + '2'} for f in fields])
+    second = FormFiller(replay_driver, answer, plans)
+    result = second.fill(PROFILE)
+    assert asked == ['Why do you want to work here?']
+    assert result['replayed'] == 3
+    assert second.planned_button == 'next'
+    assert second.replayed_steps == 1
+    assert replay_driver.fills == [{
+        'a2': {'type': 'text', 'value': '555-0100'},
+        'b2': {'type': 'text', 'value': 'I like it'},
+    }]
+
+    second.forget_plan()
+    assert FormFiller(FormDriver(fields), answer, plans).fill(PROFILE)['replayed'] == 0
+    plans.close()
@@ -0,0 +1,97 @@
+import pytest
+
+from src.extraction import (
+    JOB_CARD_FIELDS, JOB_CARD_REQUIRED_FIELDS, SEARCH_RESULT_CARD_FIELDS, SEARCH_RESULT_CARD_SELECTOR,
+    compile_fields, complete_records, parse_field_spec, parse_records
+)
+
+CARDS_HTML = """
+<ul class="results">
+  <li class="card" data-job-id="101">
+    <a class="title" href="/jobs/view/101/?trackingId=a">Python   Developer</a>
+    <span class="company">Acme</span>
+  </li>
+  <li class="card" data-job-id="102">
+    <a class="title" href="/jobs/view/102/">Data Engineer</a>
+  </li>
+</ul>
+"""
+
+SEARCH_HTML = """
+<ul class="results">
+  <li class="jobs-search-results__list-item" data-occludable-job-id="101">
+    <a href="/jobs/view/101/?trackingId=a"><span class="job-card-list__title">Python Developer</span></a>
+    <time datetime="2024-05-01">2 days ago</time>
+    <div class="job-card-container__apply-method">Easy Apply</div>
+  </li>
+  <li class="jobs-search-results__list-item" data-occludable-job-id="102">
+    <a href="/jobs/view/102/"><span class="job-card-list__title">Data Engineer</span></a>
+  </li>
+</ul>
+"""
+
+CARD_FIELDS = {'job_id': '@data-job-id', 'title': 'a.title', 'url': 'a.title@href', 'company': '.company'}
+
+
+@pytest.mark.parametrize('spec, parsed', [
+    ('h3.job-card-list__title', {'selector': 'h3.job-card-list__title', 'attr': None}),
+    ('a.job-card-list__title@href', {'selector': 'a.job-card-list__title', 'attr': 'href'}),
+    ('@data-occludable-job-id', {'selector': None, 'attr': 'data-occludable-job-id'}),
+])
+def test_parse_field_spec(spec, parsed):
+    assert parse_field_spec(spec) == parsed
+
+
+def test_compile_fields_keeps_every_field():
+    compiled = compile_fields(JOB_CARD_FIELDS)
+    assert compiled.keys() == JOB_CARD_FIELDS.keys()
+    assert compiled['url'] == {'selector': 'a.job-card-list__title', 'attr': 'href'}
+
+
+def test_complete_records_drops_records_missing_required_fields():
+    records = [
+        {'title': 'Python Developer', 'url': '/jobs/view/1/'},
+        {'title': '', 'url': '/jobs/view/2/'},
+        {'title': 'Data Engineer', 'url': None},
+    ]
+    assert complete_records(records, ['title', 'url']) == records[:1]
+
+
+def test_complete_records_keeps_cards_without_location():
+    cards = [
+        {'title': 'Python Developer', 'company': 'Acme', 'location': None, 'url': '/jobs/view/1/'},
+        {'title': 'Data Engineer', 'company': None, 'location': 'Remote', 'url': '/jobs/view/2/'},
+    ]
+    assert set(JOB_CARD_REQUIRED_FIELDS) <= set(JOB_CARD_FIELDS)
+    assert complete_records(cards, JOB_CARD_REQUIRED_FIELDS) == cards[:1]
+
+
+def test_parse_records_reads_text_and_attributes():
+    records = parse_records(CARDS_HTML, '.card', CARD_FIELDS, base_url="https://www.linkedin.com/jobs/search/")
+    assert records == [
+        {'job_id': '101', 'title': 'Python Developer', 'company': 'Acme',
+         'url': "https://www.linkedin.com/jobs/view/101/?trackingId=a"},
+        # Missing elements come back as None rather than being dropped
+        {'job_id': '102', 'title': 'Data Engineer', 'company': None,
+         'url': "https://www.linkedin.com/jobs/view/102/"},
+    ]
+
+
+def test_parse_records_root_and_limit():
+    assert len(parse_records(CARDS_HTML, '.card', CARD_FIELDS, limit=1)) == 1
+    assert parse_records(CARDS_HTML, '.card', CARD_FIELDS, root_selector='.missing') == []
+
+
+def test_parse_records_without_item_selector_reads_the_root():
+    records = parse_records(CARDS_HTML, None, {'title': 'a.title'}, root_selector='.results')
+    assert records == [{'title': 'Python Developer'}]
+
+
+def test_search_cards_carry_the_pre_filter_fields():
+    first, second = parse_records(SEARCH_HTML, SEARCH_RESULT_CARD_SELECTOR, SEARCH_RESULT_CARD_FIELDS)
+    assert first['job_id'] == '101'
+    assert first['posted'] == '2 days ago'
+    assert first['posted_at'] == '2024-05-01'
+    assert first['easy_apply_badge'] == 'Easy Apply'
+    assert second['posted'] is None
+    assert second['easy_apply_badge'] is None
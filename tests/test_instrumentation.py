@@ -0,0 +1,69 @@
+from src.instrumentation import UNATTRIBUTED, DriverStats, instrumented, percentile
+
+
+class CommandDriver:
+    """Answers every WebDriver command with an empty value."""
+
+    def execute(self, driver_command, params=None):
+        return {'value': None}
+
+
+class Page:
+    def __init__(self, stats, driver):
+        self.stats = stats
+        self.driver = driver
+
+    @instrumented()
+    def load(self):
+        self.driver.execute('get', {'url': 'about:blank'})
+        self.read()
+
+    @instrumented('read_cards')
+    def read(self):
+        self.driver.execute('executeScript')
+        self.driver.execute('executeScript')
+
+
+def test_commands_are_attributed_to_the_innermost_operation():
+    stats = DriverStats()
+    driver = CommandDriver()
+    stats.instrument(driver)
+    stats.instrument(driver)  # instrumenting twice must not double count
+    Page(stats, driver).load()
+    driver.execute('getTitle')
+
+    assert {key: len(samples) for key, samples in stats.commands.items()} == {
+        ('load', 'get'): 1,
+        ('read_cards', 'executeScript'): 2,
+        (UNATTRIBUTED, 'getTitle'): 1,
+    }
+    calls = {row['operation']: row['calls'] for row in stats.summary()}
+    assert calls == {'load': 1, 'read_cards': 2, UNATTRIBUTED: 1}
+    assert len(stats.command_breakdown(top=2)) == 2
+
+
+def test_sleeps_and_waits_are_reported_separately(tmp_path):
+    stats = DriverStats()
+    with stats.operation('scroll'):
+        stats.sleep(0.01)
+        stats.record_wait(0.5)
+    row, = stats.summary()
+    assert row['operation'] == 'scroll'
+    assert row['calls'] == 0
+    assert row['sleeping'] >= 0.01 and row['waiting'] == 0.5
+
+    path = stats.write_summary(tmp_path)
+    assert 'scroll' in path.read_text()
+    stats.reset()
+    assert stats.summary() == [] and stats.write_summary(tmp_path) is None
+
+
+def test_methods_run_untimed_without_stats():
+    page = Page(stats=None, driver=CommandDriver())
+    page.load()
+
+
+def test_percentile_is_nearest_rank():
+    assert percentile([], 0.95) == 0.0
+    assert percentile([3, 1, 2], 0.5) == 2
+    assert percentile(list(range(1, 101)), 0.95) == 95
@@ -0,0 +1,38 @@
+import pytest
+
+from src.job_record import JobRecord, canonical_job_url, job_id_from_url
+
+
+@pytest.mark.parametrize('url, job_id', [
+    ("https://www.linkedin.com/jobs/view/3812345678/", '3812345678'),
+    ("https://www.linkedin.com/jobs/view/3812345678/?refId=abc&trackingId=xyz", '3812345678'),
+    ("https://www.linkedin.com/jobs/view/senior-python-developer-at-acme-3812345678", '3812345678'),
+    ("https://www.linkedin.com/jobs/search/?currentJobId=3812345678&keywords=python", '3812345678'),
+    ("https://www.linkedin.com/jobs/search/?keywords=python&currentJobId=42", '42'),
+    ("https://www.linkedin.com/company/acme/", None),
+    ("", None),
+    (None, None),
+])
+def test_job_id_from_url(url, job_id):
+    assert job_id_from_url(url) == job_id
+
+
+def test_canonical_url_round_trips():
+    url = canonical_job_url('3812345678')
+    assert url == "https://www.linkedin.com/jobs/view/3812345678/"
+    assert job_id_from_url(url) == '3812345678'
+
+
+def test_from_record_canonicalizes_the_url():
+    job = JobRecord.from_record({
+        'title': 'Python Developer',
+        'company': 'Acme',
+        'url': "https://www.linkedin.com/jobs/view/python-developer-at-acme-77/?trackingId=1",
+    })
+    assert job.job_id == '77'
+    assert job.url == canonical_job_url('77')
+    assert job.location == ''
+
+
+def test_from_record_without_id():
+    assert JobRecord.from_record({'title': 'Python Developer', 'url': "https://example.com/"}) is None
@@ -0,0 +1,49 @@
+from src.job_record import JobRecord, canonical_job_url
+from src.job_sink import JobSink
+from src.models import Job
+from src.seen_jobs import canonicalize_job_urls
+
+
+def record(job_id):
+    return JobRecord(job_id=str(job_id), title=f"Job {job_id}", company='Acme', location='Remote',
+                     url=canonical_job_url(job_id))
+
+
+def test_batches_and_skips_duplicates(db, seen):
+    flushed = []
+    sink = JobSink(user_id=1, db=db, batch_size=2, flush_interval=3600, seen=seen, on_flush=flushed.append)
+    assert sink.add(record(1))
+    assert not sink.add(record(1))  # already queued
+    assert db.query(Job).count() == 0
+    assert sink.add(record(2))  # fills the batch
+    assert db.query(Job).count() == 2
+    assert '1' in seen and '2' in seen
+
+    assert not sink.add(record(2))  # already stored
+    assert sink.consume([record(3), record(1)]) == 1
+    assert sink.inserted == 3
+    assert sink.duplicates == 3
+    assert [len(rows) for rows in flushed] == [2, 1]
+    sink.close()
+
+
+def test_skips_jobs_stored_under_a_legacy_url(db, seen):
+    db.add(Job(title='Old', company='Acme', url="https://www.linkedin.com/jobs/view/5/?trackingId=x"))
+    db.commit()
+    # What building the filter does to the jobs table
+    canonicalize_job_urls(db)
+    seen.add('5')
+    with JobSink(user_id=1, db=db, seen=seen) as sink:
+        assert not sink.add(record(5))
+    assert db.query(Job).count() == 1
+
+
+def test_concurrent_insert_falls_back_to_row_by_row(db, seen):
+    sink = JobSink(user_id=1, db=db, batch_size=10, flush_interval=3600, seen=seen)
+    sink.add(record(1))
+    sink.add(record(2))
+    # Another run stores job 2 before this batch is flushed
+    db.add(Job(title='Other run', company='Acme', url=canonical_job_url(2)))
+    db.commit()
+    assert sink.flush() == 1
+    assert db.query(Job).count() == 2
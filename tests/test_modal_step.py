@@ -0,0 +1,56 @@
+import json
+
+import pytest
+
+from src.easy_apply import ModalStep, inspect_modal_step
+from src.replay import ReplayDriver
+
+STEP_URL = "https://www.linkedin.com/jobs/view/301/apply/"
+
+MODAL_HTML = """
+<div class="jobs-easy-apply-modal">
+  <footer>
+    <button aria-label="Dismiss">Dismiss</button>
+    <button aria-label="Continue to next step">Next</button>
+  </footer>
+</div>
+"""
+
+SUBMITTED_HTML = """
+<div class="artdeco-toast-item--success">Your application was sent to Acme</div>
+"""
+
+
+@pytest.fixture
+def replay_page(tmp_path):
+    """ReplayDriver showing a single recorded page with the given HTML."""
+    def open_(html):
+        (tmp_path / 'pages').mkdir(exist_ok=True)
+        (tmp_path / 'pages' / '0001.html').write_text(html)
+        page = {'index': 1, 'label': 'modal_step', 'requested_url': STEP_URL, 'final_url': STEP_URL,
+                'html': 'pages/0001.html', 'extractions': []}
+        (tmp_path / 'manifest.json').write_text(json.dumps({'pages': [page]}))
+        driver = ReplayDriver(tmp_path)
+        driver.get(STEP_URL)
+        return driver
+    return open_
+
+
+def test_step_button_and_role_come_from_one_call(replay_page):
+    step = inspect_modal_step(replay_page(MODAL_HTML))
+    assert step.present and not step.success
+    assert step.role == 'next'
+    assert step.button.text == 'Next'
+    assert not step.blocked
+
+
+def test_success_banner_is_reported(replay_page):
+    step = inspect_modal_step(replay_page(SUBMITTED_HTML))
+    assert step.success
+    assert not step.present and step.button is None
+
+
+def test_required_fields_or_errors_block_the_step():
+    assert ModalStep(present=True, required_empty=['Phone']).blocked
+    assert ModalStep(present=True, errors=['Enter a valid phone number']).blocked
+    assert not ModalStep(present=True).blocked
@@ -0,0 +1,74 @@
+import threading
+
+from src.job_record import JobRecord
+from src.pipeline import Pipeline, Stage, job_posting_text
+
+
+def test_items_flow_through_every_stage_in_bounded_queues():
+    results = []
+    lock = threading.Lock()
+
+    def collect(_, item):
+        with lock:
+            results.append(item)
+
+    stages = [
+        Stage('double', lambda _, n: n * 2, workers=2, maxsize=1),
+        Stage('multiples_of_4', lambda _, n: None if n % 4 else n, maxsize=1),
+        Stage('collect', collect, maxsize=1),
+    ]
+    metrics = Pipeline(range(10), stages, report_interval=60).run()
+    assert sorted(results) == [0, 4, 8, 12, 16]
+    by_stage = {m['stage']: m for m in metrics}
+    assert by_stage['source']['processed'] == 10
+    assert by_stage['double']['passed'] == 10
+    assert by_stage['multiples_of_4']['passed'] == 5
+
+
+def test_failures_are_counted_and_do_not_stop_the_stage():
+    def handler(_, n):
+        if n == 3:
+            raise ValueError("bad item")
+        return n
+
+    stage = Stage('flaky', handler)
+    Pipeline(range(5), [stage], report_interval=60).run()
+    assert stage.processed == 5
+    assert stage.failed == 1
+    assert stage.passed == 4
+
+
+def test_each_worker_gets_its_own_context_and_teardown():
+    contexts = []
+    closed = []
+    lock = threading.Lock()
+
+    def setup():
+        with lock:
+            contexts.append(object())
+            return contexts[-1]
+
+    seen_contexts = set()
+    stage = Stage('work', lambda ctx, n: seen_contexts.add(id(ctx)), workers=3,
+                  setup=setup, teardown=closed.append)
+    Pipeline(range(20), [stage], report_interval=60).run()
+    assert len(contexts) == 3
+    assert sorted(map(id, closed)) == sorted(map(id, contexts))
+    assert seen_contexts <= set(map(id, contexts))
+
+
+def test_source_error_ends_the_run():
+    def source():
+        yield 1
+        raise RuntimeError("search failed")
+
+    stage = Stage('collect', lambda _, n: n)
+    pipeline = Pipeline(source(), [stage], report_interval=60)
+    pipeline.run()
+    assert stage.processed == 1
+    assert isinstance(pipeline.source_error, RuntimeError)
+
+
+def test_job_posting_text_skips_missing_fields():
+    job = JobRecord(job_id='1', title='Backend Engineer', company='Acme', location='', url='https://example.com/1')
+    assert job_posting_text(job) == "Backend Engineer at Acme"
@@ -0,0 +1,23 @@
+from selenium.common.exceptions import WebDriverException
+
+from src.readiness import NetworkLog, PageReadiness
+
+
+class NoLogDriver:
+    def get_log(self, name):
+        raise WebDriverException("performance log not enabled")
+
+
+def test_network_idle_falls_back_to_dom_settled_without_the_performance_log(monkeypatch):
+    readiness = PageReadiness(NoLogDriver())
+    settled = []
+    monkeypatch.setattr(readiness, 'wait_for_dom_settled', lambda operation: settled.append(operation) or True)
+    assert readiness.wait_for_network_idle('easy_apply_modal')
+    assert settled == ['easy_apply_modal']
+    assert not readiness.network_log.available
+
+
+def test_disabled_network_log_never_asks_the_driver():
+    log = NetworkLog(NoLogDriver())
+    log.available = False
+    assert log.poll() == []
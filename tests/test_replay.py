@@ -0,0 +1,50 @@
+from pathlib import Path
+
+import pytest
+
+from src.browser import Browser
+from src.card_filter import CardFilter
+from src.extraction import SEARCH_RESULT_CARD_FIELDS, SEARCH_RESULT_CARD_SELECTOR
+from src.job_record import canonical_job_url
+from src.replay import FixtureRun, ReplayDriver
+
+SEARCH_RUN = Path(__file__).parent / 'fixtures' / 'search_run'
+SEARCH_URL = "https://www.linkedin.com/jobs/search/?keywords=python&location=Remote"
+
+
+@pytest.fixture
+def browser():
+    browser = Browser(driver=ReplayDriver(SEARCH_RUN))
+    yield browser
+    browser.close()
+
+
+def test_fixture_pages_are_found_by_path_and_query():
+    fixtures = FixtureRun(SEARCH_RUN)
+    assert fixtures.find(SEARCH_URL)['index'] == 1
+    # Tracking parameters differ between runs; the path alone still matches
+    assert fixtures.find("https://www.linkedin.com/jobs/view/301/?trackingId=other")['index'] == 2
+    assert fixtures.find("https://www.linkedin.com/jobs/view/999/") is None
+
+
+def test_search_extraction_replays_recorded_records(browser):
+    assert browser.navigate(SEARCH_URL, ready_selector=SEARCH_RESULT_CARD_SELECTOR, operation='search_results')
+    cards = browser.extract_records(SEARCH_RESULT_CARD_SELECTOR, SEARCH_RESULT_CARD_FIELDS)
+    assert [card['job_id'] for card in cards] == ['301', '302', '303']
+    assert cards[0]['easy_apply_badge'] == 'Easy Apply'
+
+
+def test_job_listings_from_a_recorded_search(browser):
+    browser.card_filter = CardFilter(max_age_days=0, known_ids={'303'})
+    browser.navigate(SEARCH_URL, ready_selector=SEARCH_RESULT_CARD_SELECTOR, operation='search_results')
+
+    jobs = browser.get_job_listings(limit=5)
+
+    assert [(job.job_id, job.title, job.company, job.location) for job in jobs] == [
+        ('301', 'Python Developer', 'Acme', 'Remote'),
+        ('302', 'Backend Engineer', 'Globex', 'Hybrid'),
+    ]
+    assert jobs[0].url == canonical_job_url('301')
+    assert browser.card_filter.summary()['known'] == 1
+    # Detail tabs are closed again once extracted
+    assert browser.driver.window_handles == ['replay-1']
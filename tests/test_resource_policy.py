@@ -0,0 +1,73 @@
+from fnmatch import fnmatchcase
+
+import pytest
+
+from src.resource_policy import RESOURCE_PATTERNS, PageWeightMeter, ResourcePolicy
+
+
+class CdpDriver:
+    """Records the CDP commands sent to it."""
+
+    def __init__(self):
+        self.commands = []
+
+    def execute_cdp_cmd(self, cmd, params):
+        self.commands.append((cmd, params))
+        return {}
+
+
+def test_policy_blocks_the_patterns_of_its_categories():
+    policy = ResourcePolicy(['images', ' fonts', ''])
+    assert policy.categories == ['images', 'fonts']
+    assert policy.patterns == RESOURCE_PATTERNS['images'] + RESOURCE_PATTERNS['fonts']
+
+    driver = CdpDriver()
+    policy.apply(driver)
+    ResourcePolicy.clear(driver)
+    assert driver.commands == [
+        ('Network.enable', {}),
+        ('Network.setBlockedURLs', {'urls': policy.patterns}),
+        ('Network.setBlockedURLs', {'urls': []}),
+    ]
+
+
+def test_unknown_category_is_rejected():
+    with pytest.raises(ValueError, match='videos'):
+        ResourcePolicy(['images', 'videos'])
+
+
+@pytest.mark.parametrize('url', [
+    "https://static.licdn.com/aero-v1/sc/h/logo.png?v=3",
+    "https://static.licdn.com/fonts/source-sans.woff2",
+    "https://static.licdn.com/fonts/source-sans.woff#iefix",
+    "https://dms.licdn.com/playlist/vid/clip.mp4?e=1",
+])
+def test_patterns_match_urls_with_query_strings(url):
+    # setBlockedURLs patterns use '*' as the only wildcard, like fnmatch without character classes
+    patterns = ResourcePolicy(['images', 'media', 'fonts']).patterns
+    assert any(fnmatchcase(url, pattern) for pattern in patterns)
+
+
+def event(method, **params):
+    return {'method': method, 'params': params}
+
+
+def test_page_weight_estimates_savings_from_observed_sizes():
+    meter = PageWeightMeter()
+    assert meter.start_page('https://www.linkedin.com/jobs/view/1/') is None
+    meter.on_event(event('Network.requestWillBeSent', requestId='1', type='Image'))
+    meter.on_event(event('Network.loadingFinished', requestId='1', encodedDataLength=1000))
+    meter.on_event(event('Network.requestWillBeSent', requestId='2', type='Document'))
+    meter.on_event(event('Network.loadingFinished', requestId='2', encodedDataLength=500))
+    meter.on_event(event('Network.loadingFailed', requestId='3', type='Image', blockedReason='inspector'))
+    meter.on_event(event('Network.loadingFailed', requestId='4', type='Font', blockedReason='inspector'))
+    # Failures that were not blocked are not counted as savings
+    meter.on_event(event('Network.loadingFailed', requestId='5', type='Image'))
+
+    report = meter.finish_page()
+    assert report['requests'] == 2
+    assert report['bytes_transferred'] == 1500
+    assert report['blocked_requests'] == {'Image': 1, 'Font': 1}
+    # Images use the observed average, fonts the typical size
+    assert report['estimated_bytes_saved'] == 1000 + 35_000
+    assert meter.finish_page() is None
@@ -0,0 +1,69 @@
+import logging
+from collections import defaultdict
+from types import SimpleNamespace
+
+from selenium.common.exceptions import WebDriverException
+
+from src.browser import Browser
+
+
+class ScrollDriver:
+    """Reports a scripted item count after each scroll step."""
+
+    def __init__(self, counts):
+        self.counts = list(counts)
+        self.count = self.counts.pop(0)
+        self.timeouts = SimpleNamespace(script=30)
+        self.script_timeouts = []
+
+    def find_elements(self, by, value):
+        return [object()] * self.count
+
+    def set_script_timeout(self, seconds):
+        self.timeouts.script = seconds
+        self.script_timeouts.append(seconds)
+
+    def execute_async_script(self, script, *args):
+        if not self.counts:
+            raise WebDriverException("page went away")
+        before, self.count = self.count, self.counts.pop(0)
+        return [before, self.count]
+
+
+def browser_with(driver):
+    """Browser around a fake driver, without launching Chrome."""
+    browser = Browser.__new__(Browser)
+    browser.logger = logging.getLogger(__name__)
+    browser.driver = driver
+    browser.readiness = SimpleNamespace(timings=defaultdict(list))
+    return browser
+
+
+def test_stops_when_new_items_plateau():
+    browser = browser_with(ScrollDriver([10, 20, 30, 30, 30, 40]))
+    result = browser.scroll_to_load('.card', plateau_scrolls=2)
+    assert result['reason'] == 'plateau'
+    assert result['count'] == 30
+    assert result['yields'] == [10, 10, 0, 0]
+    assert browser.readiness.timings['scroll_to_load'] == [result['elapsed']]
+
+
+def test_stops_at_the_target_count():
+    result = browser_with(ScrollDriver([10, 20, 30, 40])).scroll_to_load('.card', target_count=25)
+    assert (result['reason'], result['count'], result['yields']) == ('target', 30, [10, 10])
+
+
+def test_stops_on_a_failed_scroll_step():
+    result = browser_with(ScrollDriver([10, 20])).scroll_to_load('.card', plateau_scrolls=3)
+    assert (result['reason'], result['count']) == ('error', 20)
+
+
+def test_stops_at_the_timeout():
+    result = browser_with(ScrollDriver([10, 20])).scroll_to_load('.card', timeout=0)
+    assert (result['reason'], result['yields']) == ('timeout', [])
+
+
+def test_script_timeout_is_restored_after_scrolling():
+    driver = ScrollDriver([10, 20, 20])
+    browser_with(driver).scroll_to_load('.card', plateau_scrolls=1, scroll_wait_ms=1000)
+    assert driver.script_timeouts == [6, 30]
@@ -0,0 +1,66 @@
+import time
+
+from src.browser_pool import BrowserPool
+from src.search_grid import SearchGrid
+
+
+class GridBrowser:
+    session_user = None
+    session_validated_at = 0.0
+    pages_loaded = 0
+
+    def is_healthy(self):
+        return True
+
+    def session_cookies(self):
+        return []
+
+    def clear_session(self):
+        pass
+
+    def restore_cookies(self, cookies):
+        return False
+
+    def log_memory_usage(self):
+        pass
+
+    def reset_for_reuse(self):
+        pass
+
+    def recycle_if_needed(self):
+        return False
+
+    def close(self):
+        pass
+
+
+class GridBot:
+    session_key = 'me@example.com'
+
+    def __init__(self, pool):
+        self.pool = pool
+        self.browser = pool.acquire()
+
+    def search_cell(self, browser, keyword, location):
+        return []
+
+    def _new_jobs_from_cards(self, records):
+        return []
+
+
+def test_grid_uses_only_the_pools_free_browsers():
+    pool = BrowserPool(max_size=2, browser_factory=GridBrowser)
+    bot = GridBot(pool)
+    other_stage = pool.acquire()
+
+    grid = SearchGrid(bot, concurrency=3, lease_timeout=5)
+    started = time.monotonic()
+    grid.run_sync(['python', 'java'], ['Remote', 'Berlin'])
+    assert time.monotonic() - started < 1
+    assert {result.worker for result in grid.results} == {0}
+
+    pool.release(other_stage)
+    grid.run_sync(['python', 'java'], ['Remote', 'Berlin'])
+    assert len(grid.results) == 4
+    assert pool.available == 1
+    pool.close_all()
@@ -0,0 +1,88 @@
+import multiprocessing
+
+import pytest
+
+from src.job_record import canonical_job_url
+from src.models import Job
+from src.seen_jobs import KnownJobs, SeenJobs, canonicalize_job_urls, job_stored
+
+
+def test_added_ids_are_members(seen):
+    seen.add('1')
+    seen.update(['2', '3', None])
+    assert all(job_id in seen for job_id in ('1', '2', '3'))
+    assert '4' not in seen
+    assert seen.count == 3
+
+
+def test_filter_persists_and_seed_runs_only_on_creation(tmp_path):
+    path = tmp_path / 'seen.bloom'
+    first = SeenJobs(path, capacity=1000, error_rate=0.01, seed=lambda s: s.update(['7', '8']) or 2)
+    assert first.created and first.seeded == 2
+    first.add('9')
+    first.close()
+
+    second = SeenJobs(path, capacity=1000, error_rate=0.01, seed=lambda s: 1 / 0)
+    assert not second.created
+    assert all(job_id in second for job_id in ('7', '8', '9'))
+    second.close()
+    assert not list(tmp_path.glob('*.tmp'))
+
+
+def test_failed_seed_publishes_nothing(tmp_path):
+    path = tmp_path / 'seen.bloom'
+    with pytest.raises(ZeroDivisionError):
+        SeenJobs(path, capacity=1000, error_rate=0.01, seed=lambda s: 1 / 0)
+    assert not path.exists()
+    assert not list(tmp_path.glob('*.tmp'))
+
+
+def _add_range(path, start):
+    seen = SeenJobs(path, capacity=10000, error_rate=0.01)
+    for job_id in range(start, start + 200):
+        seen.add(str(job_id))
+    seen.close()
+
+
+def test_concurrent_processes_lose_no_ids(tmp_path):
+    path = tmp_path / 'seen.bloom'
+    SeenJobs(path, capacity=10000, error_rate=0.01).close()
+    context = multiprocessing.get_context('spawn')
+    workers = [context.Process(target=_add_range, args=(path, start)) for start in (0, 1000, 2000)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join(30)
+    seen = SeenJobs(path, capacity=10000, error_rate=0.01)
+    assert seen.count == 600
+    assert all(str(job_id) in seen for start in (0, 1000, 2000) for job_id in range(start, start + 200))
+    seen.close()
+
+
+def test_known_jobs_confirms_filter_hits(seen):
+    seen.update(['1', '2'])
+    known = KnownJobs(seen, confirm=lambda job_id: job_id == '1')
+    known.add('3')
+    assert '1' in known
+    assert '2' not in known  # filter hit the database does not confirm
+    assert '3' in known
+    assert '4' not in known
+    assert known.counts['false_positives'] == 1
+
+
+def test_legacy_urls_are_canonicalized_once_for_exact_lookups(db):
+    db.add_all([
+        Job(title='a', company='b', url=canonical_job_url('100')),
+        Job(title='a', company='b', url="https://www.linkedin.com/jobs/view/dev-at-acme-2000/?trackingId=x"),
+        Job(title='a', company='b', url="https://www.linkedin.com/jobs/view/100/?refId=y"),
+        Job(title='a', company='b', url="https://example.com/careers/1"),
+    ])
+    db.commit()
+    assert not job_stored('2000', db)
+
+    assert canonicalize_job_urls(db) == 1
+    assert canonicalize_job_urls(db) == 0
+    assert job_stored('100', db)
+    assert job_stored('2000', db)
+    assert not job_stored('200', db)
+    assert not job_stored('10', db)
@@ -0,0 +1,106 @@
+import multiprocessing
+
+import pytest
+
+from src.session_manager import SessionManager
+
+COOKIES = [{'name': 'li_at', 'value': 'secret-token', 'domain': '.linkedin.com'}]
+
+
+class SessionBrowser:
+    """Holds cookies the way Browser does, without Chrome."""
+
+    def __init__(self, cookies=()):
+        self.cookies = list(cookies)
+        self.session_user = None
+        self.session_validated_at = 0.0
+
+    def session_cookies(self):
+        return list(self.cookies)
+
+    def restore_cookies(self, cookies):
+        self.cookies = list(cookies)
+        return bool(cookies)
+
+    def clear_session(self):
+        self.cookies = []
+        self.session_user = None
+        self.session_validated_at = 0.0
+
+
+@pytest.fixture
+def manager(tmp_path):
+    return SessionManager(store_dir=tmp_path, key=None, ttl=60)
+
+
+def test_saved_session_is_encrypted_and_restored(manager, tmp_path):
+    manager.save(SessionBrowser(COOKIES), 'ada@example.com')
+    stored, = tmp_path.glob('*.session')
+    assert b'secret-token' not in stored.read_bytes()
+    assert 'ada' not in stored.name
+
+    browser = SessionBrowser()
+    session = manager.restore(browser, 'ada@example.com')
+    assert manager.is_fresh(session)
+    assert browser.cookies == COOKIES
+    assert browser.session_user == 'ada@example.com'
+
+
+def test_generated_key_is_reused_by_the_next_manager(manager, tmp_path):
+    manager.save(SessionBrowser(COOKIES), 'ada@example.com')
+    assert SessionManager(store_dir=tmp_path, key=None).load('ada@example.com')['cookies'] == COOKIES
+
+
+def _save_as(store_dir, user_key):
+    SessionManager(store_dir=store_dir, key=None).save(SessionBrowser(COOKIES), user_key)
+
+
+def test_processes_racing_for_the_generated_key_share_one(tmp_path):
+    context = multiprocessing.get_context('spawn')
+    users = [f"user{i}@example.com" for i in range(4)]
+    workers = [context.Process(target=_save_as, args=(tmp_path, user)) for user in users]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join(30)
+    assert all(worker.exitcode == 0 for worker in workers)
+
+    manager = SessionManager(store_dir=tmp_path, key=None)
+    assert all(manager.load(user)['cookies'] == COOKIES for user in users)
+    assert not list(tmp_path.glob('*.tmp'))
+
+
+def test_another_users_cookies_are_cleared_before_restoring(manager):
+    browser = SessionBrowser(COOKIES)
+    manager.save(browser, 'ada@example.com')
+    assert manager.browser_is_current(browser, 'ada@example.com')
+
+    assert manager.restore(browser, 'grace@example.com') is None
+    assert browser.cookies == []
+    assert browser.session_user is None
+
+
+def test_unreadable_session_is_discarded(manager, tmp_path):
+    manager.save(SessionBrowser(COOKIES), 'ada@example.com')
+    stored, = tmp_path.glob('*.session')
+    stored.write_bytes(b'not a token')
+    assert manager.load('ada@example.com') is None
+    assert not stored.exists()
+
+
+def test_invalidate_forgets_the_session(manager):
+    browser = SessionBrowser(COOKIES)
+    manager.save(browser, 'ada@example.com')
+    manager.invalidate(browser, 'ada@example.com')
+    assert manager.load('ada@example.com') is None
+    assert not manager.browser_is_current(browser, 'ada@example.com')
+
+
+@pytest.mark.parametrize('url, logged_out', [
+    ("https://www.linkedin.com/login?session_redirect=x", True),
+    ("https://www.linkedin.com/authwall?trk=x", True),
+    ("https://www.linkedin.com/jobs/view/1/", False),
+    (None, False),
+])
+def test_looks_logged_out(url, logged_out):
+    assert SessionManager.looks_logged_out(url) == logged_out
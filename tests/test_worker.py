@@ -0,0 +1,67 @@
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from src import worker
+from src.models import Base, BotRun
+from src.worker import WorkerFleet
+
+
+@pytest.fixture
+def sessions(tmp_path, monkeypatch):
+    """Point the worker at an empty bot_runs database."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'runs.db'}")
+    Base.metadata.create_all(engine)
+    factory = sessionmaker(bind=engine)
+    monkeypatch.setattr(worker, 'SessionLocal', factory)
+    yield factory
+    engine.dispose()
+
+
+def add_run(sessions, started_ago, last_seen_ago=None):
+    now = datetime.utcnow()
+    db = sessions()
+    run = BotRun(
+        user_id=1, status='running', started_at=now - timedelta(seconds=started_ago),
+        last_seen_at=None if last_seen_ago is None else now - timedelta(seconds=last_seen_ago)
+    )
+    db.add(run)
+    db.commit()
+    run_id = run.id
+    db.close()
+    return run_id
+
+
+def status(sessions, run_id):
+    db = sessions()
+    try:
+        return db.get(BotRun, run_id).status
+    finally:
+        db.close()
+
+
+def test_only_runs_without_a_recent_heartbeat_are_failed(sessions, monkeypatch):
+    monkeypatch.setattr(worker.Config, 'WORKER_STALE_RUN_TIMEOUT', 300)
+    long_but_alive = add_run(sessions, started_ago=6 * 3600, last_seen_ago=10)
+    silent = add_run(sessions, started_ago=3600, last_seen_ago=600)
+    never_beat = add_run(sessions, started_ago=600)
+    just_started = add_run(sessions, started_ago=10)
+
+    assert WorkerFleet(concurrency=1).fail_stale_runs() == 2
+    assert status(sessions, long_but_alive) == 'running'
+    assert status(sessions, silent) == 'failed'
+    assert status(sessions, never_beat) == 'failed'
+    assert status(sessions, just_started) == 'running'
+
+
+def test_heartbeat_keeps_in_flight_runs_alive(sessions, monkeypatch):
+    monkeypatch.setattr(worker.Config, 'WORKER_STALE_RUN_TIMEOUT', 300)
+    run_id = add_run(sessions, started_ago=3600, last_seen_ago=600)
+    fleet = WorkerFleet(concurrency=1)
+    fleet._inflight[run_id] = None
+    fleet.heartbeat()
+
+    assert WorkerFleet(concurrency=1).fail_stale_runs() == 0
+    assert status(sessions, run_id) == 'running'